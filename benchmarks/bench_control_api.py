@@ -0,0 +1,110 @@
+"""Benchmark: control API throughput, single ops vs batches vs re-reading JSON per request.
+
+Starts a ControlServer on a scratch dataset (already holding QUEUE_SIZE queued
+tasks) and adds tasks over one keep-alive connection: one POST /ops/add_task
+per task, then POST /batch with BATCH_SIZE ops per request. The baseline is
+what a stateless endpoint would do per request: load tasks.json, append, save
+(no HTTP, so it flatters the baseline). Timer ops aren't exercised, so no
+timer service is started.
+
+Usage:
+    python benchmarks/bench_control_api.py
+"""
+import http.client
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.control_api import ControlServer  # noqa: E402
+from src.data_manager import DataManager  # noqa: E402
+from src.models.task import Task  # noqa: E402
+
+OPS = 1_000
+BATCH_SIZE = 50
+QUEUE_SIZE = 500
+READS = 200
+
+
+def _seed(data_dir: Path):
+    dm = DataManager(data_dir=str(data_dir))
+    data = dm.load_tasks()
+    data["queue"].extend(Task(text=f"queued {i}") for i in range(QUEUE_SIZE))
+    dm.save_tasks(data["planning"], data["blocks"], data["queue"])
+
+
+def bench_reread(data_dir: Path) -> float:
+    """ops/s for load → append → save per request."""
+    dm = DataManager(data_dir=str(data_dir))
+    start = time.perf_counter()
+    for i in range(OPS):
+        data = dm.load_tasks()
+        data["queue"].append(Task(text=f"reread {i}"))
+        dm.save_tasks(data["planning"], data["blocks"], data["queue"], data["current_day_date"])
+    return OPS / (time.perf_counter() - start)
+
+
+def _post(conn: http.client.HTTPConnection, path: str, body) -> dict:
+    conn.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    reply = json.loads(conn.getresponse().read())
+    assert reply["ok"], reply
+    return reply
+
+
+def bench_single(conn) -> float:
+    start = time.perf_counter()
+    for i in range(OPS):
+        _post(conn, "/ops/add_task", {"location": "queue", "text": f"single {i}"})
+    return OPS / (time.perf_counter() - start)
+
+
+def bench_batched(conn) -> float:
+    start = time.perf_counter()
+    for first in range(0, OPS, BATCH_SIZE):
+        ops = [{"op": "add_task", "location": "queue", "text": f"batched {i}"}
+               for i in range(first, first + BATCH_SIZE)]
+        _post(conn, "/batch", {"ops": ops})
+    return OPS / (time.perf_counter() - start)
+
+
+def bench_reads(conn) -> float:
+    start = time.perf_counter()
+    for _ in range(READS):
+        conn.request("GET", "/tasks")
+        conn.getresponse().read()
+    return READS / (time.perf_counter() - start)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        reread_dir = Path(tmp) / "reread"
+        api_dir = Path(tmp) / "api"
+        _seed(reread_dir)
+        _seed(api_dir)
+
+        reread = bench_reread(reread_dir)
+
+        server = ControlServer(str(api_dir), host="127.0.0.1", port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        conn = http.client.HTTPConnection("127.0.0.1", server.port)
+        try:
+            single = bench_single(conn)
+            batched = bench_batched(conn)
+            reads = bench_reads(conn)
+        finally:
+            conn.close()
+            server.httpd.shutdown()
+
+    print(f"{OPS} add_task ops on a dataset with {QUEUE_SIZE}+ queued tasks")
+    print(f"  re-read JSON per op   : {reread:>9.0f} ops/s")
+    print(f"  API, one op/request   : {single:>9.0f} ops/s")
+    print(f"  API, {BATCH_SIZE} ops/batch     : {batched:>9.0f} ops/s")
+    print(f"  API, GET /tasks       : {reads:>9.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
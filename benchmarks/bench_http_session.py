@@ -0,0 +1,66 @@
+"""Benchmark: per-request latency with and without the pooled keep-alive session.
+
+Runs a local HTTP/1.1 stub server and times sequential GETs using a fresh
+connection per request (the old module-level requests.get) versus the shared
+session from src/integrations/http_session.py. Against a real HTTPS endpoint the
+gap is larger, since every fresh connection also pays a TLS handshake.
+
+Usage:
+    python benchmarks/bench_http_session.py
+"""
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+from src.integrations.http_session import get_session, timeout  # noqa: E402
+
+REQUESTS = 300
+BODY = b'{"success": true}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # avoid delayed-ACK stalls on reused sockets
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _time_requests(get, url: str) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        get(url, timeout=timeout(5)).content
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/download/tasks.json"
+
+    try:
+        fresh = _time_requests(requests.get, url)
+        pooled = _time_requests(get_session().get, url)
+    finally:
+        server.shutdown()
+
+    print(f"{REQUESTS} sequential GETs against a local stub")
+    print(f"  fresh connection : {fresh * 1000:.3f} ms/request")
+    print(f"  pooled session   : {pooled * 1000:.3f} ms/request")
+    print(f"  speedup          : {fresh / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark: Start New Day logging cost as history grows.
+
+Compares the old per-task JSON-array rewrite against DataManager.log_day_rollover
+(one JSONL append per file). Rollover time should stay flat for the batched path
+while the legacy path grows with the size of the history.
+
+Usage:
+    python benchmarks/bench_rollover.py
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data_manager import DataManager  # noqa: E402
+from src.models.task import Task  # noqa: E402
+
+HISTORY_SIZES = [0, 1_000, 10_000, 50_000]
+TASKS_PER_DAY = 40
+REPEATS = 3
+
+
+def _make_day():
+    """Half completed, half incomplete — roughly a real day's mix."""
+    completed, incomplete = [], []
+    for i in range(TASKS_PER_DAY):
+        task = Task(text=f"task {i}")
+        if i % 2:
+            task.complete()
+            completed.append((task, f"Block {i % 8 + 1}"))
+        else:
+            incomplete.append((task, f"Block {i % 8 + 1}"))
+    return completed, incomplete
+
+
+def _history_record(i):
+    return {"task": f"old task {i}", "block": "Block 1",
+            "completed_at": "2026-01-01T09:00:00", "times_queued": 0}
+
+
+def _legacy_log(path: Path, record: dict):
+    """The pre-JSONL pattern: read the whole array, append one, rewrite."""
+    log = json.loads(path.read_text()) if path.exists() else []
+    log.append(record)
+    path.write_text(json.dumps(log, indent=2))
+
+
+def bench_legacy(data_dir: Path, history: int) -> float:
+    log_file = data_dir / "completed_log.json"
+    hist_file = data_dir / "incomplete_history.json"
+    log_file.write_text(json.dumps([_history_record(i) for i in range(history)], indent=2))
+    hist_file.write_text(json.dumps([_history_record(i) for i in range(history)], indent=2))
+
+    completed, incomplete = _make_day()
+    start = time.perf_counter()
+    for task, block in completed:
+        _legacy_log(log_file, DataManager._completed_record(task, block))
+    for task, block in incomplete:
+        task.times_queued += 1  # as log_incomplete_task does
+        _legacy_log(hist_file, DataManager._incomplete_record(task, block))
+    return time.perf_counter() - start
+
+
+def bench_batched(data_dir: Path, history: int) -> float:
+    dm = DataManager(data_dir=str(data_dir))
+    dm.completed_log.extend(_history_record(i) for i in range(history))
+    dm.incomplete_history.extend(_history_record(i) for i in range(history))
+
+    completed, incomplete = _make_day()
+    start = time.perf_counter()
+    dm.log_day_rollover(completed, incomplete, (len(completed), TASKS_PER_DAY))
+    return time.perf_counter() - start
+
+
+def _best_of(fn, history: int) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        with tempfile.TemporaryDirectory() as tmp:
+            best = min(best, fn(Path(tmp), history))
+    return best
+
+
+def main():
+    print(f"Rollover of {TASKS_PER_DAY} tasks, best of {REPEATS} (ms)")
+    print(f"{'history':>10} {'legacy':>12} {'batched':>12}")
+    for history in HISTORY_SIZES:
+        legacy = _best_of(bench_legacy, history) * 1000
+        batched = _best_of(bench_batched, history) * 1000
+        print(f"{history:>10} {legacy:>12.2f} {batched:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
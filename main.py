@@ -4,13 +4,19 @@ Daily Scheduler - Task management with time blocks
 
 Usage:
     python main.py
+    python main.py --headless <command> [options]   (no window; see --headless --help)
 """
 
 import sys
-from src.ui.main_window import MainWindow
 
 def main():
     """Main entry point for the Daily Scheduler application"""
+    if sys.argv[1:2] == ["--headless"]:
+        # Imported here so headless runs never load tkinter
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[2:]))
+
+    from src.ui.main_window import MainWindow
     try:
         app = MainWindow()
         app.mainloop()
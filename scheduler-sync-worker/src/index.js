@@ -3,6 +3,52 @@
  * Handles upload/download of JSON files to/from R2 bucket
  */
 
+/**
+ * SHA-256 hex digest of a string's UTF-8 bytes (matches the Python client's content_hash)
+ */
+async function sha256Hex(text) {
+	const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+	return [...new Uint8Array(digest)].map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// Files the Worker will store (anything else is rejected)
+const ALLOWED_FILES = [
+	'config.json',
+	'tasks.json',
+	'timer_state.json',
+	'completed_log.jsonl',
+	'incomplete_history.jsonl',
+	'daily_stats.jsonl',
+	'bills.json',
+	'recurring.json'
+];
+
+// Append-only logs that support incremental (tail) sync via /log
+const LOG_FILES = [
+	'completed_log.jsonl',
+	'incomplete_history.jsonl',
+	'daily_stats.jsonl'
+];
+
+// Advertised in /manifest so clients can tell what this deployment supports
+const FEATURES = ['bundle', 'gzip', 'log'];
+
+/**
+ * Gzip a string into an ArrayBuffer
+ */
+async function gzipText(text) {
+	const stream = new Blob([text]).stream().pipeThrough(new CompressionStream('gzip'));
+	return await new Response(stream).arrayBuffer();
+}
+
+/**
+ * Gunzip a request/response body into a string
+ */
+async function gunzipText(body) {
+	const stream = body.pipeThrough(new DecompressionStream('gzip'));
+	return await new Response(stream).text();
+}
+
 export default {
 	async fetch(request, env, ctx) {
 		const url = new URL(request.url);
@@ -12,7 +58,7 @@ export default {
 		const corsHeaders = {
 			'Access-Control-Allow-Origin': '*',
 			'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-			'Access-Control-Allow-Headers': 'Content-Type',
+			'Access-Control-Allow-Headers': 'Content-Type, Content-Encoding',
 		};
 
 		// Handle CORS preflight
@@ -38,9 +84,30 @@ export default {
 				);
 			}
 
+			// Route: GET /manifest - Hash and size of every stored file
+			if (path === '/manifest' && request.method === 'GET') {
+				const list = await env.SCHEDULER_DATA.list({ include: ['customMetadata'] });
+				const files = {};
+				for (const obj of list.objects) {
+					files[obj.key] = {
+						// Files uploaded before manifests existed have no stored hash
+						hash: (obj.customMetadata && obj.customMetadata.sha256) || null,
+						size: obj.size
+					};
+				}
+				return new Response(
+					JSON.stringify({ files, features: FEATURES }),
+					{
+						headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+					}
+				);
+			}
+
 			// Route: POST /upload - Upload a JSON file to R2
 			if (path === '/upload' && request.method === 'POST') {
-				const body = await request.json();
+				// Newer clients gzip the JSON envelope; older ones send it plain
+				const gzipped = (request.headers.get('Content-Encoding') || '').includes('gzip');
+				const body = gzipped ? JSON.parse(await gunzipText(request.body)) : await request.json();
 				const { filename, content } = body;
 
 				if (!filename || !content) {
@@ -54,18 +121,7 @@ export default {
 				}
 
 				// Validate filename (only allow specific JSON files)
-				const allowedFiles = [
-					'config.json',
-					'tasks.json',
-					'timer_state.json',
-					'completed_log.json',
-					'incomplete_history.json',
-					'daily_stats.json',
-					'bills.json',
-					'recurring.json'
-				];
-
-				if (!allowedFiles.includes(filename)) {
+				if (!ALLOWED_FILES.includes(filename)) {
 					return new Response(
 						JSON.stringify({ error: 'Invalid filename. Only scheduler JSON files allowed.' }),
 						{
@@ -75,10 +131,14 @@ export default {
 					);
 				}
 
-				// Upload to R2
+				// Upload to R2, tagging the content hash for /manifest
+				const hash = await sha256Hex(content);
 				await env.SCHEDULER_DATA.put(filename, content, {
 					httpMetadata: {
 						contentType: 'application/json'
+					},
+					customMetadata: {
+						sha256: hash
 					}
 				});
 
@@ -86,7 +146,8 @@ export default {
 					JSON.stringify({
 						success: true,
 						filename: filename,
-						size: content.length
+						size: content.length,
+						hash: hash
 					}),
 					{
 						headers: { ...corsHeaders, 'Content-Type': 'application/json' }
@@ -94,6 +155,159 @@ export default {
 				);
 			}
 
+			// Route: GET /bundle/download - Every stored file in one gzipped JSON payload
+			if (path === '/bundle/download' && request.method === 'GET') {
+				const objects = await Promise.all(
+					ALLOWED_FILES.map(name => env.SCHEDULER_DATA.get(name))
+				);
+				const files = {};
+				for (let i = 0; i < ALLOWED_FILES.length; i++) {
+					const object = objects[i];
+					if (object === null) continue;
+					files[ALLOWED_FILES[i]] = {
+						content: await object.text(),
+						hash: (object.customMetadata && object.customMetadata.sha256) || null
+					};
+				}
+				return new Response(await gzipText(JSON.stringify({ files })), {
+					headers: { ...corsHeaders, 'Content-Type': 'application/gzip' }
+				});
+			}
+
+			// Route: POST /bundle/upload - Store several files from one gzipped JSON payload
+			// (body: gzip of {files: {filename: content}})
+			if (path === '/bundle/upload' && request.method === 'POST') {
+				const { files } = JSON.parse(await gunzipText(request.body));
+				const names = Object.keys(files || {});
+
+				const invalid = names.filter(name => !ALLOWED_FILES.includes(name));
+				if (names.length === 0 || invalid.length > 0) {
+					return new Response(
+						JSON.stringify({ error: 'Empty bundle or invalid filename', invalid }),
+						{
+							status: 400,
+							headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+						}
+					);
+				}
+
+				const hashes = {};
+				await Promise.all(names.map(async name => {
+					hashes[name] = await sha256Hex(files[name]);
+					await env.SCHEDULER_DATA.put(name, files[name], {
+						httpMetadata: { contentType: 'application/json' },
+						customMetadata: { sha256: hashes[name] }
+					});
+				}));
+
+				return new Response(
+					JSON.stringify({ success: true, files: hashes }),
+					{
+						headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+					}
+				);
+			}
+
+			// Route: GET /log/:filename?offset=N - Bytes of a log from offset N to the end
+			// (X-Log-Size carries the full size so the client can detect a replaced log)
+			if (path.startsWith('/log/') && request.method === 'GET') {
+				const filename = path.substring('/log/'.length);
+				if (!LOG_FILES.includes(filename)) {
+					return new Response(
+						JSON.stringify({ error: 'Not an append-only log' }),
+						{
+							status: 400,
+							headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+						}
+					);
+				}
+
+				const offset = Math.max(0, parseInt(url.searchParams.get('offset') || '0', 10) || 0);
+				const head = await env.SCHEDULER_DATA.head(filename);
+				const size = head === null ? 0 : head.size;
+				// Past the end means the log was replaced; send everything instead
+				const start = offset <= size ? offset : 0;
+				const object = start < size
+					? await env.SCHEDULER_DATA.get(filename, { range: { offset: start } })
+					: null;
+				const tail = object === null ? '' : await object.text();
+
+				const headers = {
+					...corsHeaders,
+					'Content-Type': 'application/x-ndjson',
+					'X-Log-Size': String(size),
+					'X-Log-Offset': String(start)
+				};
+				if ((request.headers.get('Accept-Encoding') || '').includes('gzip')) {
+					return new Response(await gzipText(tail), {
+						encodeBody: 'manual',
+						headers: { ...headers, 'Content-Encoding': 'gzip' }
+					});
+				}
+				return new Response(tail, { headers });
+			}
+
+			// Route: POST /log/:filename - Append lines to a log
+			// (body: {expected_size, lines}; 409 if the log grew since the client read it)
+			if (path.startsWith('/log/') && request.method === 'POST') {
+				const filename = path.substring('/log/'.length);
+				if (!LOG_FILES.includes(filename)) {
+					return new Response(
+						JSON.stringify({ error: 'Not an append-only log' }),
+						{
+							status: 400,
+							headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+						}
+					);
+				}
+
+				const gzipped = (request.headers.get('Content-Encoding') || '').includes('gzip');
+				const { expected_size, lines } = gzipped
+					? JSON.parse(await gunzipText(request.body))
+					: await request.json();
+
+				const existing = await env.SCHEDULER_DATA.get(filename);
+				const size = existing === null ? 0 : existing.size;
+				if (expected_size !== undefined && expected_size !== size) {
+					return new Response(
+						JSON.stringify({ error: 'Log changed', size }),
+						{
+							status: 409,
+							headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+						}
+					);
+				}
+
+				// R2 objects are immutable, so appending rewrites the object — but only
+				// here, next to the bucket; the client sends just the new lines
+				let text = existing === null ? '' : await existing.text();
+				if (text && !text.endsWith('\n')) text += '\n';
+				text += lines || '';
+				const hash = await sha256Hex(text);
+				const stored = await env.SCHEDULER_DATA.put(filename, text, {
+					// Lose the race rather than drop another client's append
+					onlyIf: existing === null ? undefined : { etagMatches: existing.etag },
+					httpMetadata: { contentType: 'application/x-ndjson' },
+					customMetadata: { sha256: hash }
+				});
+				if (stored === null) {
+					return new Response(
+						JSON.stringify({ error: 'Log changed' }),
+						{
+							status: 409,
+							headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+						}
+					);
+				}
+
+				return new Response(
+					JSON.stringify({ success: true, size: stored.size, hash }),
+					{
+						headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+					}
+				);
+			}
+
 			// Route: GET /download/:filename - Download a JSON file from R2
 			if (path.startsWith('/download/') && request.method === 'GET') {
 				const filename = path.substring('/download/'.length);
@@ -110,6 +324,18 @@ export default {
 					);
 				}
 
+				// Compress for clients that accept it; older clients get the plain file
+				if ((request.headers.get('Accept-Encoding') || '').includes('gzip')) {
+					return new Response(await gzipText(await object.text()), {
+						encodeBody: 'manual',
+						headers: {
+							...corsHeaders,
+							'Content-Type': 'application/json',
+							'Content-Encoding': 'gzip'
+						}
+					});
+				}
+
 				return new Response(object.body, {
 					headers: {
 						...corsHeaders,
@@ -126,19 +352,16 @@ export default {
 						version: '1.0.0',
 						endpoints: {
 							'GET /list': 'List all files in bucket',
-							'POST /upload': 'Upload JSON file (body: {filename, content})',
-							'GET /download/:filename': 'Download JSON file from R2'
+							'GET /manifest': 'Hash and size of every stored file',
+							'POST /upload': 'Upload JSON file (body: {filename, content}, optionally Content-Encoding: gzip)',
+							'GET /download/:filename': 'Download JSON file from R2 (gzip if Accept-Encoding allows)',
+							'GET /bundle/download': 'All files as gzip of {files: {filename: {content, hash}}}',
+							'POST /bundle/upload': 'Upload several files (body: gzip of {files: {filename: content}})',
+							'GET /log/:filename?offset=N': 'Tail of an append-only log from byte N (X-Log-Size header)',
+							'POST /log/:filename': 'Append lines to a log (body: {expected_size, lines})'
 						},
-						allowed_files: [
-							'config.json',
-							'tasks.json',
-							'timer_state.json',
-							'completed_log.json',
-							'incomplete_history.json',
-							'daily_stats.json',
-							'bills.json',
-							'recurring.json'
-						]
+						features: FEATURES,
+						allowed_files: ALLOWED_FILES
 					}),
 					{
 						headers: { ...corsHeaders, 'Content-Type': 'application/json' }
@@ -0,0 +1,113 @@
+"""Append-only JSONL storage for the history logs (completed, incomplete, stats)."""
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+
+class AppendLog:
+    """One JSON record per line, appended with a single write per batch.
+
+    Appending never re-reads or re-serializes existing history, so logging cost
+    stays constant as the file grows. A legacy JSON-array file (the format used
+    before JSONL) is migrated transparently the first time the log is touched.
+    """
+
+    def __init__(self, path: Path, legacy_path: Optional[Path] = None):
+        """
+        Initialize an append-only log.
+
+        Args:
+            path: Location of the .jsonl file
+            legacy_path: Old JSON-array file to migrate from, if any
+        """
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self._tail_checked = False
+
+    # ── Writing ─────────────────────────────────────────────────────────
+
+    def append(self, record: Dict):
+        """Append a single record (one write call)."""
+        self.extend([record])
+
+    def extend(self, records: Iterable[Dict]):
+        """Append several records with one write call."""
+        payload = "".join(
+            json.dumps(r, ensure_ascii=False) + "\n" for r in records
+        )
+        if not payload:
+            return
+        self._migrate_if_needed()
+        prefix = "" if self._tail_checked else self._repair_prefix()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(prefix + payload)
+        self._tail_checked = True
+
+    def _repair_prefix(self) -> str:
+        """Return a newline if the file ends mid-line (torn write after a crash).
+
+        Without it the next record would be glued onto the broken line and
+        both would be lost on read.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                return "" if f.read(1) == b"\n" else "\n"
+        except (FileNotFoundError, OSError):
+            # Missing or empty file — nothing to repair
+            return ""
+
+    # ── Reading ─────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_records()
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream records one at a time without loading the whole file."""
+        self._migrate_if_needed()
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"[Log] Skipping unreadable line {line_no} in {self.path.name}")
+
+    def read_all(self) -> list:
+        """Return every record as a list (prefer iter_records for large logs)."""
+        return list(self.iter_records())
+
+    # ── Migration ───────────────────────────────────────────────────────
+
+    def migrate(self):
+        """Run the legacy migration now instead of on first access."""
+        self._migrate_if_needed()
+
+    def _migrate_if_needed(self):
+        """Convert the legacy JSON array into JSONL, once.
+
+        The new file is written under a temporary name and moved into place so
+        a crash mid-migration never leaves a half-written log. The legacy file
+        is kept alongside as <name>.migrated rather than deleted.
+        """
+        if self.legacy_path is None or self.path.exists() or not self.legacy_path.exists():
+            return
+        try:
+            records = json.loads(self.legacy_path.read_text(encoding="utf-8"))
+            if not isinstance(records, list):
+                raise ValueError("expected a JSON array")
+        except Exception as e:
+            print(f"[Log] Could not migrate {self.legacy_path.name}: {e}")
+            return
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+        os.replace(tmp_path, self.path)
+        self.legacy_path.replace(self.legacy_path.with_name(self.legacy_path.name + ".migrated"))
+        print(f"[Log] Migrated {len(records)} records from {self.legacy_path.name} to {self.path.name}")
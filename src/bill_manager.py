@@ -1,28 +1,80 @@
 """Bill manager for tracking monthly bills, due dates, and payment status."""
 import re
 import calendar
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, timedelta
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from src.models.bill import Bill
 
 
+@dataclass
+class BillStatus:
+    """One bill's classification for a given day."""
+    due_date: date               # Effective due date this month
+    overdue: bool
+    due_soon: bool               # Within lookahead or overdue (never once paid)
+    sort_key: Tuple[int, int]    # Overdue, then upcoming, then paid; by due_day
+    status_text: str             # "PAID", "OVERDUE (5th)" or "due 12th"
+
+
+@dataclass
+class BillSnapshot:
+    """Every bill classified for one day — everything the bill panel shows."""
+    today: date
+    statuses: Dict[str, BillStatus]   # bill id -> status
+    visible: List[Bill]               # Sorted as get_visible_bills()
+    overdue_count: int
+    upcoming_count: int
+    paid_count: int
+    cluster_bills: List[Bill]         # As get_week1_cluster()
+    cluster_total: float
+    cluster_variable: bool
+
+
 class BillManager:
-    """Manages bill tracking, due date calculations, and month resets."""
+    """Manages bill tracking, due date calculations, and month resets.
+
+    Classifications are memoized per day: classify() and snapshot() reuse
+    their results until the date changes, the manager's version is bumped
+    (mark_paid/unpaid, add/remove, replacing or reloading the bill list,
+    month reset) or a bill's own due-date inputs change.
+    """
 
     def __init__(self, data_manager):
         self.data_manager = data_manager
-        self.bills: List[Bill] = []
+        self._bills: List[Bill] = []
+        self._version = 0
+        self._cache_key: Optional[Tuple[date, int]] = None
+        self._status_cache: Dict[str, Tuple[tuple, BillStatus]] = {}
+        self._snapshot_cache: Optional[Tuple[tuple, BillSnapshot]] = None
         self.last_reset_month: str = ""
         self.load()
 
+    @property
+    def bills(self) -> List[Bill]:
+        return self._bills
+
+    @bills.setter
+    def bills(self, bills: List[Bill]):
+        """Replacing the list (load, bill dialog, sync reload) drops cached classifications."""
+        self._bills = bills
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget every cached classification (call after editing bills in place)."""
+        self._version += 1
+        self._status_cache.clear()
+        self._snapshot_cache = None
+
     def load(self):
         """Load bills from disk and run month reset if needed."""
         self.bills, self.last_reset_month = self.data_manager.load_bills()
         self.reset_month_if_needed()
 
-    def save(self):
-        """Persist bills to disk."""
-        self.data_manager.save_bills(self.bills, self.last_reset_month)
+    def save(self) -> bool:
+        """Persist bills to disk. Skipped (returns False) if nothing changed."""
+        return self.data_manager.save_bills(self.bills, self.last_reset_month)
 
     # ── Month reset ─────────────────────────────────────────────────────
 
@@ -42,6 +94,7 @@ class BillManager:
 
         for bill in self.bills:
             bill.paid_this_month = False
+        self.invalidate()
 
         self.last_reset_month = current_month
         self.save()
@@ -54,55 +107,72 @@ class BillManager:
 
         Bills due on the 30th in February become due on the 28th (or 29th).
         """
-        _, last_day = calendar.monthrange(year, month)
-        return min(due_day, last_day)
+        return min(due_day, _month_length(year, month))
 
-    def is_overdue(self, bill: Bill, today: Optional[date] = None) -> bool:
-        """Check if a bill is past its due date and unpaid this month."""
+    @staticmethod
+    def _fingerprint(bill: Bill) -> tuple:
+        """The bill fields a classification depends on — a per-bill version."""
+        return (bill.due_day, bill.lookahead_days, bill.paid_this_month)
+
+    def _cached_day(self, today: date):
+        """Start a fresh cache when the date or the manager's version moved on."""
+        key = (today, self._version)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._status_cache.clear()
+            self._snapshot_cache = None
+
+    def classify(self, bill: Bill, today: Optional[date] = None) -> BillStatus:
+        """Bill's due date, overdue/due-soon state and sort position (memoized per day)."""
         if today is None:
             today = date.today()
-        if bill.paid_this_month:
-            return False
-        effective_day = self.get_effective_due_day(bill.due_day, today.year, today.month)
-        return today.day > effective_day
+        self._cached_day(today)
 
-    def is_due_soon(self, bill: Bill, today: Optional[date] = None) -> bool:
-        """Check if a bill is within its lookahead window or overdue.
+        fingerprint = self._fingerprint(bill)
+        cached = self._status_cache.get(bill.id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        status = self._classify(bill, today)
+        self._status_cache[bill.id] = (fingerprint, status)
+        return status
+
+    def _classify(self, bill: Bill, today: date) -> BillStatus:
+        """Work out a bill's due date, overdue/due-soon state and sort position.
 
         Handles lookahead crossing month boundaries (e.g., Dec 27 shows
         a bill due Jan 3 with 7-day lookahead).
         """
-        if today is None:
-            today = date.today()
-
-        # Already paid this month — not "due soon"
-        if bill.paid_this_month:
-            return False
-
-        lookahead = timedelta(days=bill.lookahead_days)
-
-        # Check this month's due date
         eff_day = self.get_effective_due_day(bill.due_day, today.year, today.month)
         due_this_month = date(today.year, today.month, eff_day)
 
+        if bill.paid_this_month:
+            return BillStatus(due_this_month, False, False, (2, bill.due_day), "PAID")
+
         # Overdue (past due, unpaid)
         if today > due_this_month:
-            return True
+            return BillStatus(due_this_month, True, True, (0, bill.due_day),
+                              f"OVERDUE ({self._ordinal(eff_day)})")
 
-        # Within lookahead for this month
-        if due_this_month - today <= lookahead:
-            return True
+        lookahead = timedelta(days=bill.lookahead_days)
 
-        # Check next month's due date (cross-boundary lookahead)
-        next_month = today.month + 1 if today.month < 12 else 1
-        next_year = today.year if today.month < 12 else today.year + 1
-        eff_day_next = self.get_effective_due_day(bill.due_day, next_year, next_month)
-        due_next_month = date(next_year, next_month, eff_day_next)
+        # Within lookahead for this month, else check next month's due date
+        due_soon = due_this_month - today <= lookahead
+        if not due_soon:
+            next_month = today.month + 1 if today.month < 12 else 1
+            next_year = today.year if today.month < 12 else today.year + 1
+            eff_day_next = self.get_effective_due_day(bill.due_day, next_year, next_month)
+            due_soon = date(next_year, next_month, eff_day_next) - today <= lookahead
 
-        if due_next_month - today <= lookahead:
-            return True
+        return BillStatus(due_this_month, False, due_soon, (1, bill.due_day),
+                          f"due {self._ordinal(eff_day)}")
 
-        return False
+    def is_overdue(self, bill: Bill, today: Optional[date] = None) -> bool:
+        """Check if a bill is past its due date and unpaid this month."""
+        return self.classify(bill, today).overdue
+
+    def is_due_soon(self, bill: Bill, today: Optional[date] = None) -> bool:
+        """Check if a bill is within its lookahead window or overdue."""
+        return self.classify(bill, today).due_soon
 
     def get_visible_bills(self, today: Optional[date] = None) -> List[Bill]:
         """Get all bills that should be displayed (due soon, overdue, or paid).
@@ -110,25 +180,42 @@ class BillManager:
         Returns bills sorted: overdue first, then by due_day ascending,
         paid bills at the bottom.
         """
+        return list(self.snapshot(today).visible)
+
+    def snapshot(self, today: Optional[date] = None) -> BillSnapshot:
+        """Classify every bill once and derive the panel's lists and counts from that.
+
+        The result is reused until the day, the bill list or any bill's
+        displayed fields change; callers must not modify it.
+        """
         if today is None:
             today = date.today()
+        self._cached_day(today)
 
-        visible = []
-        for bill in self.bills:
-            if bill.paid_this_month or self.is_due_soon(bill, today):
-                visible.append(bill)
+        key = tuple((b.id, b.amount, b.amount_variable) + self._fingerprint(b) for b in self.bills)
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == key:
+            return self._snapshot_cache[1]
 
-        # Sort: overdue first, then by due_day, paid at bottom
-        def sort_key(b):
-            if b.paid_this_month:
-                return (2, b.due_day)  # Paid goes last
-            elif self.is_overdue(b, today):
-                return (0, b.due_day)  # Overdue first
-            else:
-                return (1, b.due_day)  # Upcoming in middle
+        statuses = {bill.id: self.classify(bill, today) for bill in self.bills}
+
+        visible = [b for b in self.bills if b.paid_this_month or statuses[b.id].due_soon]
+        visible.sort(key=lambda b: statuses[b.id].sort_key)
+
+        overdue = upcoming = paid = 0
+        for bill in self.bills:
+            status = statuses[bill.id]
+            if bill.paid_this_month:
+                paid += 1
+            elif status.overdue:
+                overdue += 1
+            elif status.due_soon:
+                upcoming += 1
 
-        visible.sort(key=sort_key)
-        return visible
+        cluster_bills, cluster_total, cluster_variable = self.get_week1_cluster(today)
+        snap = BillSnapshot(today, statuses, visible, overdue, upcoming, paid,
+                            cluster_bills, cluster_total, cluster_variable)
+        self._snapshot_cache = (key, snap)
+        return snap
 
     def get_week1_cluster(self, today: Optional[date] = None) -> Tuple[List[Bill], float, bool]:
         """Get week-1 cluster info if active.
@@ -165,20 +252,8 @@ class BillManager:
 
     def get_bill_counts(self, today: Optional[date] = None) -> Tuple[int, int]:
         """Get counts for the header: (overdue_count, upcoming_count)."""
-        if today is None:
-            today = date.today()
-
-        overdue = 0
-        upcoming = 0
-        for bill in self.bills:
-            if bill.paid_this_month:
-                continue
-            if self.is_overdue(bill, today):
-                overdue += 1
-            elif self.is_due_soon(bill, today):
-                upcoming += 1
-
-        return overdue, upcoming
+        snap = self.snapshot(today)
+        return snap.overdue_count, snap.upcoming_count
 
     # ── CRUD ────────────────────────────────────────────────────────────
 
@@ -187,6 +262,7 @@ class BillManager:
         for bill in self.bills:
             if bill.id == bill_id:
                 bill.mark_paid()
+                self.invalidate()
                 self.save()
                 return
 
@@ -195,6 +271,7 @@ class BillManager:
         for bill in self.bills:
             if bill.id == bill_id:
                 bill.mark_unpaid()
+                self.invalidate()
                 self.save()
                 return
 
@@ -203,6 +280,7 @@ class BillManager:
         if not bill.id:
             bill.id = self._generate_id(bill.name)
         self.bills.append(bill)
+        self.invalidate()
         self.save()
 
     def remove_bill(self, bill_id: str):
@@ -234,19 +312,7 @@ class BillManager:
 
     def format_due_status(self, bill: Bill, today: Optional[date] = None) -> str:
         """Format a human-readable due status string for display."""
-        if today is None:
-            today = date.today()
-
-        if bill.paid_this_month:
-            return "PAID"
-
-        eff_day = self.get_effective_due_day(bill.due_day, today.year, today.month)
-
-        if self.is_overdue(bill, today):
-            return f"OVERDUE ({self._ordinal(eff_day)})"
-
-        # Format ordinal suffix
-        return f"due {self._ordinal(eff_day)}"
+        return self.classify(bill, today).status_text
 
     @staticmethod
     def _ordinal(n: int) -> str:
@@ -263,3 +329,9 @@ class BillManager:
         if bill.amount == int(bill.amount):
             return f"{prefix}${int(bill.amount)}"
         return f"{prefix}${bill.amount:.2f}"
+
+
+@lru_cache(maxsize=64)
+def _month_length(year: int, month: int) -> int:
+    """Days in a month (calendar.monthrange, cached)."""
+    return calendar.monthrange(year, month)[1]
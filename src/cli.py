@@ -0,0 +1,203 @@
+"""Headless command line: `python main.py --headless <command>`.
+
+Runs without tkinter (or a display) against the same data folders as the
+window. Close the window first — both keep their own copy of the tasks, and
+the last one to save wins.
+"""
+import argparse
+import sys
+from datetime import date
+from typing import List, Optional
+
+from .data_manager import DataManager
+from .workspace import Workspace
+
+WHERE_HELP = "queue, planning, or a block number 1-8"
+
+
+def _open(args) -> Workspace:
+    data_dir = "data-work" if args.dataset == "work" else "data"
+    data_manager = DataManager(data_dir=data_dir)
+    # Work is always local-only, same as in the window
+    if args.dataset == "work":
+        data_manager.cloudflare_sync.enabled = False
+    return Workspace(data_manager, include_bills=args.dataset != "work")
+
+
+def _location(where: str, block_count: int) -> str:
+    """CLI destination (queue / planning / 1-8) → task index location."""
+    where = where.lower()
+    if where in ("queue", "planning"):
+        return where
+    if where.isdigit() and 1 <= int(where) <= block_count:
+        return f"block:{int(where) - 1}"
+    raise ValueError(f"unknown destination {where!r} ({WHERE_HELP})")
+
+
+def _error(message: str) -> int:
+    print(f"Error: {message}", file=sys.stderr)
+    return 1
+
+
+def _save(ws: Workspace, stores) -> bool:
+    """Save, or report that another program wrote the files first (nothing is overwritten)."""
+    if ws.save(stores):
+        _error("the data changed on disk while this command ran — nothing was saved, try again")
+        return False
+    return True
+
+
+def cmd_new_day(args) -> int:
+    """Start New Day: log and queue today's tasks, apply recurring tasks, reset the timer."""
+    ws = _open(args)
+    if ws.current_day_date == date.today().isoformat() and not args.force:
+        return _error("a new day was already started today (use --force to roll over again)")
+    completed, total = ws.start_new_day()
+    if not _save(ws, ("tasks", "recurring")):
+        return 1
+
+    # A running timer service owns timer_state.json; otherwise drop the file
+    from .timer_client import send_command
+    if send_command(ws.data_manager.data_dir, {"cmd": "reset"}) is None:
+        ws.data_manager.clear_timer_state()
+
+    print(f"Completed: {completed}/{total} tasks")
+    print(f"Moved {total - completed} tasks to queue")
+    print("Timer reset")
+    return 0
+
+
+def cmd_add(args) -> int:
+    """Add a task to the queue, planning or a block."""
+    ws = _open(args)
+    try:
+        location = _location(args.to, len(ws.blocks))
+        task = ws.add_task(location, " ".join(args.text), args.priority)
+    except ValueError as e:
+        return _error(str(e))
+    if not _save(ws, ("tasks",)):
+        return 1
+    print(f"Added '{task.text}' to {args.to} [{task.id}]")
+    return 0
+
+
+def _find_queued(ws: Workspace, query: str) -> List:
+    """Queued tasks matching an id, the exact text, or (failing that) part of the text."""
+    for task in ws.queue:
+        if task.id == query:
+            return [task]
+    needle = query.lower()
+    exact = [t for t in ws.queue if t.text.lower() == needle]
+    return exact or [t for t in ws.queue if needle in t.text.lower()]
+
+
+def cmd_move(args) -> int:
+    """Move a task from the queue to planning or a block."""
+    ws = _open(args)
+    matches = _find_queued(ws, " ".join(args.query))
+    if not matches:
+        return _error("no queued task matches")
+    if len(matches) > 1:
+        print("Several queued tasks match — use the id:", file=sys.stderr)
+        for task in matches:
+            print(f"  [{task.id}] {task.text}", file=sys.stderr)
+        return 1
+    try:
+        location = _location(args.to, len(ws.blocks))
+        if location == "queue":
+            raise ValueError("the task is already in the queue")
+        ws.move_task(matches[0].id, location)
+    except ValueError as e:
+        return _error(str(e))
+    if not _save(ws, ("tasks",)):
+        return 1
+    print(f"Moved '{matches[0].text}' to {args.to}")
+    return 0
+
+
+def cmd_bills(args) -> int:
+    """List the bills the bill panel would show (overdue and due soon, unpaid)."""
+    ws = _open(args)
+    if ws.bill_manager is None:
+        return _error("the work dataset has no bills")
+    due = ws.bills_due()
+    if not due:
+        print("No bills due")
+        return 0
+    width = max(len(b["name"]) for b in due)
+    for bill in due:
+        print(f"{bill['name']:<{width}}  {bill['amount_text']:>9}  {bill['status']}")
+    return 0
+
+
+def cmd_sync(args) -> int:
+    """Upload local changes and download cloud updates."""
+    data_dir = "data-work" if args.dataset == "work" else "data"
+    if args.dataset == "work":
+        return _error("the work dataset is local-only")
+    return 0 if DataManager(data_dir=data_dir).sync_to_cloud() else 1
+
+
+def cmd_stats(args) -> int:
+    """Completion rate for recent days, plus progress on the current day."""
+    ws = _open(args)
+    days = list(ws.data_manager.iter_daily_stats())[-args.days:] if args.days > 0 else []
+    if days:
+        print(f"Last {len(days)} day(s):")
+        for day in days:
+            print(f"  {day['date']}  {day['completed']:>3}/{day['total']:<3}  {day['completion_rate']:>5.1f}%")
+        done = sum(d["completed"] for d in days)
+        total = sum(d["total"] for d in days)
+        if total:
+            print(f"  {'overall':<10}  {done:>3}/{total:<3}  {done / total * 100:>5.1f}%")
+    else:
+        print("No completed days logged yet")
+
+    tasks = [t for b in [ws.planning] + ws.blocks for t in b.tasks if t.text.strip()]
+    done = sum(t.completed for t in tasks)
+    print(f"Current day ({ws.current_day_date}): {done}/{len(tasks)} tasks done, {len(ws.queue)} in queue")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py --headless",
+        description="Daily Scheduler without the window"
+    )
+    parser.add_argument("--dataset", choices=("home", "work"),
+                        help="Dataset to use (default: the one last used in the window)")
+    commands = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    p = commands.add_parser("new-day", help=cmd_new_day.__doc__)
+    p.add_argument("--force", action="store_true", help="Roll over even if already done today")
+    p.set_defaults(func=cmd_new_day)
+
+    p = commands.add_parser("add", help=cmd_add.__doc__)
+    p.add_argument("text", nargs="+", help="Task text")
+    p.add_argument("--to", default="queue", help=f"Where to add it: {WHERE_HELP} (default: queue)")
+    p.add_argument("--priority", action="store_true", help="Mark as high priority")
+    p.set_defaults(func=cmd_add)
+
+    p = commands.add_parser("move", help=cmd_move.__doc__)
+    p.add_argument("query", nargs="+", help="Task id, text, or part of the text")
+    p.add_argument("--to", required=True, help="planning or a block number 1-8")
+    p.set_defaults(func=cmd_move)
+
+    p = commands.add_parser("bills", help=cmd_bills.__doc__)
+    p.set_defaults(func=cmd_bills)
+
+    p = commands.add_parser("sync", help=cmd_sync.__doc__)
+    p.set_defaults(func=cmd_sync)
+
+    p = commands.add_parser("stats", help=cmd_stats.__doc__)
+    p.add_argument("--days", type=int, default=7, help="How many logged days to show (default: 7)")
+    p.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run one headless command. Returns the process exit code."""
+    args = build_parser().parse_args(argv)
+    if args.dataset is None:
+        args.dataset = DataManager.read_active_dataset()
+    return args.func(args)
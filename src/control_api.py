@@ -0,0 +1,446 @@
+"""Local control API: drive one dataset's tasks, recurring templates, bills and timer over HTTP.
+
+Usage:
+    python -m src.control_api [--data-dir data] [--host 127.0.0.1] [--port 8765]
+
+Every operation is a named op taking JSON arguments:
+
+    POST /ops/add_task   {"location": "block:2", "text": "Call bank"}
+        ← {"ok": true, "version": 7, "result": {...task...}}
+    POST /batch          {"ops": [{"op": "add_task", ...}, {"op": "move_task", ...}]}
+        ← {"ok": true, "version": 9, "results": [...]}     (one save, one push)
+    GET  /tasks, /recurring, /bills_due, /timer    read-only ops without a body
+    GET  /state          everything at once
+    GET  /events         Server-Sent Events: "change" {version, stores}, "timer" {...state...}
+
+The dataset is loaded once into a Workspace; ops edit it in memory on a single
+worker thread and a SaveCoalescer writes the JSON files behind them. Timer ops
+go to the timer service (started on first use).
+
+The API refuses to start while the window has the dataset open (workspace.lock),
+and the window warns if it opens one the API is serving. Files rewritten by
+anything else (a sync, the CLI) are reloaded before the next op, and a save
+never writes over them.
+"""
+import argparse
+import hmac
+import inspect
+import json
+import queue
+import sys
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.data_manager import DataManager
+from src.instance_lock import InstanceLock
+from src.integrations.http_session import close_session
+from src.save_coalescer import SaveCoalescer
+from src.timer_client import TimerClient
+from src.service_loop import Broadcaster, ServiceLoop
+from src.workspace import WORKSPACE_LOCK_FILE, Workspace
+
+DEFAULT_PORT = 8765
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+# Ops that only read, also reachable as GET /<name>
+READ_OPS = ("tasks", "recurring", "bills_due", "timer")
+TIMER_ACTIONS = {
+    "start": "start",
+    "pause": "pause",
+    "skip": "skip_to_next",
+    "reset": "reset",
+    "end_day": "end_day",
+}
+
+
+class DatasetInUse(Exception):
+    """The window (or another control API) has the dataset open."""
+
+
+class OpError(Exception):
+    """A request the API rejects; carries the HTTP status to answer with."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _to_json(value):
+    """Model objects (Task, Bill, RecurringTask, TimerState) → plain JSON values."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    return value
+
+
+class ControlServer:
+    """Serves one dataset's Workspace and the timer to local (or LAN) clients."""
+
+    EVENT_BACKLOG = 100
+
+    def __init__(self, data_dir: str = "data", host: Optional[str] = None, port: Optional[int] = None):
+        """
+        Initialize control server.
+
+        Args:
+            data_dir: Dataset directory
+            host: Interface to bind; defaults to control_api.host in config.json,
+                then 127.0.0.1. Non-loopback hosts need a token in the secrets file.
+            port: TCP port; defaults to control_api.port, then 8765 (0 picks a free one)
+
+        Raises:
+            DatasetInUse: if the window has the dataset open
+        """
+        self.data_manager = DataManager(data_dir=data_dir)
+        # Both keep their own copy of the tasks; running side by side, each
+        # would overwrite the other's edits
+        self.lock = InstanceLock(self.data_manager.data_dir / WORKSPACE_LOCK_FILE)
+        if not self.lock.acquire():
+            raise DatasetInUse(f"{data_dir} is open in the Daily Scheduler window (or another control API)")
+
+        config = self.data_manager.load_config()
+        api_config = config.get("control_api", {})
+        self.token = api_config.get("token", "")
+        host = host or api_config.get("host", "127.0.0.1")
+        if host not in LOOPBACK_HOSTS and not self.token:
+            print("[API] control_api_token missing from the secrets file, listening on 127.0.0.1 only")
+            host = "127.0.0.1"
+        if port is None:
+            port = api_config.get("port", DEFAULT_PORT)
+
+        self.loop = ServiceLoop()
+        self.events = Broadcaster(self.EVENT_BACKLOG)
+        self._batch_stores: Optional[set] = None
+        self._tasks_cache: Tuple[int, Optional[Dict]] = (-1, None)
+
+        # Same split as MainWindow: the work dataset has no bills
+        self.workspace = Workspace(
+            self.data_manager,
+            include_bills=Path(data_dir).name != "data-work",
+            on_change=self._on_change
+        )
+        self.saver = SaveCoalescer(
+            self.loop,
+            self.workspace.save,
+            on_error=lambda e: print(f"[API] Save failed: {e}")
+        )
+        self.timer: Optional[TimerClient] = None
+
+        server = self
+
+        class Handler(ControlRequestHandler):
+            control = server
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+
+    # ── Change notification (worker thread) ─────────────────────────────
+
+    def _on_change(self, stores: Tuple[str, ...]):
+        self.saver.mark_dirty(*(s for s in stores if s != "bills"))  # BillManager saves itself
+        if self._batch_stores is not None:
+            self._batch_stores.update(stores)
+        else:
+            self._publish_change(stores)
+
+    def _publish_change(self, stores):
+        self.events.publish(("change", {"version": self.workspace.version, "stores": sorted(stores)}))
+
+    def _on_timer_state(self, timer_state):
+        self.events.publish(("timer", timer_state.to_dict()))
+
+    # ── Ops (worker thread) ─────────────────────────────────────────────
+
+    def _reload_changed(self):
+        """Pick up files another program (e.g. a sync or the CLI) saved since we last read or wrote them."""
+        changed = self.workspace.changed_on_disk()
+        if not changed:
+            return
+        lost = self.saver.pending.intersection(changed)
+        if lost:
+            print(f"[API] {', '.join(sorted(lost))} changed on disk, unsaved API edits dropped")
+        self.workspace.reload(changed)
+
+    def run_ops(self, ops: List[Dict]) -> Dict:
+        """Apply ops in order with one coalesced change event.
+
+        Stores changed on disk by another program are reloaded first. Stops
+        at the first op that fails; the ops before it stay applied.
+        """
+        self._batch_stores = set()
+        results = []
+        try:
+            self._reload_changed()
+            for i, op in enumerate(ops):
+                if not isinstance(op, dict) or "op" not in op:
+                    raise OpError(f"op {i}: expected an object with an \"op\" name")
+                args = {k: v for k, v in op.items() if k != "op"}
+                try:
+                    results.append(self.run_op(op["op"], args))
+                except OpError as e:
+                    raise OpError(f"op {i} ({op['op']}): {e}", e.status)
+        finally:
+            stores, self._batch_stores = self._batch_stores, None
+            if stores:
+                self._publish_change(stores)
+        return {"version": self.workspace.version, "results": results}
+
+    def run_op(self, name: str, args: Dict):
+        method = getattr(self, f"op_{name}", None)
+        if method is None:
+            raise OpError(f"unknown op {name!r}", 404)
+        # Check the arguments up front so a TypeError from inside the op stays a 500
+        try:
+            inspect.signature(method).bind(**args)
+        except TypeError as e:
+            raise OpError(f"bad arguments: {e}")
+        try:
+            return _to_json(method(**args))
+        except ValueError as e:
+            raise OpError(str(e))
+
+    def state(self) -> Dict:
+        self._reload_changed()
+        ws = self.workspace
+        return {
+            "version": ws.version,
+            "tasks": self.op_tasks(),
+            "recurring": _to_json(ws.recurring),
+            "bills_due": ws.bills_due() if ws.bill_manager is not None else [],
+            "timer": self.timer.timer_state.to_dict() if self.timer else None,
+        }
+
+    def op_tasks(self):
+        # Serializing every task is the bulk of a read; reuse it until the next edit
+        if self._tasks_cache[0] != self.workspace.version:
+            self._tasks_cache = (self.workspace.version, self.workspace.tasks_dict())
+        return self._tasks_cache[1]
+
+    def op_add_task(self, location: str, text: str, is_high_priority: bool = False):
+        return self.workspace.add_task(location, text, is_high_priority)
+
+    def op_update_task(self, id: str, **fields):
+        return self.workspace.update_task(id, **fields)
+
+    def op_move_task(self, id: str, location: str):
+        return self.workspace.move_task(id, location)
+
+    def op_delete_task(self, id: str):
+        return self.workspace.delete_task(id)
+
+    def op_new_day(self):
+        completed, total = self.workspace.start_new_day()
+        if self._timer(required=False):
+            self.timer.reset()
+        return {"completed": completed, "total": total}
+
+    def op_recurring(self):
+        return self.workspace.recurring
+
+    def op_set_recurring(self, templates: List[Dict]):
+        return self.workspace.set_recurring(templates)
+
+    def op_add_recurring(self, **template):
+        return self.workspace.add_recurring(template)
+
+    def op_remove_recurring(self, text: str):
+        return {"removed": self.workspace.remove_recurring(text)}
+
+    def op_bills_due(self):
+        return self.workspace.bills_due()
+
+    def op_mark_bill_paid(self, id: str):
+        return self.workspace.set_bill_paid(id, True)
+
+    def op_mark_bill_unpaid(self, id: str):
+        return self.workspace.set_bill_paid(id, False)
+
+    def op_add_bill(self, **fields):
+        return self.workspace.add_bill(fields)
+
+    def op_remove_bill(self, id: str):
+        self.workspace.remove_bill(id)
+        return {"removed": id}
+
+    def op_timer(self, action: Optional[str] = None):
+        """Timer state, after applying action (start, pause, skip, reset, end_day) if given."""
+        timer = self._timer()
+        if action is not None:
+            if action not in TIMER_ACTIONS:
+                raise OpError(f"unknown timer action {action!r} (use {', '.join(TIMER_ACTIONS)})")
+            getattr(timer, TIMER_ACTIONS[action])()
+        return timer.timer_state
+
+    def _timer(self, required: bool = True) -> Optional[TimerClient]:
+        """Connect to (or start) the timer service on first use."""
+        if self.timer is None:
+            self.timer = TimerClient.connect(self.data_manager, self.loop, self._on_timer_state)
+            if self.timer is None and required:
+                raise OpError("timer service unavailable", 503)
+        return self.timer
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def serve_forever(self):
+        """Serve until Ctrl+C. Blocks."""
+        threading.Thread(target=self.loop.run_forever, name="control-api-worker", daemon=True).start()
+        scope = "local only" if self.host in LOOPBACK_HOSTS else "token required"
+        print(f"[API] Serving {self.data_manager.data_dir} on http://{self.host}:{self.port} ({scope})")
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Flush pending saves and stop the worker (the timer service keeps running)."""
+        try:
+            self.loop.call(self.saver.flush)
+            if self.timer is not None:
+                self.loop.call(self.timer.shutdown)
+        except TimeoutError:
+            print("[API] Worker did not respond, unsaved changes may be lost")
+        self.loop.stop()
+        self.events.close()
+        self.httpd.server_close()
+        self.lock.release()
+        close_session()
+
+
+class ControlRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end; all work is handed to the server's worker thread."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive for scripts making many calls
+    disable_nagle_algorithm = True
+    control: ControlServer = None  # set by ControlServer
+
+    def log_message(self, *args):
+        pass
+
+    def _authorized(self) -> bool:
+        token = self.control.token
+        # Bytes, since compare_digest rejects non-ASCII str
+        sent = self.headers.get("Authorization", "").encode("utf-8", "surrogateescape")
+        if not token or hmac.compare_digest(sent, f"Bearer {token}".encode("utf-8")):
+            return True
+        self._reply(401, {"ok": False, "error": "missing or wrong bearer token"})
+        return False
+
+    def _reply(self, status: int, body: Dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise OpError(f"body is not valid JSON: {e}")
+
+    def _call(self, func, *args):
+        """Run func on the worker thread and reply with its result (or the error)."""
+        try:
+            self._reply(200, dict(ok=True, **self.control.loop.call(func, *args)))
+        except OpError as e:
+            self._reply(e.status, {"ok": False, "error": str(e)})
+        except TimeoutError as e:
+            self._reply(503, {"ok": False, "error": str(e)})
+        except Exception as e:
+            print(f"[API] Error handling {self.command} {self.path}: {e}")
+            traceback.print_exc()
+            self._reply(500, {"ok": False, "error": str(e)})
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        path = self.path.split("?", 1)[0].strip("/")
+        if path == "events":
+            self._stream_events()
+        elif path == "state":
+            self._call(self.control.state)
+        elif path in READ_OPS:
+            self._call(self._run, [{"op": path}], False)
+        else:
+            self._reply(404, {"ok": False, "error": f"no such endpoint /{path}"})
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        path = self.path.split("?", 1)[0].strip("/")
+        try:
+            body = self._read_json()
+            if path == "batch":
+                ops = body.get("ops") if isinstance(body, dict) else None
+                if not isinstance(ops, list):
+                    raise OpError('expected {"ops": [...]}')
+            elif path.startswith("ops/") and isinstance(body, dict):
+                ops = [dict(body, op=path[len("ops/"):])]
+            else:
+                raise OpError(f"no such endpoint /{path}", 404)
+        except OpError as e:
+            self._reply(e.status, {"ok": False, "error": str(e)})
+            return
+        self._call(self._run, ops, path == "batch")
+
+    def _run(self, ops, batch: bool) -> Dict:
+        outcome = self.control.run_ops(ops)
+        if batch:
+            return outcome
+        return {"version": outcome["version"], "result": outcome["results"][0]}
+
+    def _stream_events(self):
+        """Server-Sent Events until the client disconnects."""
+        hello = self.control.loop.call(lambda: ("change", {"version": self.control.workspace.version, "stores": []}))
+        q = self.control.events.subscribe(hello)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            while True:
+                try:
+                    item = q.get(timeout=15)
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+                    continue
+                if item is None:
+                    return
+                event, data = item
+                self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            self.control.events.unsubscribe(q)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local control API for the Daily Scheduler")
+    parser.add_argument("--data-dir", default="data", help="Dataset directory (default: data)")
+    parser.add_argument("--host", help="Interface to bind (default: control_api.host or 127.0.0.1)")
+    parser.add_argument("--port", type=int, help=f"TCP port (default: control_api.port or {DEFAULT_PORT})")
+    args = parser.parse_args()
+    try:
+        server = ControlServer(args.data_dir, args.host, args.port)
+    except DatasetInUse as e:
+        print(f"[API] Not starting: {e}. Close it first.", file=sys.stderr)
+        sys.exit(1)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 from .models.task import Task
 from .models.block import Block
 from .models.timer_state import TimerState
 from .models.recurring_task import RecurringTask
 from .models.bill import Bill
+from .append_log import AppendLog
+from .hashing import content_hash
 from .integrations.cloudflare_sync import CloudflareSync
 
 class DataManager:
@@ -15,13 +18,26 @@ class DataManager:
 
         self.tasks_file = self.data_dir / "tasks.json"
         self.recurring_file = self.data_dir / "recurring.json"
-        self.completed_log_file = self.data_dir / "completed_log.json"
-        self.incomplete_history_file = self.data_dir / "incomplete_history.json"
-        self.daily_stats_file = self.data_dir / "daily_stats.json"
+        self.completed_log_file = self.data_dir / "completed_log.jsonl"
+        self.incomplete_history_file = self.data_dir / "incomplete_history.jsonl"
+        self.daily_stats_file = self.data_dir / "daily_stats.jsonl"
         self.timer_state_file = self.data_dir / "timer_state.json"
         self.config_file = self.data_dir / "config.json"
         self.bills_file = self.data_dir / "bills.json"
 
+        # Last content this process read or wrote per file: name → (hash, mtime_ns, size).
+        # Saves whose content hash matches (and the file is untouched on disk) are skipped.
+        self._file_state: Dict[str, Tuple[str, int, int]] = {}
+
+        # History logs are append-only JSONL; legacy JSON arrays migrate on first use
+        self.completed_log = AppendLog(self.completed_log_file, self.data_dir / "completed_log.json")
+        self.incomplete_history = AppendLog(self.incomplete_history_file, self.data_dir / "incomplete_history.json")
+        self.daily_stats = AppendLog(self.daily_stats_file, self.data_dir / "daily_stats.json")
+        # Migrate up front so a cloud download can't create the .jsonl first
+        # and strand the legacy history
+        for log in (self.completed_log, self.incomplete_history, self.daily_stats):
+            log.migrate()
+
         # Load secrets first (from machine-specific secrets directory)
         self._secrets = self.load_secrets()
 
@@ -31,14 +47,19 @@ class DataManager:
         self.cloudflare_sync = CloudflareSync(
             worker_url=sync_config.get("worker_url", ""),
             data_dir=self.data_dir,
-            enabled=sync_config.get("enabled", True)
+            enabled=sync_config.get("enabled", True),
+            timeout_seconds=sync_config.get("timeout_seconds", 10),
+            use_bundle=sync_config.get("use_bundle", False)
         )
 
     def load_tasks(self) -> Dict:
         """Load current tasks and queue"""
         from datetime import date as _date
         if self.tasks_file.exists():
-            data = json.loads(self.tasks_file.read_text())
+            data = json.loads(self._read_tracked(self.tasks_file))
+            if self._migrate_task_ids(data):
+                self._write_if_changed(self.tasks_file, json.dumps(data, indent=2))
+                print("[Data] Assigned ids to tasks saved before task ids existed")
             # Convert dicts back to Block/Task objects
             return {
                 'planning': Block.from_dict(data.get('planning', {'name': 'Planning', 'tasks': []})),
@@ -55,8 +76,33 @@ class DataManager:
             'current_day_date': _date.today().isoformat(),
         }
 
-    def save_tasks(self, planning: Block, blocks: List[Block], queue: List[Task], current_day_date: str = ""):
-        """Save current tasks and queue"""
+    @staticmethod
+    def _migrate_task_ids(data: Dict) -> bool:
+        """Give every task in a tasks.json document an id. Returns True if any changed.
+
+        Legacy tasks get Task.legacy_id (deterministic, so other machines and the
+        sync base agree); exact duplicates get a numeric suffix to stay distinct.
+        """
+        task_lists = [data.get('planning', {}).get('tasks', [])]
+        task_lists += [b.get('tasks', []) for b in data.get('blocks', [])]
+        task_lists.append(data.get('queue', []))
+
+        seen = set()
+        changed = False
+        for tasks in task_lists:
+            for t in tasks:
+                task_id = t.get('id') or Task.legacy_id(t)
+                base_id, n = task_id, 2
+                while task_id in seen:
+                    task_id, n = f"{base_id}-{n}", n + 1
+                seen.add(task_id)
+                if t.get('id') != task_id:
+                    t['id'] = task_id
+                    changed = True
+        return changed
+
+    def save_tasks(self, planning: Block, blocks: List[Block], queue: List[Task], current_day_date: str = "") -> bool:
+        """Save current tasks and queue. Returns False if unchanged (no write)."""
         from datetime import date as _date
         data = {
             'planning': planning.to_dict(),
@@ -64,7 +110,7 @@ class DataManager:
             'queue': [t.to_dict() for t in queue],
             'current_day_date': current_day_date or _date.today().isoformat(),
         }
-        self.tasks_file.write_text(json.dumps(data, indent=2))
+        return self._write_if_changed(self.tasks_file, json.dumps(data, indent=2))
 
     def load_recurring(self) -> list:
         """Load recurring task templates from dedicated recurring.json file."""
@@ -81,15 +127,64 @@ class DataManager:
             return []
         if self.recurring_file.exists():
             try:
-                data = json.loads(self.recurring_file.read_text())
+                data = json.loads(self._read_tracked(self.recurring_file))
                 return [RecurringTask.from_dict(r) for r in data]
             except Exception:
                 return []
         return []
 
-    def save_recurring(self, recurring: list):
-        """Save recurring task templates to dedicated recurring.json file."""
-        self.recurring_file.write_text(json.dumps([r.to_dict() for r in recurring], indent=2))
+    def save_recurring(self, recurring: list) -> bool:
+        """Save recurring task templates to dedicated recurring.json file.
+        Returns False if unchanged (no write)."""
+        return self._write_if_changed(
+            self.recurring_file, json.dumps([r.to_dict() for r in recurring], indent=2)
+        )
+
+    def _read_tracked(self, path: Path) -> str:
+        """Read a file and remember its content hash for later change detection."""
+        text = path.read_text()
+        self._remember_file(path, content_hash(text))
+        return text
+
+    def _write_if_changed(self, path: Path, text: str) -> bool:
+        """Write text to path unless it matches what's already there.
+
+        The stored hash is only trusted while the file's mtime and size still
+        match — if something else (e.g. a cloud download) rewrote the file,
+        the save goes through.
+        """
+        digest = content_hash(text)
+        known = self._file_state.get(path.name)
+        if known and known[0] == digest:
+            try:
+                st = path.stat()
+                if (st.st_mtime_ns, st.st_size) == known[1:]:
+                    return False
+            except FileNotFoundError:
+                pass
+        self._write_atomic(path, text)
+        self._remember_file(path, digest)
+        return True
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        """Write via a temp file + rename, so a background sync never reads a half-written file."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+
+    def changed_on_disk(self, path: Path) -> bool:
+        """Whether something else rewrote path since this process last read or wrote it."""
+        known = self._file_state.get(path.name)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return known is not None
+        return known is None or (st.st_mtime_ns, st.st_size) != known[1:]
+
+    def _remember_file(self, path: Path, digest: str):
+        st = path.stat()
+        self._file_state[path.name] = (digest, st.st_mtime_ns, st.st_size)
 
     def apply_recurring_tasks(self, blocks: List[Block], recurring, fill_missing=False, day_date: str = ""):
         """Create fresh task instances from recurring templates and add to target blocks.
@@ -118,6 +213,8 @@ class DataManager:
         else:
             today = date.today()
         today_str = today.isoformat()
+        # Texts present per block, built on first use — one pass per block, not per template
+        block_texts: Dict[int, set] = {}
 
         for rt in recurring:
             if not fill_missing:
@@ -138,11 +235,11 @@ class DataManager:
                 if 0 <= block_idx < len(blocks):
                     if fill_missing:
                         # Only add if this text isn't already in the block
-                        already_present = any(
-                            t.text == rt.text for t in blocks[block_idx].tasks
-                        )
-                        if already_present:
+                        if block_idx not in block_texts:
+                            block_texts[block_idx] = {t.text for t in blocks[block_idx].tasks}
+                        if rt.text in block_texts[block_idx]:
                             continue
+                        block_texts[block_idx].add(rt.text)
                     task = Task(text=rt.text, is_recurring=True)
                     blocks[block_idx].tasks.append(task)
                     applied = True
@@ -152,50 +249,73 @@ class DataManager:
 
     def log_completed_task(self, task: Task, block_name: str):
         """Append completed task to log"""
-        log = []
-        if self.completed_log_file.exists():
-            log = json.loads(self.completed_log_file.read_text())
+        self.completed_log.append(self._completed_record(task, block_name))
+
+    def log_incomplete_task(self, task: Task, original_block: str):
+        """Track incomplete task moved to queue"""
+        task.times_queued += 1
+        self.incomplete_history.append(self._incomplete_record(task, original_block))
+
+    def update_daily_stats(self, completed_count: int, total_count: int):
+        """Save daily completion statistics"""
+        self.daily_stats.append(self._stats_record(completed_count, total_count))
 
-        log.append({
+    def log_day_rollover(self, completed: List[Tuple[Task, str]], incomplete: List[Tuple[Task, str]],
+                         stats: Optional[Tuple[int, int]] = None):
+        """Log a whole Start New Day in one write per file.
+
+        Args:
+            completed: (task, block_name) pairs for finished tasks
+            incomplete: (task, block_name) pairs for tasks going to the queue;
+                each task's times_queued is incremented, same as log_incomplete_task
+            stats: (completed_count, total_count), or None to skip the stats entry
+        """
+        self.completed_log.extend(self._completed_record(t, b) for t, b in completed)
+        for task, _ in incomplete:
+            task.times_queued += 1
+        self.incomplete_history.extend(self._incomplete_record(t, b) for t, b in incomplete)
+        if stats is not None:
+            self.daily_stats.append(self._stats_record(*stats))
+
+    @staticmethod
+    def _completed_record(task: Task, block_name: str) -> Dict:
+        return {
             'task': task.text,
             'block': block_name,
             'completed_at': task.completed_at,
             'times_queued': task.times_queued
-        })
-
-        self.completed_log_file.write_text(json.dumps(log, indent=2))
-
-    def log_incomplete_task(self, task: Task, original_block: str):
-        """Track incomplete task moved to queue"""
-        history = []
-        if self.incomplete_history_file.exists():
-            history = json.loads(self.incomplete_history_file.read_text())
+        }
 
-        task.times_queued += 1
-        history.append({
+    @staticmethod
+    def _incomplete_record(task: Task, original_block: str) -> Dict:
+        return {
             'task': task.text,
             'original_block': original_block,
             'queued_count': task.times_queued,
             'queued_at': task.created_at
-        })
-
-        self.incomplete_history_file.write_text(json.dumps(history, indent=2))
+        }
 
-    def update_daily_stats(self, completed_count: int, total_count: int):
-        """Save daily completion statistics"""
+    @staticmethod
+    def _stats_record(completed_count: int, total_count: int) -> Dict:
         from datetime import datetime
-        stats = []
-        if self.daily_stats_file.exists():
-            stats = json.loads(self.daily_stats_file.read_text())
-
-        stats.append({
+        return {
             'date': datetime.now().strftime('%Y-%m-%d'),
             'completed': completed_count,
             'total': total_count,
             'completion_rate': round(completed_count / total_count * 100, 1) if total_count > 0 else 0
-        })
+        }
+
+    def iter_completed_log(self) -> Iterator[Dict]:
+        """Stream completed-task records oldest first."""
+        return self.completed_log.iter_records()
+
+    def iter_incomplete_history(self) -> Iterator[Dict]:
+        """Stream incomplete-task records oldest first."""
+        return self.incomplete_history.iter_records()
 
-        self.daily_stats_file.write_text(json.dumps(stats, indent=2))
+    def iter_daily_stats(self) -> Iterator[Dict]:
+        """Stream daily stats records oldest first."""
+        return self.daily_stats.iter_records()
 
     def load_timer_state(self) -> Optional[TimerState]:
         """Load timer state from persistence."""
@@ -211,8 +331,8 @@ class DataManager:
     def save_timer_state(self, timer_state: TimerState):
         """Save timer state to persistence."""
         try:
-            self.timer_state_file.write_text(
-                json.dumps(timer_state.to_dict(), indent=2)
+            self._write_if_changed(
+                self.timer_state_file, json.dumps(timer_state.to_dict(), indent=2)
             )
         except Exception as e:
             print(f"Error saving timer state: {e}")
@@ -231,7 +351,7 @@ class DataManager:
         """
         if self.bills_file.exists():
             try:
-                data = json.loads(self.bills_file.read_text())
+                data = json.loads(self._read_tracked(self.bills_file))
                 bills = [Bill.from_dict(b) for b in data.get("bills", [])]
                 last_reset_month = data.get("last_reset_month", "")
                 return bills, last_reset_month
@@ -240,16 +360,17 @@ class DataManager:
                 return [], ""
         return [], ""
 
-    def save_bills(self, bills, last_reset_month: str):
-        """Save bills to persistence."""
+    def save_bills(self, bills, last_reset_month: str) -> bool:
+        """Save bills to persistence. Returns False if unchanged or on error."""
         try:
             data = {
                 "last_reset_month": last_reset_month,
                 "bills": [b.to_dict() for b in bills]
             }
-            self.bills_file.write_text(json.dumps(data, indent=2))
+            return self._write_if_changed(self.bills_file, json.dumps(data, indent=2))
         except Exception as e:
             print(f"Error saving bills: {e}")
+            return False
 
     def load_secrets(self) -> Dict:
         """Load secrets from machine-specific secrets directory.
@@ -286,6 +407,7 @@ class DataManager:
         # Inject secrets - these override anything in config.json
         config.setdefault("voice_monkey", {})["api_url"] = self._secrets.get("voice_monkey_api_url", "")
         config.setdefault("cloudflare_sync", {})["worker_url"] = self._secrets.get("cloudflare_worker_url", "")
+        config.setdefault("control_api", {})["token"] = self._secrets.get("control_api_token", "")
 
         return config
 
@@ -298,7 +420,8 @@ class DataManager:
             # Remove runtime-injected secrets — they come from the secrets file, not config
             clean.get("voice_monkey", {}).pop("api_url", None)
             clean.get("cloudflare_sync", {}).pop("worker_url", None)
-            self.config_file.write_text(json.dumps(clean, indent=2))
+            clean.get("control_api", {}).pop("token", None)
+            self._write_atomic(self.config_file, json.dumps(clean, indent=2))
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -317,7 +440,8 @@ class DataManager:
             }
         }
 
-    def read_active_dataset(self) -> str:
+    @staticmethod
+    def read_active_dataset() -> str:
         """Read the active dataset ('home' or 'work') from the home config file.
         Always reads from data/config.json regardless of current data_dir."""
         home_config = Path("data") / "config.json"
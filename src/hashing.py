@@ -0,0 +1,10 @@
+"""Content hashing shared by local dirty tracking and cloud sync."""
+import hashlib
+from typing import Union
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """Return a stable hex digest for file content (str is hashed as UTF-8)."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
@@ -0,0 +1,68 @@
+"""Exclusive per-dataset lock files, so two processes don't own the same data at once."""
+import os
+from pathlib import Path
+from typing import IO, Optional
+
+
+class InstanceLock:
+    """An OS-level lock on a file in the data directory.
+
+    The lock is tied to the open file, so a process that crashes releases it;
+    the file itself is left behind and reused.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize lock (not yet held; see acquire()).
+
+        Args:
+            path: Lock file, created if missing
+        """
+        self.path = Path(path)
+        self._file: Optional[IO] = None
+
+    @property
+    def held(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """Take the lock without waiting.
+
+        Returns:
+            True if this process now holds it, False if another one does
+        """
+        if self._file is not None:
+            return True
+        try:
+            lock_file = open(self.path, "a+")
+        except OSError as e:
+            print(f"[Lock] Could not open {self.path}: {e}")
+            return False
+        try:
+            if os.name == "nt":
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self):
+        """Give the lock up (closing the file releases it)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def is_held_elsewhere(self) -> bool:
+        """Whether another process holds the lock right now."""
+        if self._file is not None:
+            return False
+        if not self.acquire():
+            return True
+        self.release()
+        return False
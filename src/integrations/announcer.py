@@ -0,0 +1,111 @@
+"""Non-blocking announcement dispatch: network/TTS calls run off the Tk thread."""
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class AnnouncementDispatcher:
+    """Drop-in wrapper around VoiceMonkeyClient / LocalChimeClient.
+
+    announce() only enqueues and returns immediately; worker threads make the
+    actual (blocking) call. Results are handed back to the Tk thread through a
+    queue drained by root_window.after(), so callbacks never run on a worker.
+    """
+
+    def __init__(
+        self,
+        client,
+        root_window=None,
+        max_workers: int = 1,
+        max_age_seconds: float = 30.0,
+        on_result: Optional[Callable[[str, bool], None]] = None
+    ):
+        """
+        Initialize announcement dispatcher.
+
+        Args:
+            client: Object with a blocking announce(message) -> bool
+            root_window: Tkinter root for after() result delivery; if None,
+                results are reported directly from the worker thread
+            max_workers: Worker threads. The default of 1 keeps announcements
+                in order; raise it only if order doesn't matter
+            max_age_seconds: Announcements still queued after this long are
+                dropped — a stale "5 minutes remaining" is worse than none
+            on_result: Called on the Tk thread with (message, success)
+        """
+        self.client = client
+        self.root_window = root_window
+        self.max_age_seconds = max_age_seconds
+        self.on_result = on_result
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="announce"
+        )
+        self._results = queue.Queue()
+        self._pending = 0
+        self._poll_id = None
+
+        self.stats = {"queued": 0, "sent": 0, "failed": 0, "dropped": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(self.client, "enabled", True)
+
+    def announce(self, message: str) -> bool:
+        """Queue an announcement. Never blocks; returns True once queued."""
+        self.stats["queued"] += 1
+        self._pending += 1
+        # Bind the client now so a mode switch doesn't redirect queued messages
+        self._executor.submit(self._run, self.client, message, time.monotonic())
+        self._schedule_poll()
+        return True
+
+    def _run(self, client, message: str, queued_at: float):
+        """Worker thread: make the blocking call and post the outcome."""
+        if time.monotonic() - queued_at > self.max_age_seconds:
+            outcome = None  # dropped as stale
+        else:
+            try:
+                outcome = bool(client.announce(message))
+            except Exception as e:
+                print(f"[Announcer] Error: {e}: {message}")
+                outcome = False
+
+        if self.root_window is None:
+            self._handle_result(message, outcome)
+        else:
+            self._results.put((message, outcome))
+
+    def _schedule_poll(self):
+        if self.root_window is not None and self._poll_id is None:
+            self._poll_id = self.root_window.after(100, self._poll_results)
+
+    def _poll_results(self):
+        """Tk thread: drain finished announcements, keep polling while any are pending."""
+        self._poll_id = None
+        while True:
+            try:
+                message, outcome = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_result(message, outcome)
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def _handle_result(self, message: str, outcome: Optional[bool]):
+        self._pending -= 1
+        if outcome is None:
+            self.stats["dropped"] += 1
+            print(f"[Announcer] Dropped stale announcement: {message}")
+            return
+        self.stats["sent" if outcome else "failed"] += 1
+        if self.on_result:
+            self.on_result(message, outcome)
+
+    def shutdown(self):
+        """Stop accepting work and drop anything not yet started."""
+        if self._poll_id is not None and self.root_window is not None:
+            self.root_window.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
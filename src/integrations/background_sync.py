@@ -0,0 +1,134 @@
+"""Run cloud sync on a worker thread and hand results back to the Tk thread."""
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+
+@dataclass
+class SyncOutcome:
+    """What a background sync produced, delivered on the Tk thread."""
+    result: Any = None
+    error: Optional[Exception] = None
+    cancelled: bool = False
+    written: List[str] = field(default_factory=list)  # files replaced on disk
+
+
+class BackgroundSync:
+    """Runs one CloudflareSync job at a time off the Tk main thread.
+
+    The job's downloads are staged in memory (CloudflareSync.begin_staging)
+    and committed to disk together on the Tk thread once the job finishes,
+    so the UI never reads a half-synced set of files and can reload once.
+    Progress and completion travel through a queue drained by
+    root_window.after(), so callbacks never run on the worker.
+    """
+
+    def __init__(self, root_window, cloudflare_sync):
+        """
+        Initialize background sync runner.
+
+        Args:
+            root_window: Tkinter root for after() delivery
+            cloudflare_sync: CloudflareSync client the jobs use
+        """
+        self.root_window = root_window
+        self.cloudflare_sync = cloudflare_sync
+
+        self._messages = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._poll_id = None
+        self._on_progress = None
+        self._on_done = None
+        self._before_commit = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(
+        self,
+        job: Callable[[], Any],
+        on_done: Callable[[SyncOutcome], None],
+        on_progress: Optional[Callable[[str, bool], None]] = None,
+        before_commit: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """
+        Start job() on a worker thread.
+
+        Args:
+            job: Blocking sync call, e.g. data_manager.sync_to_cloud
+            on_done: Called on the Tk thread with the SyncOutcome
+            on_progress: Called on the Tk thread with (filename, success) per file
+            before_commit: Called on the Tk thread just before staged files are
+                written (e.g. to flush unsaved edits so they aren't overwritten)
+
+        Returns:
+            False if a sync is already running
+        """
+        if self.running:
+            return False
+        self._on_done = on_done
+        self._on_progress = on_progress
+        self._before_commit = before_commit
+
+        self.cloudflare_sync.begin_staging()
+        self.cloudflare_sync.on_progress = lambda f, ok: self._messages.put(("progress", (f, ok)))
+        self._thread = threading.Thread(target=self._run, args=(job,), name="sync", daemon=True)
+        self._thread.start()
+        self._poll_id = self.root_window.after(100, self._poll)
+        return True
+
+    def cancel(self):
+        """Stop before the next file; staged downloads are discarded."""
+        if self.running:
+            self.cloudflare_sync.cancel()
+
+    def _run(self, job: Callable[[], Any]):
+        """Worker thread: run the job and post the outcome."""
+        try:
+            self._messages.put(("done", SyncOutcome(result=job())))
+        except Exception as e:
+            print(f"[Sync] Background sync failed: {e}")
+            self._messages.put(("done", SyncOutcome(error=e)))
+
+    def _poll(self):
+        """Tk thread: deliver progress, and finish up once the job is done."""
+        self._poll_id = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self._on_progress:
+                    self._on_progress(*payload)
+            else:
+                self._finish(payload)
+                return
+        self._poll_id = self.root_window.after(100, self._poll)
+
+    def _finish(self, outcome: SyncOutcome):
+        sync = self.cloudflare_sync
+        sync.on_progress = None
+        self._thread = None
+
+        outcome.cancelled = sync.cancel_event.is_set()
+        if outcome.cancelled or outcome.error is not None:
+            sync.discard_staged()
+            sync.cancel_event.clear()  # the job is over; later syncs may write again
+        else:
+            if self._before_commit:
+                self._before_commit()
+            outcome.written = sync.commit_staged()
+        self._on_done(outcome)
+
+    def shutdown(self):
+        """Cancel any running sync and stop polling (e.g. on close or dataset switch)."""
+        self.cancel()
+        if self._poll_id is not None:
+            self.root_window.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self.running:
+            self.cloudflare_sync.discard_staged()
+            self._thread = None
@@ -1,14 +1,43 @@
 """Cloudflare R2 sync client for syncing data across machines."""
+import gzip
 import json
-import requests
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from src.append_log import AppendLog
+from src.hashing import content_hash
+from src.integrations.three_way_merge import merge3
+from src.integrations.http_session import get_session, timeout
+from src.models.task import Task
 
 
 class CloudflareSync:
     """Client for syncing JSON files to/from Cloudflare R2 via Worker."""
 
-    def __init__(self, worker_url: str, data_dir: Path, enabled: bool = True):
+    # Transferred one at a time, before everything else, in this order
+    ORDERED_FILES = ("config.json",)
+
+    # Files with a merge strategy — when both sides changed, these are
+    # downloaded + merged first and the merged result uploaded back
+    MERGEABLE_FILES = ("tasks.json", "bills.json", "recurring.json",
+                       "completed_log.jsonl", "incomplete_history.jsonl", "daily_stats.jsonl")
+
+    # Files merged three ways against the last synced copy (kept in sync_base/)
+    THREE_WAY_FILES = ("tasks.json", "bills.json", "recurring.json")
+
+    # Append-only logs — synced incrementally via the Worker's /log routes
+    LOG_FILES = ("completed_log.jsonl", "incomplete_history.jsonl", "daily_stats.jsonl")
+
+    # Uploads smaller than this go uncompressed — gzip overhead isn't worth it
+    GZIP_MIN_BYTES = 1024
+    # What a Worker without gzip support answers to a compressed body
+    GZIP_REJECTED_STATUSES = (400, 415)
+
+    def __init__(self, worker_url: str, data_dir: Path, enabled: bool = True,
+                 timeout_seconds: float = 10, max_workers: int = 4,
+                 use_bundle: bool = False):
         """
         Initialize Cloudflare sync client.
 
@@ -16,42 +45,215 @@ class CloudflareSync:
             worker_url: URL of deployed Cloudflare Worker (from config)
             data_dir: Path to local data directory
             enabled: Whether syncing is enabled
+            timeout_seconds: Read timeout per transfer request
+            max_workers: Concurrent transfers (bounded by the session's per-host pool)
+            use_bundle: Sync through the single-payload /bundle routes (two round
+                trips total) instead of per-file requests — best on high-latency links
         """
         self.worker_url = worker_url.rstrip('/')
         self.data_dir = data_dir
         self.enabled = enabled
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+        self.use_bundle = use_bundle
+        # Cleared once the Worker proves it can't read gzip (deployed before gzip support)
+        self.gzip_uploads = True
+        # Payload bytes before compression ("raw") vs. actually sent/received ("wire");
+        # "rejected_up" is compressed bodies the Worker refused (sent, but not delivered)
+        self.transfer_stats = {"raw_up": 0, "wire_up": 0, "raw_down": 0, "wire_down": 0, "rejected_up": 0}
 
         # Files to sync (order matters for dependencies)
         self.sync_files = [
             "config.json",
             "tasks.json",
             "timer_state.json",
-            "completed_log.json",
-            "incomplete_history.json",
-            "daily_stats.json",
+            "completed_log.jsonl",
+            "incomplete_history.jsonl",
+            "daily_stats.jsonl",
             "bills.json",
             "recurring.json"
         ]
 
+        # Hash of each file as last seen in the cloud (after our upload or download).
+        # Lets upload_all skip files that haven't changed locally since the last sync.
+        self.sync_state_file = self.data_dir / "sync_state.json"
+        # Last synced copy of each THREE_WAY_FILES file — the common merge base.
+        # New bases are held in _pending_bases until the sync state is saved.
+        self.base_dir = self.data_dir / "sync_base"
+        self._pending_bases: Dict[str, str] = {}
+        self.local_manifest: Dict[str, Dict] = {}
+        # Per log: bytes already synced locally/remotely, plus keys of records
+        # pulled from the cloud that sit past the local offset (see _apply_log_append)
+        self.log_state: Dict[str, Dict] = {}
+        self.remote_features: Set[str] = set()
+        self.remote_hashes: Dict[str, str] = self._load_sync_state()
+        self._state_lock = threading.Lock()  # transfers run on worker threads
+
+        # Background-sync support (see begin_staging / commit_staged). While
+        # staging, downloads are held in memory instead of written to disk.
+        self._staged: Optional[Dict[str, str]] = None
+        self._read_hashes: Dict[str, Optional[str]] = {}
+        self._hashes_before: Dict[str, str] = {}
+        self._staged_appends: Dict[str, Tuple] = {}
+        self.cancel_event = threading.Event()
+        # Called from worker threads with (filename, success) after each transfer
+        self.on_progress: Optional[Callable[[str, bool], None]] = None
+
+    @property
+    def session(self):
+        """Shared keep-alive session — one handshake for the whole sync.
+
+        Looked up on first use so creating a CloudflareSync (every DataManager
+        does) doesn't import requests.
+        """
+        return get_session()
+
+    def _load_sync_state(self) -> Dict[str, str]:
+        """Load last-synced content hashes (local-only, never uploaded)."""
+        try:
+            if self.sync_state_file.exists():
+                state = json.loads(self.sync_state_file.read_text())
+                self.local_manifest = state.get("local_manifest", {})
+                self.log_state = state.get("logs", {})
+                return state.get("remote_hashes", {})
+        except Exception as e:
+            print(f"[Sync] Could not read sync state: {e}")
+        return {}
+
+    def _save_sync_state(self):
+        """Persist last-synced content hashes and merge bases (deferred to commit while staging).
+
+        Skipped once the sync is cancelled: its downloads were never written,
+        so the hashes recorded so far don't describe the local files.
+        """
+        if self._staged is not None or self.cancel_event.is_set():
+            return
+        self._flush_bases()
+        try:
+            with self._state_lock:
+                state = json.dumps({
+                    "remote_hashes": self.remote_hashes,
+                    "local_manifest": self.local_manifest,
+                    "logs": self.log_state,
+                }, indent=2)
+            self.sync_state_file.write_text(state)
+        except Exception as e:
+            print(f"[Sync] Could not save sync state: {e}")
+
+    def _record_remote(self, filename: str, content: Optional[str]):
+        """Remember what the cloud copy of filename now contains."""
+        digest = None if content is None else content_hash(content)
+        with self._state_lock:
+            if digest is None:
+                self.remote_hashes.pop(filename, None)
+            else:
+                self.remote_hashes[filename] = digest
+                if filename in self.THREE_WAY_FILES:
+                    self._pending_bases[filename] = content
+
+    def _load_base(self, filename: str) -> Optional[str]:
+        """The copy of filename both sides agreed on at the last sync, if any.
+
+        Reads only what's on disk, so merges during a sync always see the
+        base from before it started.
+        """
+        base_path = self.base_dir / filename
+        try:
+            return base_path.read_text() if base_path.exists() else None
+        except OSError:
+            return None
+
+    def _flush_bases(self):
+        """Write merge bases recorded during this sync."""
+        with self._state_lock:
+            pending, self._pending_bases = self._pending_bases, {}
+        if not pending:
+            return
+        try:
+            self.base_dir.mkdir(exist_ok=True)
+            for filename, text in pending.items():
+                self._write_atomic(self.base_dir / filename, text)
+        except Exception as e:
+            print(f"[Sync] Could not save merge base: {e}")
+
+    def _count_bytes(self, direction: str, raw: int, wire: int):
+        """Add one transfer to transfer_stats (direction is "up" or "down")."""
+        with self._state_lock:
+            self.transfer_stats[f"raw_{direction}"] += raw
+            self.transfer_stats[f"wire_{direction}"] += wire
+
+    def _count_response(self, response):
+        """Count a response body: decoded size vs. the Content-Length on the wire."""
+        raw = len(response.content)
+        wire = int(response.headers.get("Content-Length", raw))
+        self._count_bytes("down", raw, wire)
+
+    def transfer_summary(self) -> str:
+        """One-line report of bytes moved and what compression saved."""
+        s = self.transfer_stats
+        raw = s["raw_up"] + s["raw_down"]
+        wire = s["wire_up"] + s["wire_down"] + s["rejected_up"]
+        saved = 100 * (1 - wire / raw) if raw else 0
+        summary = (f"up {s['wire_up']:,}/{s['raw_up']:,} B, down {s['wire_down']:,}/{s['raw_down']:,} B "
+                   f"(wire/raw, {saved:.0f}% saved)")
+        if s["rejected_up"]:
+            summary += f", {s['rejected_up']:,} B in rejected gzip uploads"
+        return summary
+
+    def build_local_manifest(self, filenames: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """Hash and size of every local sync file (or just filenames) that exists.
+
+        Hashes the text exactly as upload_file sends it (UTF-8, newlines
+        normalized by read_text), so they compare equal to the Worker's hashes.
+        """
+        manifest = {}
+        for filename in (self.sync_files if filenames is None else filenames):
+            text = self._read_local(filename)
+            if text is not None:
+                data = text.encode("utf-8")
+                manifest[filename] = {"hash": content_hash(data), "size": len(data)}
+        return manifest
+
+    def fetch_remote_manifest(self) -> Optional[Dict[str, Dict]]:
+        """GET /manifest from the Worker. None if unavailable (e.g. older Worker)."""
+        try:
+            response = self.session.get(
+                f"{self.worker_url}/manifest", timeout=timeout(self.timeout_seconds)
+            )
+            if response.status_code == 200:
+                self._count_response(response)
+                payload = response.json()
+                self.remote_features = set(payload.get("features", []))
+                return payload.get("files", {})
+            print(f"[Sync] Manifest unavailable ({response.status_code})")
+        except Exception as e:
+            print(f"[Sync] Error fetching manifest: {e}")
+        self.remote_features = set()
+        return None
+
+    def has_local_changes(self, filename: str) -> bool:
+        """True if the local file differs from the cloud copy as of the last sync."""
+        text = self._read_local(filename)
+        if text is None:
+            return False
+        known = self.remote_hashes.get(filename)
+        return known is None or content_hash(text) != known
+
     def upload_file(self, filename: str) -> bool:
         """Upload single file to R2."""
         if not self.enabled:
             return True
 
-        file_path = self.data_dir / filename
-        if not file_path.exists():
+        content = self._read_local(filename)
+        if content is None:
             print(f"[Sync] Skipping {filename} (doesn't exist locally)")
             return True
 
         try:
-            content = file_path.read_text()
-            response = requests.post(
-                f"{self.worker_url}/upload",
-                json={"filename": filename, "content": content},
-                timeout=10
-            )
+            response = self._post_upload(filename, content)
 
             if response.status_code == 200:
+                self._record_remote(filename, content)
                 print(f"[Sync] ✓ Uploaded {filename}")
                 return True
             else:
@@ -62,74 +264,129 @@ class CloudflareSync:
             print(f"[Sync] Error uploading {filename}: {e}")
             return False
 
+    def _post_upload(self, filename: str, content: str):
+        """POST one file to /upload, gzip-encoded when worthwhile.
+
+        A Worker deployed before gzip support can't parse the compressed
+        body and answers 400 or 415. The upload is then retried uncompressed,
+        and only if that retry succeeds is gzip switched off for the rest of
+        the session. Other errors (401, 413, 5xx) are returned as they are.
+        """
+        body = json.dumps({"filename": filename, "content": content}).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+
+        if self.gzip_uploads and len(body) >= self.GZIP_MIN_BYTES:
+            compressed = gzip.compress(body)
+            response = self.session.post(
+                f"{self.worker_url}/upload",
+                data=compressed,
+                headers={**headers, "Content-Encoding": "gzip"},
+                timeout=timeout(self.timeout_seconds)
+            )
+            if response.status_code not in self.GZIP_REJECTED_STATUSES:
+                self._count_bytes("up", len(body), len(compressed))
+                return response
+            with self._state_lock:
+                self.transfer_stats["rejected_up"] += len(compressed)
+            print(f"[Sync] Gzip upload rejected ({response.status_code}), retrying uncompressed")
+            response = self._post_plain(body, headers)
+            if response.status_code < 400:
+                print("[Sync] Worker doesn't accept gzip, uploading uncompressed from now on")
+                self.gzip_uploads = False
+            return response
+
+        return self._post_plain(body, headers)
+
+    def _post_plain(self, body: bytes, headers: Dict[str, str]):
+        response = self.session.post(
+            f"{self.worker_url}/upload",
+            data=body,
+            headers=headers,
+            timeout=timeout(self.timeout_seconds)
+        )
+        self._count_bytes("up", len(body), len(body))
+        return response
+
     def download_file(self, filename: str) -> bool:
         """Download single file from R2."""
         if not self.enabled:
             return True
 
         try:
-            response = requests.get(
+            # The session advertises Accept-Encoding: gzip and decodes transparently
+            response = self.session.get(
                 f"{self.worker_url}/download/{filename}",
-                timeout=10
+                timeout=timeout(self.timeout_seconds)
             )
 
             if response.status_code == 200:
-                file_path = self.data_dir / filename
+                self._count_response(response)
+                base_json = self._load_base(filename)
 
                 if filename == "tasks.json":
                     # Completed-state-wins merge: preserve local completions
-                    local_json = file_path.read_text() if file_path.exists() else None
+                    local_json = self._read_local(filename)
                     cloud_json = response.text
                     if local_json:
                         try:
-                            merged = self._merge_tasks(local_json, cloud_json)
-                            file_path.write_text(merged)
+                            merged = self._merge_tasks(local_json, cloud_json, base_json)
+                            written = self._write_local(filename, merged)
                             print(f"[Sync] ✓ Downloaded {filename} (with completion merge)")
                         except Exception as merge_err:
                             # If merge fails, fall back to plain overwrite
                             print(f"[Sync] Merge failed ({merge_err}), using cloud version")
-                            file_path.write_text(cloud_json)
+                            written = self._write_local(filename, cloud_json)
                     else:
-                        file_path.write_text(cloud_json)
+                        written = self._write_local(filename, cloud_json)
                         print(f"[Sync] ✓ Downloaded {filename}")
                 elif filename == "recurring.json":
                     # Template-union merge: keep templates from both sides,
                     # deduplicated by text. last_applied_date takes the max so a
                     # task applied on one machine won't re-fire on another.
-                    local_json = file_path.read_text() if file_path.exists() else None
+                    local_json = self._read_local(filename)
                     cloud_json = response.text
                     if local_json:
                         try:
-                            merged = self._merge_recurring(local_json, cloud_json)
-                            file_path.write_text(merged)
+                            merged = self._merge_recurring(local_json, cloud_json, base_json)
+                            written = self._write_local(filename, merged)
                             print(f"[Sync] ✓ Downloaded {filename} (with template merge)")
                         except Exception as merge_err:
                             print(f"[Sync] Recurring merge failed ({merge_err}), using cloud version")
-                            file_path.write_text(cloud_json)
+                            written = self._write_local(filename, cloud_json)
                     else:
-                        file_path.write_text(cloud_json)
+                        written = self._write_local(filename, cloud_json)
                         print(f"[Sync] ✓ Downloaded {filename}")
                 elif filename == "bills.json":
                     # Paid-state-wins merge: preserve local paid status
-                    local_json = file_path.read_text() if file_path.exists() else None
+                    local_json = self._read_local(filename)
                     cloud_json = response.text
                     if local_json:
                         try:
-                            merged = self._merge_bills(local_json, cloud_json)
-                            file_path.write_text(merged)
+                            merged = self._merge_bills(local_json, cloud_json, base_json)
+                            written = self._write_local(filename, merged)
                             print(f"[Sync] ✓ Downloaded {filename} (with paid-state merge)")
                         except Exception as merge_err:
                             print(f"[Sync] Bills merge failed ({merge_err}), using cloud version")
-                            file_path.write_text(cloud_json)
+                            written = self._write_local(filename, cloud_json)
                     else:
-                        file_path.write_text(cloud_json)
+                        written = self._write_local(filename, cloud_json)
                         print(f"[Sync] ✓ Downloaded {filename}")
+                elif filename in self.LOG_FILES:
+                    # Record union: never drop history that only exists locally
+                    local_json = self._read_local(filename)
+                    merged = self._merge_content(filename, local_json, response.text)
+                    written = self._write_local(filename, merged)
+                    print(f"[Sync] ✓ Downloaded {filename}" + (" (with record merge)" if local_json else ""))
                 else:
-                    file_path.write_text(response.text)
+                    written = self._write_local(filename, response.text)
                     print(f"[Sync] ✓ Downloaded {filename}")
 
+                # Only a copy that reached disk (or the stage) may become the sync base
+                if written:
+                    self._record_remote(filename, response.text)
                 return True
             elif response.status_code == 404:
+                self._record_remote(filename, None)
                 print(f"[Sync] ⊘ {filename} not in cloud (skipping)")
                 return True
             else:
@@ -140,13 +397,148 @@ class CloudflareSync:
             print(f"[Sync] Error downloading {filename}: {e}")
             return False
 
-    def _merge_tasks(self, local_json: str, cloud_json: str) -> str:
+    def _read_local(self, filename: str) -> Optional[str]:
+        """Local text of filename — the staged version if one is pending."""
+        with self._state_lock:
+            if self._staged is not None and filename in self._staged:
+                return self._staged[filename]
+        file_path = self.data_dir / filename
+        text = file_path.read_text() if file_path.exists() else None
+        self._note_read(filename, text)
+        return text
+
+    def _note_read(self, filename: str, text: Optional[str]):
+        """While staging, remember what the file held when the sync first saw it."""
+        with self._state_lock:
+            if self._staged is not None and filename not in self._read_hashes:
+                self._read_hashes[filename] = None if text is None else content_hash(text)
+
+    def _write_local(self, filename: str, text: str) -> bool:
+        """Write a downloaded/merged file, or stage it while a background sync runs.
+
+        Returns:
+            False if the sync was cancelled and nothing was written
+        """
+        if self.cancel_event.is_set():
+            return False  # a cancelled sync must not touch local files
+        if self._staged is not None:
+            if filename not in self._read_hashes:
+                file_path = self.data_dir / filename
+                self._note_read(filename, file_path.read_text() if file_path.exists() else None)
+            with self._state_lock:
+                if self._staged is not None:
+                    self._staged[filename] = text
+            return True
+        self._write_atomic(self.data_dir / filename, text)
+        return True
+
+    def begin_staging(self):
+        """Hold downloads in memory until commit_staged() / discard_staged().
+
+        Lets a sync run on a worker thread while the UI keeps reading and
+        writing the real files; the results land on disk in one step.
+        """
+        with self._state_lock:
+            self._staged = {}
+            self._staged_appends = {}
+            self._read_hashes = {}
+            self._hashes_before = dict(self.remote_hashes)
+        self.cancel_event.clear()
+
+    def commit_staged(self) -> List[str]:
+        """Write every staged file to disk. Call from the UI thread.
+
+        A file that changed on disk since the sync read it (the user edited
+        during the sync) is left alone; its sync base is dropped so the next
+        sync merges the two versions instead of overwriting either.
+
+        Returns:
+            Filenames whose contents were actually replaced.
+        """
+        with self._state_lock:
+            staged, read_hashes = self._staged or {}, self._read_hashes
+            appends = self._staged_appends
+            self._staged = None
+            self._staged_appends = {}
+
+        written = []
+        for filename, text in staged.items():
+            file_path = self.data_dir / filename
+            current = file_path.read_text() if file_path.exists() else None
+            if (None if current is None else content_hash(current)) != read_hashes.get(filename):
+                print(f"[Sync] {filename} changed during sync — keeping local copy for next sync")
+                self.remote_hashes.pop(filename, None)
+                # Local edits were made on top of the old base; keep it for the next merge
+                self._pending_bases.pop(filename, None)
+                continue
+            if text != current:
+                self._write_atomic(file_path, text)
+                written.append(filename)
+
+        # Log appends never conflict with local edits — just apply them
+        for filename, args in appends.items():
+            if self._apply_log_append(filename, *args):
+                written.append(filename)
+
+        self.local_manifest = self.build_local_manifest()
+        self._save_sync_state()
+        return written
+
+    def discard_staged(self):
+        """Drop staged downloads (sync cancelled or failed); nothing touches disk."""
+        with self._state_lock:
+            self._staged = None
+            self._staged_appends = {}
+            self._pending_bases = {}
+            # Bases recorded for unapplied downloads would be wrong — roll them back
+            self.remote_hashes = self._hashes_before
+
+    def cancel(self):
+        """Ask a running sync to stop before its next transfer."""
+        self.cancel_event.set()
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        """Write via a temp file + rename so readers never see a half-written file."""
+        tmp_path = path.with_name(path.name + ".sync-tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+
+    def _merge_content(self, filename: str, local_json: Optional[str], cloud_json: str) -> str:
+        """Merged text for filename, using the same strategy as download_file.
+
+        Files without a merge strategy (or with no local copy) take the cloud
+        version. A failed merge also falls back to the cloud version.
+        """
+        mergers = {
+            "tasks.json": self._merge_tasks,
+            "bills.json": self._merge_bills,
+            "recurring.json": self._merge_recurring,
+            **{name: self._merge_log for name in self.LOG_FILES},
+        }
+        merge = mergers.get(filename)
+        if merge is None or not local_json:
+            return cloud_json
+        try:
+            if filename in self.THREE_WAY_FILES:
+                return merge(local_json, cloud_json, self._load_base(filename))
+            return merge(local_json, cloud_json)
+        except Exception as merge_err:
+            print(f"[Sync] Merge failed for {filename} ({merge_err}), using cloud version")
+            return cloud_json
+
+    def _merge_tasks(self, local_json: str, cloud_json: str, base_json: Optional[str] = None) -> str:
         """Merge local and cloud tasks.json with completed-state-wins logic.
 
-        Cloud structure wins (task order, new tasks from cloud appear).
-        But if a task exists in both local and cloud (matched by text),
-        completed=True if EITHER version has it done.
+        With a base (the last synced copy) this is a three-way merge — see
+        _merge_tasks_3way. Without one (first sync) it falls back to the
+        two-way merge: cloud structure wins (task order, new tasks from cloud
+        appear), but if a task exists in both local and cloud (matched by
+        text), completed=True if EITHER version has it done.
         """
+        if base_json:
+            return self._merge_tasks_3way(local_json, cloud_json, base_json)
+
         local = json.loads(local_json)
         cloud = json.loads(cloud_json)
 
@@ -170,29 +562,79 @@ class CloudflareSync:
 
         return json.dumps(cloud, indent=2)
 
+    @staticmethod
+    def _task_locations(doc: Dict) -> List[Tuple[str, Dict]]:
+        """(location, task) pairs for every task in a tasks.json document."""
+        entries = [("planning", t) for t in doc.get("planning", {}).get("tasks", [])]
+        for i, block in enumerate(doc.get("blocks", [])):
+            entries += [(f"block:{i}", t) for t in block.get("tasks", [])]
+        entries += [("queue", t) for t in doc.get("queue", [])]
+        return entries
+
+    @staticmethod
+    def _resolve_task_conflict(field: str, local, cloud):
+        """Both sides changed a task field: done stays done, counters take the max."""
+        if field == "completed":
+            return local or cloud
+        if field in ("completed_at", "times_queued", "blocks_escalated"):
+            return max(v for v in (local, cloud) if v is not None)
+        return cloud
+
+    def _merge_tasks_3way(self, local_json: str, cloud_json: str, base_json: str) -> str:
+        """Three-way merge of tasks.json against the last synced copy.
+
+        Tasks are identified by id, so a renamed task is still the same task,
+        one moved to another block moves, and one deleted on either side stays
+        deleted unless the other side edited it. Copies written before tasks
+        had ids get the same deterministic id the loader assigns on migration.
+        """
+        base, local, cloud = (json.loads(t) for t in (base_json, local_json, cloud_json))
+        located = [self._task_locations(doc) for doc in (base, local, cloud)]
+
+        def key(task: Dict) -> str:
+            return task.get("id") or Task.legacy_id(task)
+
+        merged = merge3(*located, key=key, resolve=self._resolve_task_conflict)
+
+        result = dict(cloud)
+        for field in set(local) - {"planning", "blocks", "queue"}:
+            # e.g. current_day_date — whichever side moved it on wins
+            if local.get(field) != base.get(field) and cloud.get(field) == base.get(field):
+                result[field] = local[field]
+        result["planning"] = dict(cloud.get("planning", local.get("planning", {"name": "Planning"})))
+        result["planning"]["tasks"] = merged.get("planning", [])
+        blocks = cloud.get("blocks") or local.get("blocks", [])
+        result["blocks"] = [dict(block, tasks=merged.get(f"block:{i}", [])) for i, block in enumerate(blocks)]
+        result["queue"] = merged.get("queue", [])
+        return json.dumps(result, indent=2)
+
     def _merge_task_list(self, local_tasks: list, cloud_tasks: list) -> list:
         """Merge two task lists: cloud is the base, local completed state wins.
 
-        Tasks are matched by text. If a task is marked completed on local
-        but not on cloud, it stays completed in the merged result.
-        Local-only tasks (not present in cloud) are appended so nothing is lost.
+        Tasks are matched by id (the migration id for copies without one).
+        If a task is marked completed on local but not on cloud, it stays
+        completed in the merged result. Local-only tasks (not present in
+        cloud) are appended so nothing is lost.
         """
-        # Build lookup from local: text → task dict
-        local_by_text = {t["text"]: t for t in local_tasks if t.get("text")}
+        def key(task: Dict) -> str:
+            return task.get("id") or Task.legacy_id(task)
+
+        # Build lookup from local: id → task dict
+        local_by_key = {key(t): t for t in local_tasks if t.get("text")}
 
         merged = []
-        seen_texts = set()
+        seen_keys = set()
 
         for task in cloud_tasks:
-            text = task.get("text", "")
-            # Deduplicate: if we've already added a task with this text
+            k = key(task)
+            # Deduplicate: if we've already added this task
             # (from cloud or a previous iteration), skip the duplicate.
-            if text in seen_texts:
-                print(f"[Sync] Deduplicated cloud task: '{text[:40]}'")
+            if k in seen_keys:
+                print(f"[Sync] Deduplicated cloud task: '{task.get('text', '')[:40]}'")
                 continue
-            seen_texts.add(text)
-            if text in local_by_text:
-                local_task = local_by_text[text]
+            seen_keys.add(k)
+            if k in local_by_key:
+                local_task = local_by_key[k]
                 # completed-state-wins: once done, stays done
                 if local_task.get("completed") and not task.get("completed"):
                     task = dict(task)  # don't mutate original
@@ -202,24 +644,36 @@ class CloudflareSync:
 
         # Append any local tasks that don't exist in cloud (would otherwise be lost)
         for task in local_tasks:
-            text = task.get("text", "")
-            if text and text not in seen_texts:
+            if task.get("text") and key(task) not in seen_keys:
                 merged.append(task)
-                print(f"[Sync] Preserved local-only task: '{text[:40]}'")
+                print(f"[Sync] Preserved local-only task: '{task['text'][:40]}'")
 
         return merged
 
-    def _merge_bills(self, local_json: str, cloud_json: str) -> str:
+    def _merge_bills(self, local_json: str, cloud_json: str, base_json: Optional[str] = None) -> str:
         """Merge local and cloud bills.json with paid-state-wins logic.
 
         Cloud structure wins (bill order, new bills from cloud appear).
         But if a bill exists in both local and cloud (matched by id),
         paid_this_month=True if EITHER version has it marked paid.
-        Local-only bills (not in cloud) are preserved.
+        Local-only bills (not in cloud) are preserved. With a base, bills
+        are merged three ways instead, so deletions and edits stick.
         """
         local = json.loads(local_json)
         cloud = json.loads(cloud_json)
 
+        if base_json:
+            base = json.loads(base_json)
+            merged = merge3(
+                *[[("", b) for b in doc.get("bills", [])] for doc in (base, local, cloud)],
+                key=lambda b: b.get("id") or b.get("name", ""),
+                resolve=self._resolve_bill_conflict
+            )
+            cloud["bills"] = merged.get("", [])
+            cloud["last_reset_month"] = max(local.get("last_reset_month", ""),
+                                            cloud.get("last_reset_month", ""))
+            return json.dumps(cloud, indent=2)
+
         # Build lookup from local bills by ID
         local_by_id = {b["id"]: b for b in local.get("bills", []) if b.get("id")}
 
@@ -254,16 +708,38 @@ class CloudflareSync:
 
         return json.dumps(cloud, indent=2)
 
-    def _merge_recurring(self, local_json: str, cloud_json: str) -> str:
+    @staticmethod
+    def _resolve_bill_conflict(field: str, local, cloud):
+        """Both sides changed a bill field: paid stays paid, latest paid month wins."""
+        if field == "paid_this_month":
+            return local or cloud
+        if field == "last_paid_month":
+            return max(local or "", cloud or "") or None
+        return cloud
+
+    def _merge_recurring(self, local_json: str, cloud_json: str, base_json: Optional[str] = None) -> str:
         """Merge recurring task templates: union of both sides, deduplicated by text.
 
         Templates are matched by text. If both sides have the same template,
         last_applied_date takes the max so a task applied on one machine won't
-        re-fire on another. Local-only templates are always preserved.
+        re-fire on another. Local-only templates are always preserved — unless
+        there is a base, in which case the merge is three-way and a template
+        deleted on one side stays deleted; a field both sides changed takes
+        the cloud value, as in the task and bill merges.
         """
         local_templates = json.loads(local_json) if local_json else []
         cloud_templates = json.loads(cloud_json) if cloud_json else []
 
+        if base_json:
+            merged = merge3(
+                *[[("", t) for t in doc] for doc in (json.loads(base_json), local_templates, cloud_templates)],
+                key=lambda t: t.get("text", ""),
+                resolve=lambda field, local, cloud: (
+                    max(local or "", cloud or "") if field == "last_applied_date" else cloud
+                )
+            )
+            return json.dumps(merged.get("", []), indent=2)
+
         # Build lookup from cloud by text
         cloud_by_text = {t["text"]: t for t in cloud_templates if t.get("text")}
 
@@ -295,18 +771,223 @@ class CloudflareSync:
 
         return json.dumps(merged, indent=2)
 
+    @staticmethod
+    def _record_key(record: Dict) -> str:
+        """Identity of a log record: its content (records carry no id field)."""
+        return content_hash(json.dumps(record, sort_keys=True, ensure_ascii=False))[:16]
+
+    @staticmethod
+    def _parse_records(data: bytes) -> List[Dict]:
+        """JSONL bytes → records, skipping blank or unreadable lines."""
+        records = []
+        for line in data.decode("utf-8").splitlines():
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass
+        return records
+
+    def _merge_log(self, local_text: str, cloud_text: str) -> str:
+        """Union of two copies of a log: cloud order, then records only local has."""
+        cloud = self._parse_records(cloud_text.encode("utf-8"))
+        seen = {self._record_key(r) for r in cloud}
+        merged = cloud + [r for r in self._parse_records(local_text.encode("utf-8"))
+                          if self._record_key(r) not in seen]
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in merged)
+
+    def _read_log_tail(self, filename: str, offset: int) -> Tuple[List[Dict], int, bool]:
+        """Complete local records from byte offset on.
+
+        Returns (records, end offset, reset) — reset is True when the file is
+        shorter than offset (replaced) and was read from the start instead.
+        A torn final line is left for next time.
+        """
+        file_path = self.data_dir / filename
+        if not file_path.exists():
+            return [], 0, offset > 0
+        with open(file_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            reset = offset > size
+            start = 0 if reset else offset
+            f.seek(start)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        return self._parse_records(data[:end]), start + end, reset
+
+    def _local_log_keys(self, filename: str) -> Set[str]:
+        """Keys of every record in the local log (only needed after a reset)."""
+        records, _, _ = self._read_log_tail(filename, 0)
+        return {self._record_key(r) for r in records}
+
+    def _fetch_log_tail(self, filename: str, offset: int) -> Optional[Tuple[List[Dict], int, bool]]:
+        """GET /log/<filename>?offset= → (records, remote size, reset), None on error."""
+        try:
+            response = self.session.get(
+                f"{self.worker_url}/log/{filename}",
+                params={"offset": offset},
+                timeout=timeout(self.timeout_seconds)
+            )
+            if response.status_code != 200:
+                print(f"[Sync] ✗ Log tail failed for {filename}: {response.status_code}")
+                return None
+            self._count_response(response)
+            size = int(response.headers.get("X-Log-Size", 0))
+            start = int(response.headers.get("X-Log-Offset", offset))
+            return self._parse_records(response.content), size, start != offset
+        except Exception as e:
+            print(f"[Sync] Error fetching log tail for {filename}: {e}")
+            return None
+
+    def _append_remote_log(self, filename: str, records: List[Dict],
+                           expected_size: int) -> Optional[int]:
+        """POST new records to /log/<filename>.
+
+        Returns the new remote size, -1 if the log grew since it was read
+        (caller re-reads and retries), or None on error.
+        """
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        body = json.dumps({"expected_size": expected_size, "lines": lines}).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        wire = body
+        if len(body) >= self.GZIP_MIN_BYTES:
+            wire = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            response = self.session.post(
+                f"{self.worker_url}/log/{filename}",
+                data=wire,
+                headers=headers,
+                timeout=timeout(self.timeout_seconds)
+            )
+            self._count_bytes("up", len(body), len(wire))
+            if response.status_code == 409:
+                return -1
+            if response.status_code == 200:
+                return int(response.json()["size"])
+            print(f"[Sync] ✗ Log append failed for {filename}: {response.status_code}")
+        except Exception as e:
+            print(f"[Sync] Error appending to {filename}: {e}")
+        return None
+
+    def sync_log(self, filename: str, remote_size: Optional[int] = None,
+                 push: bool = True) -> Optional[bool]:
+        """Incrementally sync one append-only log.
+
+        Only records past the last synced offsets move: the remote tail is
+        fetched, local records the cloud lacks are appended to it, and remote
+        records the local file lacks are appended locally. Records are matched
+        by content, so a record never appears twice. Cost scales with new
+        activity, not with total history.
+
+        Args:
+            filename: One of LOG_FILES
+            remote_size: Remote size from the manifest, if known — when neither
+                side has grown, no request is made at all
+            push: Upload local records too (False for a download-only sync)
+
+        Returns:
+            True on success, None if there was nothing to do, False on error
+        """
+        state = self.log_state.get(filename, {"local": 0, "remote": 0, "pulled": []})
+        file_path = self.data_dir / filename
+        local_size = file_path.stat().st_size if file_path.exists() else 0
+        if remote_size == state["remote"] and local_size == state["local"]:
+            return None
+
+        for _ in range(3):
+            tail = self._fetch_log_tail(filename, state["remote"])
+            if tail is None:
+                return False
+            remote_records, remote_end, remote_reset = tail
+            local_records, local_end, local_reset = self._read_log_tail(filename, state["local"])
+
+            local_keys = {self._record_key(r) for r in local_records}
+            if remote_reset or local_reset:
+                local_keys |= self._local_log_keys(filename)
+            # Pulled last time but still past the local offset — already in the cloud
+            already_remote = set(state["pulled"])
+            remote_keys = {self._record_key(r) for r in remote_records} | already_remote
+
+            pull = [r for r in remote_records if self._record_key(r) not in local_keys]
+            unpushed = [r for r in local_records if self._record_key(r) not in remote_keys]
+            to_push = unpushed if push else []
+
+            new_remote = remote_end
+            if to_push:
+                new_remote = self._append_remote_log(filename, to_push, remote_end)
+                if new_remote is None:
+                    return False
+                if new_remote == -1:
+                    continue  # another machine appended first — re-read its tail
+            break
+        else:
+            print(f"[Sync] ✗ {filename} kept changing during sync")
+            return False
+
+        print(f"[Sync] ✓ {filename}: {len(to_push)} record(s) up, {len(pull)} down")
+        read_end, still_pulled = local_end, []
+        if unpushed and not push:
+            # Download only: leave the local offset before the records the cloud
+            # lacks so the next full sync uploads them
+            read_end = 0 if local_reset else state["local"]
+            still_pulled = [] if local_reset else state["pulled"]
+        args = (pull, read_end, new_remote, still_pulled)
+        if self._staged is not None:
+            with self._state_lock:
+                self._staged_appends[filename] = args
+        elif not self.cancel_event.is_set():
+            self._apply_log_append(filename, *args)
+        return True
+
+    def _apply_log_append(self, filename: str, records: List[Dict],
+                          read_end: int, remote_end: int, still_pulled: List[str] = ()) -> bool:
+        """Append pulled records locally and advance the log's sync offsets.
+
+        If the log grew since it was read (a Start New Day during the sync),
+        or holds records a download-only sync didn't push, the local offset
+        stays at read_end so those records go up next time; the pulled
+        records then sit past the offset, so their keys (plus still_pulled,
+        earlier pulls past the same offset) are kept to stop them being
+        pushed back. Returns True if the file changed.
+        """
+        file_path = self.data_dir / filename
+        size_now = file_path.stat().st_size if file_path.exists() else 0
+        untouched = size_now == read_end
+
+        if records:
+            AppendLog(file_path).extend(records)
+        new_local = file_path.stat().st_size if (untouched and file_path.exists()) else read_end
+        with self._state_lock:
+            self.log_state[filename] = {
+                "local": new_local,
+                "remote": remote_end,
+                "pulled": [] if untouched else list(still_pulled) + [self._record_key(r) for r in records],
+            }
+        return bool(records)
+
+    def _tail_logs(self) -> List[str]:
+        """Logs to sync incrementally — all of them if the Worker supports /log."""
+        if "log" not in self.remote_features:
+            return []
+        return [f for f in self.LOG_FILES if f in self.sync_files]
+
     def upload_all(self) -> Dict[str, int]:
         """Upload all data files to R2."""
         print("[Sync] Starting upload...")
         results = {"success": 0, "failed": 0, "skipped": 0}
 
+        to_upload = []
         for filename in self.sync_files:
-            if self.upload_file(filename):
-                results["success"] += 1
+            if self.has_local_changes(filename):
+                to_upload.append(filename)
             else:
-                results["failed"] += 1
+                results["skipped"] += 1
 
-        print(f"[Sync] Upload complete: {results['success']} succeeded, {results['failed']} failed")
+        self._transfer_all(to_upload, self.upload_file, results)
+        self._save_sync_state()
+        print(f"[Sync] Upload complete: {results['success']} succeeded, "
+              f"{results['failed']} failed, {results['skipped']} unchanged")
         return results
 
     def download_all(self) -> Dict[str, int]:
@@ -318,15 +999,56 @@ class CloudflareSync:
         print("[Sync] Starting download...")
         results = {"success": 0, "failed": 0, "skipped": 0}
 
-        for filename in self.sync_files:
-            if self.download_file(filename):
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-
+        # The manifest tells us whether logs can be pulled incrementally
+        remote = self.fetch_remote_manifest() or {}
+        logs = self._tail_logs()
+        self._transfer_all(
+            logs,
+            lambda f: self.sync_log(f, remote.get(f, {}).get("size", 0), push=False),
+            results
+        )
+        self._transfer_all([f for f in self.sync_files if f not in logs], self.download_file, results)
+        self._save_sync_state()
         print(f"[Sync] Download complete: {results['success']} succeeded, {results['failed']} failed")
         return results
 
+    def _transfer_all(self, filenames: List[str], transfer: Callable[[str], bool],
+                      results: Dict[str, int]):
+        """Run transfer(filename) for each file, tallying into results.
+
+        ORDERED_FILES go first, sequentially. The rest run concurrently on a
+        bounded pool — each touches only its own file (merges read and write
+        just that file), so they don't contend with each other.
+        """
+        def tally(ok: Optional[bool]):
+            results["skipped" if ok is None else "success" if ok else "failed"] += 1
+
+        # transfer() may return None for "nothing to do" (counted as skipped)
+        def run(filename: str) -> Optional[bool]:
+            if self.cancel_event.is_set():
+                return None
+            ok = transfer(filename)
+            if self.on_progress and ok is not None:
+                self.on_progress(filename, ok)
+            return ok
+
+        ordered = [f for f in self.ORDERED_FILES if f in filenames]
+        parallel = [f for f in filenames if f not in self.ORDERED_FILES]
+
+        for filename in ordered:
+            tally(run(filename))
+
+        if not parallel:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sync") as pool:
+            futures = {pool.submit(run, f): f for f in parallel}
+            for future in as_completed(futures):
+                try:
+                    tally(future.result())
+                except Exception as e:
+                    print(f"[Sync] Error transferring {futures[future]}: {e}")
+                    tally(False)
+
     def sync(self) -> bool:
         """
         Full sync: upload local changes, then download cloud updates.
@@ -342,25 +1064,219 @@ class CloudflareSync:
 
         print("[Sync] ═══ Starting full sync ═══")
 
-        # Upload first (push local changes)
-        upload_results = self.upload_all()
-
-        # Then download (pull cloud updates)
-        download_results = self.download_all()
-
-        success = (upload_results["failed"] == 0 and download_results["failed"] == 0)
+        results = self.sync_bundle() if self.use_bundle else None
+        if results is None:
+            results = self.delta_sync()
+        if results is not None:
+            success = results["failed"] == 0
+        else:
+            # Worker without /manifest — fall back to upload all, then download all
+            upload_results = self.upload_all()
+            download_results = self.download_all()
+            success = (upload_results["failed"] == 0 and download_results["failed"] == 0)
 
-        if success:
+        print(f"[Sync] Transferred this session: {self.transfer_summary()}")
+        if self.cancel_event.is_set():
+            print("[Sync] ═══ Sync cancelled ═══")
+        elif success:
             print("[Sync] ═══ Sync complete ✓ ═══")
         else:
             print("[Sync] ═══ Sync completed with errors ✗ ═══")
 
         return success
 
+    def delta_sync(self) -> Optional[Dict[str, int]]:
+        """Transfer only the files whose content differs between local and cloud.
+
+        Compares the local manifest, the Worker's /manifest and the hash each
+        file had at the last sync (the common base):
+          - same on both sides            → nothing to do
+          - only local changed            → upload
+          - only cloud changed            → download (with the usual merge)
+          - both changed, mergeable file  → download + merge, then upload the result
+          - both changed, other files     → upload (local wins, as in a full sync)
+        A sync with no changes costs just the manifest request.
+
+        Returns:
+            Results dict like upload_all, or None if the Worker has no manifest.
+        """
+        remote = self.fetch_remote_manifest()
+        if remote is None:
+            return None
+
+        logs = self._tail_logs()
+        files = [f for f in self.sync_files if f not in logs]
+        local = self.build_local_manifest(files)
+        plan = {"upload": [], "download": [], "merge": []}
+        for filename in files:
+            action = self._plan_file(
+                filename,
+                local.get(filename, {}).get("hash"),
+                remote.get(filename, {}).get("hash"),
+                filename in remote,
+            )
+            if action:
+                plan[action].append(filename)
+        uploads, downloads, merges = plan["upload"], plan["download"], plan["merge"]
+
+        results = {"success": 0, "failed": 0, "skipped": 0}
+        results["skipped"] = len(files) - len(uploads) - len(downloads) - len(merges)
+        print(f"[Sync] Delta: {len(uploads)} up, {len(downloads)} down, "
+              f"{len(merges)} merge, {results['skipped']} unchanged"
+              + (f", {len(logs)} log(s) by tail" if logs else ""))
+
+        self._transfer_all(
+            logs, lambda f: self.sync_log(f, remote.get(f, {}).get("size", 0)), results
+        )
+        self._transfer_all(uploads, self.upload_file, results)
+        self._transfer_all(downloads, self.download_file, results)
+        self._transfer_all(merges, self._download_merge_upload, results)
+
+        self.local_manifest = self.build_local_manifest(files)
+        self._save_sync_state()
+        return results
+
+    def _plan_file(self, filename: str, local_hash: Optional[str],
+                   remote_hash: Optional[str], in_remote: bool) -> Optional[str]:
+        """Decide what a sync must do with one file.
+
+        Returns "upload", "download", "merge", or None when both sides already
+        match (or neither side has the file).
+        """
+        base_hash = self.remote_hashes.get(filename)
+        if local_hash is None and not in_remote:
+            return None
+        if local_hash is not None and local_hash == remote_hash:
+            with self._state_lock:
+                self.remote_hashes[filename] = remote_hash
+            return None
+        if not in_remote:
+            return "upload"
+        if local_hash is None or local_hash == base_hash:
+            # Untouched locally (remote hash may be unknown for pre-manifest uploads)
+            return "download"
+        if remote_hash is not None and remote_hash == base_hash:
+            return "upload"
+        if filename in self.MERGEABLE_FILES:
+            return "merge"
+        return "upload"
+
+    def _download_merge_upload(self, filename: str) -> bool:
+        """Pull and merge a file both sides changed, then push the merged result."""
+        return self.download_file(filename) and self.upload_file(filename)
+
+    def sync_bundle(self) -> Optional[Dict[str, int]]:
+        """Sync every file in at most two requests via the Worker's /bundle routes.
+
+        Downloads all cloud files in one gzipped payload, plans each file the
+        same way delta_sync does, runs the usual merges in memory, writes each
+        changed local file once, then uploads everything the cloud is missing
+        in one more payload. Round trips, not bytes, dominate sync time on
+        high-latency links, so this beats per-file requests there.
+
+        Returns:
+            Results dict like upload_all, or None if the Worker has no bundle routes.
+        """
+        cloud = self.download_bundle()
+        if cloud is None:
+            return None
+
+        results = {"success": 0, "failed": 0, "skipped": 0}
+        writes: Dict[str, str] = {}
+        to_upload: Dict[str, str] = {}
+        downloaded: Dict[str, str] = {}
+
+        for filename in self.sync_files:
+            local_text = self._read_local(filename)
+            cloud_text = cloud.get(filename)
+            action = self._plan_file(
+                filename,
+                None if local_text is None else content_hash(local_text),
+                None if cloud_text is None else content_hash(cloud_text),
+                cloud_text is not None,
+            )
+
+            if action is None:
+                results["skipped"] += 1
+            elif action == "upload":
+                to_upload[filename] = local_text
+            else:
+                merged = self._merge_content(filename, local_text, cloud_text)
+                downloaded[filename] = cloud_text
+                if merged != local_text:
+                    writes[filename] = merged
+                if action == "merge":
+                    to_upload[filename] = merged
+
+        print(f"[Sync] Bundle: {len(to_upload)} up, {len(writes)} local write(s), "
+              f"{results['skipped']} unchanged")
+        if self.cancel_event.is_set():
+            return results
+
+        written = {f for f, text in writes.items() if self._write_local(f, text)}
+        for filename, text in downloaded.items():
+            if filename in writes and filename not in written:
+                continue  # cancelled before the merged copy was written
+            self._record_remote(filename, text)
+            if filename not in to_upload:
+                results["success"] += 1
+                if self.on_progress:
+                    self.on_progress(filename, True)
+
+        if to_upload:
+            ok = self.upload_bundle(to_upload)
+            for filename, text in to_upload.items():
+                if ok:
+                    self._record_remote(filename, text)
+                if self.on_progress:
+                    self.on_progress(filename, ok)
+            results["success" if ok else "failed"] += len(to_upload)
+
+        self.local_manifest = self.build_local_manifest()
+        self._save_sync_state()
+        return results
+
+    def download_bundle(self) -> Optional[Dict[str, str]]:
+        """GET /bundle/download → {filename: content}. None if unavailable."""
+        try:
+            response = self.session.get(
+                f"{self.worker_url}/bundle/download", timeout=timeout(self.timeout_seconds)
+            )
+            if response.status_code == 200:
+                raw = gzip.decompress(response.content)
+                self._count_bytes("down", len(raw), len(response.content))
+                payload = json.loads(raw.decode("utf-8"))
+                return {name: entry["content"] for name, entry in payload.get("files", {}).items()
+                        if name in self.sync_files}
+            print(f"[Sync] Bundle download unavailable ({response.status_code})")
+        except Exception as e:
+            print(f"[Sync] Error downloading bundle: {e}")
+        return None
+
+    def upload_bundle(self, files: Dict[str, str]) -> bool:
+        """POST several files to /bundle/upload as one gzipped payload."""
+        try:
+            raw = json.dumps({"files": files}).encode("utf-8")
+            body = gzip.compress(raw)
+            self._count_bytes("up", len(raw), len(body))
+            response = self.session.post(
+                f"{self.worker_url}/bundle/upload",
+                data=body,
+                headers={"Content-Type": "application/gzip"},
+                timeout=timeout(self.timeout_seconds)
+            )
+            if response.status_code == 200:
+                print(f"[Sync] ✓ Uploaded bundle: {', '.join(files)}")
+                return True
+            print(f"[Sync] ✗ Bundle upload failed: {response.status_code}")
+        except Exception as e:
+            print(f"[Sync] Error uploading bundle: {e}")
+        return False
+
     def test_connection(self) -> bool:
         """Test connection to Worker."""
         try:
-            response = requests.get(f"{self.worker_url}/list", timeout=5)
+            response = self.session.get(f"{self.worker_url}/list", timeout=timeout(5))
             return response.status_code == 200
         except:
             return False
@@ -0,0 +1,56 @@
+"""Shared keep-alive HTTP session for Voice Monkey and Cloudflare sync."""
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+# Connect timeout is short (a dead host should fail fast); read timeout is per call
+CONNECT_TIMEOUT = 3.05
+
+# Hosts with a kept-alive pool (Voice Monkey + the sync Worker, with headroom)
+POOL_CONNECTIONS = 4
+# Connections kept per host; pool_block makes this a hard per-host limit
+POOL_MAXSIZE = 4
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """Return the process-wide pooled session, creating it on first use.
+
+    Reusing one session means repeat requests to the same host skip the
+    TCP + TLS handshake. requests is imported here rather than at module
+    level: it is the slowest import in the app, and headless commands that
+    never touch the network shouldn't pay for it.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                pool_block=True
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def timeout(read_seconds: float):
+    """Build a (connect, read) timeout tuple for requests."""
+    return (min(CONNECT_TIMEOUT, read_seconds), read_seconds)
+
+
+def close_session():
+    """Close pooled connections (e.g. on app exit)."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,138 @@
+"""Three-way merge of keyed records against the last synced version (the base)."""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A record and where it lives, e.g. ("block:2", {...task...}) or ("", {...bill...})
+Entry = Tuple[str, Dict]
+
+# Picks a value when both sides changed the same field: (field, local, cloud) -> value
+Resolver = Callable[[str, Any, Any], Any]
+
+_MISSING = object()
+
+
+def merge3(
+    base: List[Entry],
+    local: List[Entry],
+    cloud: List[Entry],
+    key: Callable[[Dict], str],
+    resolve: Optional[Resolver] = None
+) -> Dict[str, List[Dict]]:
+    """Merge two edited copies of a collection against their common base.
+
+    Each side's change since the base wins over the other side's non-change,
+    so deletions stick, edits (including renames of a record whose key is
+    not its text) carry over, and moves between locations follow whichever
+    side made them. When both sides changed the same field, resolve()
+    decides (default: cloud). A record deleted on one side but edited on
+    the other is kept. Runs in linear time.
+
+    Args:
+        base, local, cloud: (location, record) lists in display order
+        key: Stable identity of a record
+        resolve: Conflict rule for fields changed on both sides
+
+    Returns:
+        {location: [records]} in merged order
+    """
+    b_recs, b_order = _index(base, key)
+    l_recs, l_order = _index(local, key)
+    c_recs, c_order = _index(cloud, key)
+
+    final: Dict[str, Entry] = {}
+    for k in list(c_recs) + [k for k in l_recs if k not in c_recs]:
+        b, l, c = b_recs.get(k), l_recs.get(k), c_recs.get(k)
+        if l is not None and c is not None:
+            final[k] = (_pick(b and b[0], l[0], c[0], lambda x, y: y),
+                        _merge_record(b and b[1], l[1], c[1], resolve))
+        elif b is None:
+            final[k] = l or c  # added on one side
+        elif (l or c) != b:
+            final[k] = l or c  # deleted on one side, edited on the other — keep the edit
+        # else: deleted on one side, untouched on the other — stays deleted
+
+    merged: Dict[str, List[Dict]] = {}
+    for loc in dict.fromkeys(list(c_order) + list(l_order)):
+        keys = _order_location(
+            loc, final, b_order.get(loc, []), l_order.get(loc, []), c_order.get(loc, [])
+        )
+        merged[loc] = [final[k][1] for k in keys]
+    return merged
+
+
+def _index(entries: List[Entry], key: Callable[[Dict], str]):
+    """key -> (location, record), plus each location's keys in order."""
+    records: Dict[str, Entry] = {}
+    order: Dict[str, List[str]] = {}
+    for loc, rec in entries:
+        k = key(rec)
+        if k in records:
+            # Same identity twice in one copy — keep both, distinctly keyed
+            n = 2
+            while f"{k}#{n}" in records:
+                n += 1
+            k = f"{k}#{n}"
+        records[k] = (loc, rec)
+        order.setdefault(loc, []).append(k)
+    return records, order
+
+
+def _pick(b: Any, l: Any, c: Any, on_conflict: Callable[[Any, Any], Any]) -> Any:
+    """Three-way choice for one value."""
+    if l == c:
+        return l
+    if l == b:
+        return c
+    if c == b:
+        return l
+    return on_conflict(l, c)
+
+
+def _merge_record(b: Optional[Dict], l: Dict, c: Dict, resolve: Optional[Resolver]) -> Dict:
+    """Field-by-field three-way merge of one record."""
+    if l == c:
+        return c
+    b = b or {}
+    out = {}
+    for field in list(c) + [f for f in l if f not in c]:
+        value = _pick(
+            b.get(field, _MISSING), l.get(field, _MISSING), c.get(field, _MISSING),
+            lambda lv, cv: cv if resolve is None or _MISSING in (lv, cv) else resolve(field, lv, cv)
+        )
+        if value is not _MISSING:
+            out[field] = value
+    return out
+
+
+def _order_location(loc: str, final: Dict[str, Entry], b: List[str],
+                    l: List[str], c: List[str]) -> List[str]:
+    """Merged order of the records that end up in loc.
+
+    The side that reordered loc (relative to the base) provides the skeleton
+    — cloud if both or neither did. Records missing from the skeleton are
+    slotted in after their predecessor on the other side.
+    """
+    here = {k for k in dict.fromkeys(l + c) if k in final and final[k][0] == loc}
+    in_base = set(b)
+    common = lambda seq: [k for k in seq if k in here and k in in_base]
+    skeleton, other = (l, c) if common(l) != common(b) and common(c) == common(b) else (c, l)
+
+    placed = [k for k in skeleton if k in here]
+    seen = set(placed)
+    after: Dict[Optional[str], List[str]] = {}
+    prev = None
+    for k in other:
+        if k in here and k not in seen:
+            after.setdefault(prev, []).append(k)
+            seen.add(k)
+        if k in seen:
+            prev = k
+
+    # Emit the skeleton with insertions threaded in (iterative, no recursion limit)
+    out: List[str] = []
+    stack = list(reversed(after.get(None, [])))
+    queue = list(reversed(placed))
+    while stack or queue:
+        k = stack.pop() if stack else queue.pop()
+        out.append(k)
+        stack.extend(reversed(after.get(k, [])))
+    return out
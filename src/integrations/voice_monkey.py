@@ -1,21 +1,24 @@
 """Voice Monkey API client for sending announcements to Alexa devices."""
 import requests
 from typing import Optional
+from src.integrations.http_session import get_session, timeout
 
 
 class VoiceMonkeyClient:
     """Client for sending TTS announcements via Voice Monkey API."""
 
-    def __init__(self, api_url: str, enabled: bool = True):
+    def __init__(self, api_url: str, enabled: bool = True, timeout_seconds: float = 5):
         """
         Initialize Voice Monkey client.
 
         Args:
             api_url: Full Voice Monkey API URL with token and device parameters
             enabled: Whether announcements are enabled
+            timeout_seconds: Read timeout per announcement request
         """
         self.api_url = api_url
         self.enabled = enabled
+        self.timeout_seconds = timeout_seconds
 
     def announce(self, message: str) -> bool:
         """
@@ -40,7 +43,7 @@ class VoiceMonkeyClient:
             print(f"[Sending to Voice Monkey] {message}")
             print(f"[URL] {full_url[:80]}...")  # Print first 80 chars of URL for debugging
 
-            response = requests.get(full_url, timeout=5)
+            response = get_session().get(full_url, timeout=timeout(self.timeout_seconds))
 
             if response.status_code == 200:
                 print(f"[Announcement sent successfully] Status: {response.status_code}")
@@ -0,0 +1,187 @@
+"""Compiled day schedule: an immutable phase table built from a day definition."""
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# tasks.json, the sync merge and the UI have eight block slots
+MAX_BLOCKS = 8
+
+# Day definition used when config.json has no "schedule" section:
+# 20 min planning, 8 × 45 min blocks, 15 min breaks, 30 min lunch after Block 5
+DEFAULT_DAY = {
+    "planning_minutes": 20,
+    "blocks": 8,
+    "block_minutes": 45,
+    "break_minutes": 15,
+    "lunch_after_block": 5,
+    "lunch_minutes": 30,
+}
+
+
+@dataclass(frozen=True)
+class Phase:
+    """One phase of the day with everything the timer and UI need precomputed."""
+    index: int                   # Position in the schedule
+    name: str                    # "Planning", "Block 3", "Break"
+    type: str                    # "work" or "break"
+    duration: int                # Seconds
+    start: int                   # Seconds from the start of the day
+    block_index: Optional[int]   # 0-based block number, None for planning/breaks
+    location: Optional[str]      # Task location it highlights: "planning", "block:2" or None
+    start_text: str              # Announced when the timer is started on this phase
+    ended_text: str              # First half of the transition out of this phase
+    begin_text: str              # Second half of the transition into this phase
+
+    @property
+    def end(self) -> int:
+        return self.start + self.duration
+
+    def warning_text(self, minutes: int) -> str:
+        """Milestone warning announced `minutes` before the phase ends."""
+        if self.type == "break":
+            return f"Break ending in {minutes} minutes"
+        return f"{minutes} minutes remaining in {self.name}"
+
+    def to_dict(self) -> Dict:
+        """The old SCHEDULE entry shape: name, duration, type."""
+        return {"name": self.name, "duration": self.duration, "type": self.type}
+
+
+class Schedule:
+    """Immutable, indexable table of phases with O(log n) time lookup."""
+
+    __slots__ = ("phases", "_starts", "block_count", "total_seconds", "final_text")
+
+    def __init__(self, phases: Tuple[Phase, ...]):
+        object.__setattr__(self, "phases", phases)
+        object.__setattr__(self, "_starts", tuple(p.start for p in phases))
+        object.__setattr__(self, "block_count", sum(p.block_index is not None for p in phases))
+        object.__setattr__(self, "total_seconds", phases[-1].end if phases else 0)
+        object.__setattr__(self, "final_text", f"{phases[-1].name} complete. Your work day is finished!")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Schedule is immutable")
+
+    def __len__(self) -> int:
+        return len(self.phases)
+
+    def __getitem__(self, index: int) -> Phase:
+        return self.phases[index]
+
+    def __iter__(self) -> Iterator[Phase]:
+        return iter(self.phases)
+
+    def get(self, index: int) -> Optional[Phase]:
+        """Phase at a schedule position, or None if out of range."""
+        return self.phases[index] if 0 <= index < len(self.phases) else None
+
+    def phase_at(self, seconds: float) -> Optional[Phase]:
+        """The phase active `seconds` into the day, or None before/after the day."""
+        if seconds < 0 or seconds >= self.total_seconds:
+            return None
+        return self.phases[bisect_right(self._starts, seconds) - 1]
+
+    def block_phase(self, block_index: int) -> Optional[Phase]:
+        """The work phase for a 0-based block number."""
+        for phase in self.phases:
+            if phase.block_index == block_index:
+                return phase
+        return None
+
+    def transition_message(self, prev: Phase, next_phase: Phase) -> str:
+        """Single transition announcement: what ended → what's starting."""
+        return f"{prev.ended_text} {next_phase.begin_text}"
+
+
+def _minutes_list(value: Union[int, List[int]], count: int, field: str) -> List[int]:
+    """Expand a single duration to `count` copies, or check a per-item list."""
+    if isinstance(value, list):
+        if len(value) != count:
+            raise ValueError(f"{field} lists {len(value)} durations for {count} entries")
+        minutes = value
+    else:
+        minutes = [value] * count
+    for m in minutes:
+        if not isinstance(m, (int, float)) or m <= 0:
+            raise ValueError(f"{field} must be positive minutes, got {m!r}")
+    return [int(m * 60) for m in minutes]
+
+
+def compile_schedule(day: Optional[Dict] = None) -> Schedule:
+    """Turn a day definition into a Schedule.
+
+    Args:
+        day: Keys as in DEFAULT_DAY, each optional. "block_minutes" and
+            "break_minutes" may be lists (one per block; a block's break is
+            the one before it) for uneven days; "blocks" defaults to the
+            length of a block_minutes list. "planning_minutes": 0 drops
+            planning, "lunch_after_block": 0 drops lunch.
+
+    Raises:
+        ValueError: If the definition is inconsistent
+    """
+    spec = dict(DEFAULT_DAY)
+    if day:
+        spec.update(day)
+        if isinstance(day.get("block_minutes"), list) and "blocks" not in day:
+            spec["blocks"] = len(day["block_minutes"])
+
+    blocks = spec["blocks"]
+    if not isinstance(blocks, int) or not 1 <= blocks <= MAX_BLOCKS:
+        raise ValueError(f"blocks must be 1-{MAX_BLOCKS}, got {blocks!r}")
+    block_secs = _minutes_list(spec["block_minutes"], blocks, "block_minutes")
+    break_secs = _minutes_list(spec["break_minutes"], blocks, "break_minutes")
+
+    lunch_after = spec.get("lunch_after_block") or 0
+    if lunch_after >= blocks and "lunch_after_block" not in (day or {}):
+        lunch_after = 0  # Default lunch slot doesn't exist in a shorter day
+    if not 0 <= lunch_after < blocks:
+        raise ValueError(f"lunch_after_block must be 0-{blocks - 1}, got {lunch_after!r}")
+    if lunch_after:
+        break_secs[lunch_after] = _minutes_list(spec["lunch_minutes"], 1, "lunch_minutes")[0]
+
+    # (name, type, seconds, block_index) in day order; break_secs[i] precedes block i
+    layout = []
+    planning_minutes = spec.get("planning_minutes") or 0
+    if planning_minutes:
+        layout.append(("Planning", "work", _minutes_list(planning_minutes, 1, "planning_minutes")[0], None))
+    for i in range(blocks):
+        if layout:
+            layout.append(("Break", "break", break_secs[i], None))
+        layout.append((f"Block {i + 1}", "work", block_secs[i], i))
+
+    phases = []
+    offset = 0
+    for index, (name, phase_type, seconds, block_index) in enumerate(layout):
+        minutes = seconds // 60
+        if block_index is not None:
+            location = f"block:{block_index}"
+            start_text = f"Starting {name}. Time to focus."
+            ended_text = f"{name} ended."
+            begin_text = f"Begin {name}."
+        elif name == "Planning":
+            location = "planning"
+            start_text = f"Starting planning phase. {minutes} minutes to organize your day."
+            ended_text = "Planning ended."
+            begin_text = "Begin planning."
+        else:
+            location = None
+            start_text = f"Starting {minutes} minute break."
+            ended_text = "Break over."
+            begin_text = f"Begin {minutes} minute break."
+        phases.append(Phase(index, name, phase_type, seconds, offset, block_index, location,
+                            start_text, ended_text, begin_text))
+        offset += seconds
+    return Schedule(tuple(phases))
+
+
+DEFAULT_SCHEDULE = compile_schedule()
+
+
+def schedule_from_config(config: Dict) -> Schedule:
+    """Compile config.json's "schedule" section (the default day if absent or invalid)."""
+    try:
+        return compile_schedule(config.get("schedule"))
+    except (ValueError, TypeError) as e:
+        print(f"[Timer] Invalid schedule in config.json ({e}), using the default day")
+        return DEFAULT_SCHEDULE
@@ -1,3 +1,5 @@
+import hashlib
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -12,10 +14,23 @@ class Task:
     is_recurring: bool = False
     is_high_priority: bool = False
     blocks_escalated: int = 0
+    id: str = ""  # stable identity across edits, moves and syncs
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
+        if not self.id:
+            self.id = uuid.uuid4().hex[:12]
+
+    @staticmethod
+    def legacy_id(data: dict) -> str:
+        """Deterministic id for a task saved before ids existed.
+
+        Derived from created_at + text, so every machine migrating the same
+        task independently (and the sync merge base) arrives at the same id.
+        """
+        seed = f"{data.get('created_at')}|{data.get('text', '')}"
+        return hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
 
     def complete(self):
         self.completed = True
@@ -23,6 +38,7 @@ class Task:
 
     def to_dict(self):
         d = {
+            'id': self.id,
             'text': self.text,
             'completed': self.completed,
             'created_at': self.created_at,
@@ -40,6 +56,8 @@ class Task:
     @classmethod
     def from_dict(cls, data):
         # Filter to only known fields for backward compatibility
-        known_fields = {'text', 'completed', 'created_at', 'completed_at', 'times_queued', 'is_recurring', 'is_high_priority', 'blocks_escalated'}
+        known_fields = {'id', 'text', 'completed', 'created_at', 'completed_at', 'times_queued', 'is_recurring', 'is_high_priority', 'blocks_escalated'}
         filtered = {k: v for k, v in data.items() if k in known_fields}
+        if not filtered.get('id'):
+            filtered['id'] = cls.legacy_id(data)
         return cls(**filtered)
@@ -1,29 +1,9 @@
-"""Timer state model and schedule definition for the daily scheduler."""
-from dataclasses import dataclass, asdict
+"""Timer state model for the daily scheduler."""
+import math
+from dataclasses import dataclass, asdict, fields
 from typing import Optional
 from datetime import datetime
-
-
-# Schedule definition: 8-hour workday with planning block
-SCHEDULE = [
-    {"name": "Planning", "duration": 1200, "type": "work"},     # 20 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 1", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 2", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 3", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 4", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 5", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 1800, "type": "break"},       # 30 min (lunch)
-    {"name": "Block 6", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 7", "duration": 2700, "type": "work"},      # 45 min
-    {"name": "Break", "duration": 900, "type": "break"},        # 15 min
-    {"name": "Block 8", "duration": 2700, "type": "work"},      # 45 min
-]
+from .schedule import DEFAULT_SCHEDULE, Schedule
 
 
 @dataclass
@@ -31,11 +11,12 @@ class TimerState:
     """Represents the current state of the timer system."""
     current_phase: str           # "Planning", "Block 1", "Break", etc.
     phase_type: str              # "work" or "break"
-    phase_index: int             # 0-16 (sequential position in schedule)
+    phase_index: int             # Sequential position in the compiled schedule
     time_remaining_seconds: int  # Countdown value
     is_running: bool             # Play/pause state
     started_at: Optional[str] = None    # ISO timestamp
     paused_at: Optional[str] = None     # ISO timestamp
+    phase_ends_at: Optional[str] = None  # ISO timestamp the running phase ends (None when paused)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -44,21 +25,32 @@ class TimerState:
     @classmethod
     def from_dict(cls, data):
         """Create TimerState from dictionary."""
-        return cls(**data)
+        known_fields = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known_fields})
 
     @classmethod
-    def create_initial(cls):
-        """Create initial timer state (Planning phase, not started)."""
+    def create_initial(cls, schedule: Schedule = DEFAULT_SCHEDULE):
+        """Create initial timer state (first phase of the day, not started)."""
+        first = schedule[0]
         return cls(
-            current_phase="Planning",
-            phase_type="work",
+            current_phase=first.name,
+            phase_type=first.type,
             phase_index=0,
-            time_remaining_seconds=1200,  # 20 minutes
+            time_remaining_seconds=first.duration,
             is_running=False,
             started_at=None,
             paused_at=None
         )
 
+    def seconds_until_phase_end(self, now: Optional[datetime] = None) -> Optional[int]:
+        """Whole seconds left before phase_ends_at (clamped at 0), or None if no deadline."""
+        if not self.phase_ends_at:
+            return None
+        if now is None:
+            now = datetime.now()
+        delta = (datetime.fromisoformat(self.phase_ends_at) - now).total_seconds()
+        return max(0, math.ceil(delta))
+
     def format_time_remaining(self):
         """Format time remaining as MM:SS."""
         minutes = self.time_remaining_seconds // 60
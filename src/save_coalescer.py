@@ -0,0 +1,124 @@
+"""Write-behind save scheduling: collapse bursts of UI changes into one flush."""
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+
+
+class SaveCoalescer:
+    """Tracks which stores are dirty and flushes them once the UI goes quiet.
+
+    Every change marks one or more store names dirty. A flush is scheduled
+    idle_ms after the most recent change, but never later than max_delay_ms
+    after the first unflushed change — so a steady stream of edits can't
+    postpone saving forever. max_delay_ms is the worst-case window of
+    unsaved data if the process dies.
+    """
+
+    def __init__(
+        self,
+        root_window,
+        flush_callback: Callable[[Set[str]], None],
+        idle_ms: int = 500,
+        max_delay_ms: int = 3000,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_dirty: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize save coalescer.
+
+        Args:
+            root_window: Tkinter root window for after() scheduling
+            flush_callback: Called with the set of dirty store names to write
+            idle_ms: Quiet period after the last change before flushing
+            max_delay_ms: Upper bound between the first change and its flush
+            on_error: Called with the exception if a flush fails (stores stay dirty)
+            on_dirty: Called when the first change arrives after a clean state
+        """
+        self.root_window = root_window
+        self.flush_callback = flush_callback
+        self.idle_ms = idle_ms
+        self.max_delay_ms = max_delay_ms
+        self.on_error = on_error
+        self.on_dirty = on_dirty
+
+        self._dirty: Set[str] = set()
+        self._first_dirty_at: Optional[float] = None
+        self._after_id = None
+
+        # Counters for reporting how much work was saved
+        self.stats: Dict[str, int] = {"requests": 0, "flushes": 0, "coalesced": 0}
+
+    @property
+    def pending(self) -> Set[str]:
+        """Store names that have unsaved changes."""
+        return set(self._dirty)
+
+    def mark_dirty(self, *stores: str):
+        """Record a change and (re)schedule the deferred flush."""
+        if not stores:
+            return
+        self.stats["requests"] += 1
+        was_clean = not self._dirty
+        self._dirty.update(stores)
+
+        now = time.monotonic()
+        if self._first_dirty_at is None:
+            self._first_dirty_at = now
+        if was_clean and self.on_dirty:
+            self.on_dirty()
+
+        # Debounce: push the flush back to idle_ms from now, capped by the deadline
+        elapsed_ms = (now - self._first_dirty_at) * 1000
+        delay = max(0, min(self.idle_ms, int(self.max_delay_ms - elapsed_ms)))
+        self._cancel_job()
+        self._after_id = self.root_window.after(delay, self._on_timer)
+
+    def flush(self, stores: Optional[Iterable[str]] = None) -> bool:
+        """Write pending stores now.
+
+        Args:
+            stores: Extra store names to write even if not marked dirty
+
+        Returns:
+            True if the write succeeded (or there was nothing to write)
+        """
+        self._cancel_job()
+        if stores:
+            self._dirty.update(stores)
+        if not self._dirty:
+            return True
+
+        to_write = self._dirty
+        self._dirty = set()
+        self._first_dirty_at = None
+        try:
+            self.flush_callback(to_write)
+        except Exception as e:
+            # Keep the changes dirty so the next flush retries them
+            self._dirty |= to_write
+            self._first_dirty_at = time.monotonic()
+            if self.on_error:
+                self.on_error(e)
+                return False
+            raise
+
+        self.stats["flushes"] += 1
+        self.stats["coalesced"] = max(0, self.stats["requests"] - self.stats["flushes"])
+        return True
+
+    def cancel(self):
+        """Drop the scheduled flush without writing (pending stores stay dirty)."""
+        self._cancel_job()
+
+    def summary(self) -> str:
+        """One-line report of coalescing effectiveness."""
+        s = self.stats
+        return f"{s['requests']} change(s) -> {s['flushes']} write(s) ({s['coalesced']} coalesced)"
+
+    def _on_timer(self):
+        self._after_id = None
+        self.flush()
+
+    def _cancel_job(self):
+        if self._after_id is not None:
+            self.root_window.after_cancel(self._after_id)
+            self._after_id = None
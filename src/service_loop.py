@@ -0,0 +1,125 @@
+"""Tk-free event loop and fan-out helpers for the background services."""
+import heapq
+import itertools
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class ServiceLoop:
+    """Single-threaded stand-in for Tk's after() loop.
+
+    TimerManager and AnnouncementDispatcher only need after()/after_cancel(),
+    so they run unchanged on this loop; every callback runs on the loop
+    thread. Other threads hand work to it with call().
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._timers = []  # heap of (due monotonic, id)
+        self._callbacks: Dict[int, tuple] = {}
+        self._ids = itertools.count(1)
+        self._running = False
+        self.thread: Optional[threading.Thread] = None
+
+    def after(self, ms: int, func: Callable, *args) -> int:
+        """Run func(*args) on the loop thread after ms milliseconds."""
+        with self._cond:
+            after_id = next(self._ids)
+            self._callbacks[after_id] = (func, args)
+            heapq.heappush(self._timers, (time.monotonic() + ms / 1000, after_id))
+            self._cond.notify()
+        return after_id
+
+    def after_cancel(self, after_id: int):
+        with self._cond:
+            self._callbacks.pop(after_id, None)
+
+    def call(self, func: Callable, *args, timeout: float = 10.0):
+        """Run func(*args) on the loop thread and return its result (from another thread)."""
+        done = threading.Event()
+        box = {}
+
+        def run():
+            try:
+                box["result"] = func(*args)
+            except Exception as e:
+                box["error"] = e
+            done.set()
+
+        self.after(0, run)
+        if not done.wait(timeout):
+            raise TimeoutError("timer loop did not respond")
+        if "error" in box:
+            raise box["error"]
+        return box.get("result")
+
+    def run_forever(self):
+        """Process callbacks until stop()."""
+        self.thread = threading.current_thread()
+        self._running = True
+        while True:
+            with self._cond:
+                while True:
+                    if not self._running:
+                        return
+                    # Cancelled timers stay in the heap until they reach the top
+                    while self._timers and self._timers[0][1] not in self._callbacks:
+                        heapq.heappop(self._timers)
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        _, after_id = heapq.heappop(self._timers)
+                        func, args = self._callbacks.pop(after_id)
+                        break
+                    self._cond.wait(self._timers[0][0] - now if self._timers else None)
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"[ServiceLoop] Callback error: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+
+class Broadcaster:
+    """Fans messages out to subscriber queues without ever blocking the publisher.
+
+    Each subscriber gets a bounded queue drained by its own connection
+    thread; when a subscriber falls behind, its oldest messages are dropped.
+    """
+
+    def __init__(self, backlog: int = 100):
+        self.backlog = backlog
+        self._queues: List[queue.Queue] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, *initial) -> queue.Queue:
+        """New subscriber queue, pre-loaded with `initial` messages."""
+        q = queue.Queue(maxsize=self.backlog)
+        for message in initial:
+            q.put_nowait(message)
+        with self._lock:
+            self._queues.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue):
+        with self._lock:
+            if q in self._queues:
+                self._queues.remove(q)
+
+    def publish(self, message):
+        with self._lock:
+            for q in self._queues:
+                if q.full():
+                    try:
+                        q.get_nowait()
+                    except queue.Empty:
+                        pass
+                q.put_nowait(message)
+
+    def close(self):
+        """Wake every subscriber with None (end of stream)."""
+        self.publish(None)
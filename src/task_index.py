@@ -0,0 +1,97 @@
+"""Task id → (location, position) lookup across planning, the blocks and the queue."""
+from typing import Callable, Dict, List, Optional, Tuple
+from .models.task import Task
+
+# Location names match the sync merge: "planning", "block:0".."block:7", "queue"
+TaskLists = Dict[str, List[Task]]
+
+
+class TaskIndex:
+    """Finds, moves and removes tasks by id without scanning every list.
+
+    The lists themselves stay owned by the UI/data layer; the index is handed
+    a provider that returns them, so it always sees the current list objects
+    (widgets replace block.tasks on get_data). Entries are verified on use —
+    if a list was changed behind the index's back, the index rebuilds itself
+    once instead of returning a wrong position.
+    """
+
+    def __init__(self, provider: Callable[[], TaskLists]):
+        """
+        Initialize task index.
+
+        Args:
+            provider: Returns {location: task list} for every location
+        """
+        self.provider = provider
+        self._where: Dict[str, Tuple[str, int]] = {}
+        self.rebuild()
+
+    @classmethod
+    def for_data(cls, planning, blocks, queue: List[Task]) -> "TaskIndex":
+        """Index over Block objects and a queue list (as returned by load_tasks)."""
+        def provider():
+            lists = {"planning": planning.tasks}
+            lists.update((f"block:{i}", b.tasks) for i, b in enumerate(blocks))
+            lists["queue"] = queue
+            return lists
+        return cls(provider)
+
+    def rebuild(self):
+        """Re-index every list (one linear pass)."""
+        self._where = {
+            task.id: (location, pos)
+            for location, tasks in self.provider().items()
+            for pos, task in enumerate(tasks)
+        }
+
+    def __contains__(self, task_id: str) -> bool:
+        return self.locate(task_id) is not None
+
+    def locate(self, task_id: str) -> Optional[Tuple[str, int]]:
+        """(location, position) of a task, or None if it isn't in any list."""
+        lists = self.provider()
+        for attempt in range(2):
+            entry = self._where.get(task_id)
+            if entry is not None:
+                tasks = lists.get(entry[0])
+                if tasks is not None and entry[1] < len(tasks) and tasks[entry[1]].id == task_id:
+                    return entry
+            if attempt == 0:
+                self.rebuild()  # stale or unknown — re-index once and retry
+        return None
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """The task with this id, or None."""
+        entry = self.locate(task_id)
+        return self.provider()[entry[0]][entry[1]] if entry else None
+
+    def remove(self, task: Task) -> Optional[str]:
+        """Remove a task from whichever list holds it.
+
+        Returns:
+            The location it was removed from, or None if it wasn't indexed
+        """
+        entry = self.locate(task.id)
+        if entry is None:
+            return None
+        location, pos = entry
+        tasks = self.provider()[location]
+        del tasks[pos]
+        del self._where[task.id]
+        # Only positions after the removed one shift
+        for i in range(pos, len(tasks)):
+            self._where[tasks[i].id] = (location, i)
+        return location
+
+    def append(self, location: str, task: Task):
+        """Append a task to a location's list."""
+        tasks = self.provider()[location]
+        tasks.append(task)
+        self._where[task.id] = (location, len(tasks) - 1)
+
+    def move(self, task: Task, location: str) -> Optional[str]:
+        """Move a task to the end of another location. Returns where it came from."""
+        source = self.remove(task)
+        self.append(location, task)
+        return source
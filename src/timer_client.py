@@ -0,0 +1,280 @@
+"""Client for the headless timer service, usable wherever a TimerManager is expected."""
+import json
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from src.models.schedule import schedule_from_config
+from src.models.timer_state import TimerState
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Written by the service into its data directory: {"port": ..., "pid": ...}
+PORT_FILE = "timer_service.json"
+
+
+class TimerClient:
+    """Talks to the timer service for one dataset.
+
+    Mirrors the parts of TimerManager the UI uses (timer_state, schedule,
+    announcement_mode, start/pause/skip_to_next/reset/end_day, ...). State
+    pushed by the service is picked up on the Tk thread via root.after()
+    polling, so on_state_change runs on the Tk thread as it does in-process.
+    """
+
+    POLL_MS = 100
+    RECONNECT_SECONDS = 2
+    REQUEST_TIMEOUT = 5
+    SPAWN_WAIT_SECONDS = 3
+
+    def __init__(self, data_manager, root_window, on_state_change_callback: Callable, port: int):
+        """
+        Initialize timer client (use connect(), which finds or starts the service).
+
+        Args:
+            data_manager: DataManager for the dataset the service runs
+            root_window: Tk root window (for after() polling)
+            on_state_change_callback: Callback when timer state changes
+            port: Service port on 127.0.0.1
+        """
+        self.data_manager = data_manager
+        self.root_window = root_window
+        self.on_state_change = on_state_change_callback
+        self.port = port
+
+        self.config = self.data_manager.load_config()
+        self.schedule = schedule_from_config(self.config)
+        self.announcement_mode = self.config.get("timer", {}).get("announcement_mode", "voice_monkey")
+
+        self._epoch = None
+        self._seq = 0
+        self._updates = queue.Queue()
+        self._closed = threading.Event()
+        self._sub_sock: Optional[socket.socket] = None
+
+        reply = self._request({"cmd": "state"})
+        if reply is None:
+            raise ConnectionError(f"timer service on port {port} is not responding")
+        self.timer_state = TimerState.from_dict(reply["state"])
+        self._epoch, self._seq = reply.get("epoch"), reply["seq"]
+
+        threading.Thread(target=self._subscribe, name="timer-subscribe", daemon=True).start()
+        self._poll_id = self.root_window.after(self.POLL_MS, self._poll)
+
+    @classmethod
+    def connect(cls, data_manager, root_window, on_state_change_callback: Callable) -> Optional["TimerClient"]:
+        """Connect to the dataset's timer service, starting it if it isn't running.
+
+        Returns:
+            TimerClient, or None if no service could be reached
+        """
+        data_dir = data_manager.data_dir.resolve()
+        port = _read_port(data_dir)
+        if port is None:
+            _spawn_service(data_dir)
+            deadline = time.monotonic() + cls.SPAWN_WAIT_SECONDS
+            while port is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+                port = _read_port(data_dir)
+        if port is None:
+            print("[Timer] Timer service did not start")
+            return None
+        try:
+            return cls(data_manager, root_window, on_state_change_callback, port)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[Timer] Could not connect to timer service: {e}")
+            return None
+
+    # ── Commands ────────────────────────────────────────────────────────
+
+    def _request(self, message: Dict) -> Optional[Dict]:
+        """Send one command and return the reply, or None if the service is unreachable."""
+        return _request(self.port, message, self.REQUEST_TIMEOUT)
+
+    def _command(self, cmd: str):
+        reply = self._request({"cmd": cmd})
+        if reply is not None and "state" in reply:
+            self._apply(reply)
+
+    def start(self):
+        """Start or resume the timer."""
+        self._command("start")
+
+    def pause(self):
+        """Pause the timer."""
+        self._command("pause")
+
+    def skip_to_next(self):
+        """Skip to the next phase immediately."""
+        self._command("skip")
+
+    def reset(self):
+        """Reset timer to the first phase."""
+        self._command("reset")
+
+    def end_day(self):
+        """End the day early - stop timer and prevent further announcements."""
+        self._command("end_day")
+
+    def set_announcement_mode(self, mode: str):
+        """Switch between 'voice_monkey' and 'local' announcement modes (persisted by the service)."""
+        if self._request({"cmd": "set_announcement_mode", "mode": mode}) is not None:
+            self.announcement_mode = mode
+
+    def validate_config(self) -> bool:
+        """
+        Validate that Voice Monkey is configured.
+
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        vm_config = self.config.get("voice_monkey", {})
+        api_url = vm_config.get("api_url", "")
+
+        if not api_url or "voicemonkey.io" not in api_url:
+            return False
+
+        return True
+
+    def jitter_summary(self) -> str:
+        """The service's tick timing summary."""
+        reply = self._request({"cmd": "jitter"})
+        return reply["summary"] if reply else "tick jitter: timer service unavailable"
+
+    def shutdown(self):
+        """Stop listening for updates. The service (and the timer) keeps running."""
+        self._closed.set()
+        if self._poll_id is not None:
+            self.root_window.after_cancel(self._poll_id)
+            self._poll_id = None
+        sock = self._sub_sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    # ── State updates ───────────────────────────────────────────────────
+
+    def _apply(self, message: Dict):
+        """Adopt a state from the service unless a newer one was already applied."""
+        # A restarted service numbers its states from 1 again
+        if message.get("epoch") == self._epoch and message["seq"] <= self._seq:
+            return
+        self._epoch, self._seq = message.get("epoch"), message["seq"]
+        self.timer_state = TimerState.from_dict(message["state"])
+        self.on_state_change(self.timer_state)
+
+    def _subscribe(self):
+        """Worker thread: stream state pushes into the queue, reconnecting as needed."""
+        while not self._closed.is_set():
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=self.REQUEST_TIMEOUT) as sock:
+                    sock.settimeout(None)
+                    self._sub_sock = sock
+                    sock.sendall(b'{"cmd": "subscribe"}\n')
+                    for line in sock.makefile("rb"):
+                        self._updates.put(json.loads(line))
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._sub_sock = None
+            self._closed.wait(self.RECONNECT_SECONDS)
+
+    def _poll(self):
+        """Tk thread: apply pushed states (stale ones are skipped by _apply)."""
+        while True:
+            try:
+                message = self._updates.get_nowait()
+            except queue.Empty:
+                break
+            self._apply(message)
+        self._poll_id = self.root_window.after(self.POLL_MS, self._poll)
+
+
+def send_command(data_dir: Path, message: Dict) -> Optional[Dict]:
+    """Send one command to data_dir's timer service if it is running (never starts one).
+
+    Returns:
+        The reply, or None if no service is running or the command failed
+    """
+    port = _read_port(Path(data_dir).resolve())
+    return _request(port, message, TimerClient.REQUEST_TIMEOUT) if port is not None else None
+
+
+def _request(port: int, message: Dict, timeout: float) -> Optional[Dict]:
+    """One request/reply exchange with the service on port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout) as sock:
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            line = sock.makefile("rb").readline()
+    except OSError as e:
+        print(f"[Timer] Timer service not responding: {e}")
+        return None
+    if not line:
+        print("[Timer] Timer service closed the connection")
+        return None
+    reply = json.loads(line)
+    if not reply.get("ok"):
+        print(f"[Timer] Timer service error: {reply.get('error')}")
+        return None
+    return reply
+
+
+def make_timer(data_manager, root_window, on_state_change_callback: Callable):
+    """Timer for a dataset: a client of the timer service when config.json sets
+    timer.service, otherwise an in-process TimerManager."""
+    if data_manager.load_config().get("timer", {}).get("service"):
+        client = TimerClient.connect(data_manager, root_window, on_state_change_callback)
+        if client is not None:
+            return client
+        print("[Timer] Timer service unavailable, running the timer in-process")
+    from src.timer_manager import TimerManager
+    return TimerManager(
+        data_manager=data_manager,
+        root_window=root_window,
+        on_state_change_callback=on_state_change_callback
+    )
+
+
+def _read_port(data_dir: Path) -> Optional[int]:
+    """Port of a live service for data_dir, from its port file."""
+    try:
+        port = json.loads((data_dir / PORT_FILE).read_text())["port"]
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        # A service that crashed leaves its port file behind
+        socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+    except OSError:
+        return None
+    return port
+
+
+def _spawn_service(data_dir: Path):
+    """Start a detached timer service for data_dir that outlives this process."""
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    log = open(data_dir / "timer_service.log", "a")
+    try:
+        subprocess.Popen(
+            [sys.executable, "-u", "-m", "src.timer_service", "--data-dir", str(data_dir)],
+            cwd=str(PROJECT_ROOT),
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            **kwargs
+        )
+    except OSError as e:
+        print(f"[Timer] Could not start timer service: {e}")
+    finally:
+        log.close()
@@ -1,9 +1,31 @@
 """Timer manager for handling countdown logic and state transitions."""
+import heapq
+import itertools
+import math
+import time
 from datetime import datetime
-from typing import Callable, Optional
-from src.models.timer_state import TimerState, SCHEDULE
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+from src.models.timer_state import TimerState
+from src.models.schedule import Phase, schedule_from_config
 from src.integrations.voice_monkey import VoiceMonkeyClient
 from src.integrations.local_chime import LocalChimeClient
+from src.integrations.announcer import AnnouncementDispatcher
+
+
+class PhaseEvent(NamedTuple):
+    """Something due at a point in the running phase, ordered by that deadline."""
+    key: float       # -(seconds before phase end): the earliest deadline sorts first
+    seq: int         # Tie-break in insertion order
+    kind: str        # "end" (phase transition), "warning" or "announce"
+    message: str
+
+    @property
+    def seconds_before_end(self) -> float:
+        return -self.key
+
+
+# Extra events for a phase: phase -> [(seconds before its end, announcement)]
+PhaseEventSource = Callable[[Phase], Iterable[Tuple[float, str]]]
 
 
 class TimerManager:
@@ -28,8 +50,24 @@ class TimerManager:
         self.on_state_change = on_state_change_callback
         self.after_id = None
 
+        # Running-phase anchor: (monotonic, epoch, seconds remaining at that instant).
+        # Remaining time is always derived from this, never by counting ticks.
+        self._anchor = None
+        self._next_tick_due = None
+
+        # How late each tick fires relative to when it was scheduled
+        self.tick_jitter = {"ticks": 0, "late_ms_total": 0.0, "late_ms_max": 0.0}
+
         # Load configuration
         self.config = self.data_manager.load_config()
+        self.schedule = schedule_from_config(self.config)
+        self.warning_minutes = self.config.get("timer", {}).get("warning_at_minutes", [5, 2])
+
+        # The running phase's timed events (transition, warnings, extras) as a
+        # min-heap on deadline; each tick pops only what has come due
+        self._events: List[PhaseEvent] = []
+        self._event_seq = itertools.count()
+        self.event_sources: List[PhaseEventSource] = []
 
         # Initialize announcement clients
         vm_config = self.config.get("voice_monkey", {})
@@ -37,26 +75,40 @@ class TimerManager:
         timer_config = self.config.get("timer", {})
         enabled = timer_config.get("enable_announcements", True)
 
-        self._vm_client = VoiceMonkeyClient(api_url, enabled)
+        self._vm_client = VoiceMonkeyClient(api_url, enabled, vm_config.get("timeout_seconds", 5))
         self._local_client = LocalChimeClient(enabled)
 
-        # Pick active client based on saved mode
+        # Pick active client based on saved mode. Calls go through a background
+        # dispatcher so a slow endpoint never blocks the tick loop or the UI.
         self.announcement_mode = timer_config.get("announcement_mode", "voice_monkey")
-        self.voice_monkey = (
-            self._local_client if self.announcement_mode == "local" else self._vm_client
+        self.voice_monkey = AnnouncementDispatcher(
+            self._local_client if self.announcement_mode == "local" else self._vm_client,
+            root_window=root_window
         )
 
         # Load or create initial timer state
         self.timer_state = self.data_manager.load_timer_state()
+        if self.timer_state is not None:
+            saved_phase = self.schedule.get(self.timer_state.phase_index)
+            if saved_phase is None or saved_phase.name != self.timer_state.current_phase:
+                # Saved under a different day definition — its position means nothing now
+                print("[Timer] Schedule changed since the timer was saved, starting from the top")
+                self.timer_state = None
         if self.timer_state is None:
-            self.timer_state = TimerState.create_initial()
+            self.timer_state = TimerState.create_initial(self.schedule)
             self._save_state()
         else:
             # If state was saved while running, mark it paused — the tick loop
             # doesn't survive a restart, so start() must be clicked again.
+            # The file isn't rewritten every tick, so the remaining time comes
+            # from the persisted phase deadline rather than the stale countdown.
             if self.timer_state.is_running:
+                remaining = self.timer_state.seconds_until_phase_end()
+                if remaining is not None:
+                    self.timer_state.time_remaining_seconds = remaining
                 self.timer_state.is_running = False
                 self.timer_state.paused_at = datetime.now().isoformat()
+                self.timer_state.phase_ends_at = None
                 self._save_state()
 
     def start(self):
@@ -67,25 +119,25 @@ class TimerManager:
             self.timer_state.started_at = datetime.now().isoformat()
             self.timer_state.paused_at = None
 
+            # Phase already ran out (e.g. deadline passed while the app was closed)
+            if self.timer_state.time_remaining_seconds <= 0:
+                self._advance_phase()
+                return
+
             # Announce what phase is starting
-            current_phase = SCHEDULE[self.timer_state.phase_index]
-            if current_phase["name"] == "Planning":
-                self.voice_monkey.announce("Starting planning phase. 20 minutes to organize your day.")
-            elif current_phase["name"].startswith("Block"):
-                block_num = current_phase["name"].split()[1]
-                self.voice_monkey.announce(f"Starting Block {block_num}. Time to focus.")
-            elif current_phase["type"] == "break":
-                duration_min = current_phase["duration"] // 60
-                self.voice_monkey.announce(f"Starting {duration_min} minute break.")
+            self.voice_monkey.announce(self.schedule[self.timer_state.phase_index].start_text)
 
+            self._anchor_phase(self.timer_state.time_remaining_seconds)
             self._save_state()
             self._tick()
 
     def pause(self):
         """Pause the timer."""
         if self.timer_state.is_running:
+            self._sync_remaining()
             self.timer_state.is_running = False
             self.timer_state.paused_at = datetime.now().isoformat()
+            self.timer_state.phase_ends_at = None
             self._cancel_tick()
             self._save_state()
 
@@ -97,7 +149,8 @@ class TimerManager:
     def reset(self):
         """Reset timer to Planning phase."""
         self._cancel_tick()
-        self.timer_state = TimerState.create_initial()
+        self._anchor = None
+        self.timer_state = TimerState.create_initial(self.schedule)
         self._save_state()
         self.on_state_change(self.timer_state)
 
@@ -107,128 +160,215 @@ class TimerManager:
         This prevents speakers from continuing to announce when user leaves.
         """
         self._cancel_tick()
+        if self.timer_state.is_running:
+            self._sync_remaining()
+        self._anchor = None
         self.timer_state.is_running = False
         self.timer_state.paused_at = datetime.now().isoformat()
+        self.timer_state.phase_ends_at = None
         self._save_state()
         self.on_state_change(self.timer_state)
         print("[Timer] Day ended early by user")
+        print(f"[Timer] {self.jitter_summary()}")
 
     def _tick(self):
-        """Called every second to update timer."""
+        """Refresh the countdown from the phase deadline and schedule the next tick.
+
+        Ticks are only a display refresh: the remaining time is recomputed from
+        the anchor each time, so Tk scheduling jitter, slow announcements or a
+        laptop sleep can't make the countdown fall behind.
+        """
         if not self.timer_state.is_running:
             return
 
-        # Decrement time
-        self.timer_state.time_remaining_seconds -= 1
+        now = time.monotonic()
+        if self._next_tick_due is not None:
+            self._record_jitter(now - self._next_tick_due)
+            self._next_tick_due = None
+
+        remaining = self._remaining()
+        due = self._pop_due_events(remaining)
 
-        # Check if phase is complete
-        if self.timer_state.time_remaining_seconds <= 0:
-            self._phase_complete()
+        # Check if phase is complete (possibly several phases ago, after a stall).
+        # Warnings that came due alongside the end are superseded by the transition.
+        if any(event.kind == "end" for event in due):
+            self._phase_complete(overshoot=-remaining)
             return  # Loop ends here; _advance_phase starts a fresh one
-        else:
-            # Check for milestone announcements (5 min, 2 min warnings)
-            self._check_milestone_warnings()
 
-        # Save state and notify UI
-        self._save_state()
+        self.timer_state.time_remaining_seconds = math.ceil(remaining)
+
+        # Milestone warnings and other events that came due since the last tick
+        self._fire_events(due)
+
+        # Notify UI (no save — the persisted phase_ends_at already covers restarts)
         self.on_state_change(self.timer_state)
 
-        # Schedule next tick
-        self.after_id = self.root_window.after(1000, self._tick)
+        # Wake just after the displayed second changes rather than a flat 1000ms,
+        # so late ticks don't accumulate
+        delay = remaining - math.floor(remaining) or 1.0
+        delay += 0.01
+        self._next_tick_due = time.monotonic() + delay
+        self.after_id = self.root_window.after(max(1, round(delay * 1000)), self._tick)
 
-    def _phase_complete(self):
+    def _phase_complete(self, overshoot: float = 0.0):
         """Handle phase completion and advance to next phase."""
         # Announcement is handled inside _advance_phase as a transition message
-        self._advance_phase()
+        self._advance_phase(overshoot)
 
-    def _advance_phase(self):
-        """Move to the next phase in the schedule."""
-        prev_phase = SCHEDULE[self.timer_state.phase_index]
+    def _advance_phase(self, overshoot: float = 0.0):
+        """Move to the next phase in the schedule.
 
-        # Check if we're at the end of the schedule
-        if self.timer_state.phase_index >= len(SCHEDULE) - 1:
+        Args:
+            overshoot: Seconds already elapsed past the end of the current phase.
+                After a stall (sleep, frozen UI) this can span several phases;
+                the phase to resume in is found with one schedule lookup, and
+                every skipped phase is stepped through so the UI sees each
+                transition, but only one collapsed announcement is made.
+        """
+        prev_phase = self.schedule[self.timer_state.phase_index]
+        day_offset = prev_phase.end + overshoot
+        next_phase = self.schedule.phase_at(day_offset)  # None once the day is over
+
+        # Phases that also ran out while we weren't ticking
+        stop = next_phase.index if next_phase else len(self.schedule)
+        skipped = self.schedule.phases[prev_phase.index + 1:stop]
+        for phase in skipped:
+            self._set_phase(phase)
+            self.on_state_change(self.timer_state)
+
+        if next_phase is None:
             # End of day
             self._end_of_day()
             return
 
-        # Move to next phase
-        self.timer_state.phase_index += 1
-        next_phase = SCHEDULE[self.timer_state.phase_index]
-        self.timer_state.current_phase = next_phase["name"]
-        self.timer_state.phase_type = next_phase["type"]
-        self.timer_state.time_remaining_seconds = next_phase["duration"]
+        if skipped:
+            print(f"[Timer] Caught up {len(skipped)} missed phase(s) after a stall")
+
+        self._set_phase(next_phase)
 
         # Announce transition (what ended → what's starting)
-        transition_msg = self._get_transition_message(prev_phase, next_phase)
-        self.voice_monkey.announce(transition_msg)
+        self.voice_monkey.announce(self.schedule.transition_message(prev_phase, next_phase))
 
         # Auto-start next phase (no pause between phases)
+        remaining = next_phase.end - day_offset
         self.timer_state.is_running = True
         self.timer_state.started_at = datetime.now().isoformat()
+        self.timer_state.paused_at = None
+        self._anchor_phase(remaining)
+        self.timer_state.time_remaining_seconds = math.ceil(remaining)
 
         # Save, notify UI, and start the single fresh tick loop
         self._save_state()
         self.on_state_change(self.timer_state)
         self._tick()
 
+    def _set_phase(self, phase):
+        """Point the timer state at a phase, with its full duration remaining."""
+        self.timer_state.phase_index = phase.index
+        self.timer_state.current_phase = phase.name
+        self.timer_state.phase_type = phase.type
+        self.timer_state.time_remaining_seconds = phase.duration
+
     def _end_of_day(self):
-        """Handle end of day (after Block 8)."""
+        """Handle end of day (after the last block)."""
         self.timer_state.is_running = False
         self.timer_state.paused_at = datetime.now().isoformat()
+        self.timer_state.phase_ends_at = None
+        self.timer_state.time_remaining_seconds = 0
+        self._anchor = None
         self._cancel_tick()
 
         # Final announcement
-        self.voice_monkey.announce("Block 8 complete. Your work day is finished!")
+        self.voice_monkey.announce(self.schedule.final_text)
 
         self._save_state()
         self.on_state_change(self.timer_state)
         print("[Timer] Day complete!")
 
-    def _check_milestone_warnings(self):
-        """Check if we should announce milestone warnings (5 min, 2 min)."""
-        timer_config = self.config.get("timer", {})
-        warning_minutes = timer_config.get("warning_at_minutes", [5, 2])
-
-        seconds_remaining = self.timer_state.time_remaining_seconds
-
-        for warning_min in warning_minutes:
-            # Check if we're exactly at the warning point
-            if seconds_remaining == warning_min * 60:
-                if self.timer_state.phase_type == "work":
-                    msg = f"{warning_min} minutes remaining in {self.timer_state.current_phase}"
-                    self.voice_monkey.announce(msg)
-                elif self.timer_state.phase_type == "break":
-                    msg = f"Break ending in {warning_min} minutes"
-                    self.voice_monkey.announce(msg)
-
-    def _get_transition_message(self, prev_phase, next_phase):
-        """Generate a single transition announcement: what ended → what's starting."""
-        # What ended
-        if prev_phase["name"].startswith("Block"):
-            ended = f"Block {prev_phase['name'].split()[1]} ended."
-        elif prev_phase["name"] == "Planning":
-            ended = "Planning ended."
-        elif prev_phase["type"] == "break":
-            ended = "Break over."
-        else:
-            ended = f"{prev_phase['name']} ended."
-
-        # What's starting
-        if next_phase["name"].startswith("Block"):
-            block_num = next_phase["name"].split()[1]
-            starting = f"Begin Block {block_num}."
-        elif next_phase["name"] == "Planning":
-            starting = "Begin planning."
-        elif next_phase["type"] == "break":
-            duration_min = next_phase["duration"] // 60
-            starting = f"Begin {duration_min} minute break."
-        else:
-            starting = f"Begin {next_phase['name']}."
+    def _schedule_phase_events(self, remaining: float):
+        """Rebuild the event heap for the running phase.
+
+        Only events still ahead (deadline before the remaining time) are
+        queued, so resuming at 4:00 doesn't announce the 5-minute warning.
+        """
+        phase = self.schedule[self.timer_state.phase_index]
+        events = [(0, "end", "")]
+        events += [(m * 60, "warning", phase.warning_text(m)) for m in self.warning_minutes]
+        for source in self.event_sources:
+            events += [(secs, "announce", msg) for secs, msg in source(phase)]
+
+        self._events = [
+            PhaseEvent(-secs, next(self._event_seq), kind, msg)
+            for secs, kind, msg in events
+            if secs < remaining or kind == "end"
+        ]
+        heapq.heapify(self._events)
+
+    def _pop_due_events(self, remaining: float) -> List[PhaseEvent]:
+        """Pop every event whose deadline has passed — all of them, however long the stall."""
+        due = []
+        while self._events and self._events[0].seconds_before_end >= remaining:
+            due.append(heapq.heappop(self._events))
+        return due
+
+    def _fire_events(self, due: List[PhaseEvent]):
+        """Announce due events that aren't the phase end.
+
+        If a stall carried the countdown past several warnings, only the
+        latest one is still true, so the earlier ones are dropped.
+        """
+        warnings = [e for e in due if e.kind == "warning"]
+        for event in due:
+            if event.kind == "announce" or (warnings and event is warnings[-1]):
+                self.voice_monkey.announce(event.message)
 
-        return f"{ended} {starting}"
+    def _anchor_phase(self, remaining: float):
+        """Pin the running phase's deadline to the clocks.
+
+        Also records phase_ends_at (wall clock) for restart recovery and
+        queues the phase's timed events.
+        """
+        now_epoch = time.time()
+        self._anchor = (time.monotonic(), now_epoch, remaining)
+        self.timer_state.phase_ends_at = datetime.fromtimestamp(now_epoch + remaining).isoformat()
+        self._schedule_phase_events(remaining)
+
+    def _remaining(self) -> float:
+        """Seconds left in the running phase, derived from the anchor.
+
+        Elapsed time is the larger of the monotonic and wall-clock deltas:
+        monotonic is immune to clock changes, but on some platforms it stops
+        during suspend, which the wall clock still counts.
+        """
+        if self._anchor is None:
+            return float(self.timer_state.time_remaining_seconds)
+        mono0, epoch0, remaining0 = self._anchor
+        elapsed = max(time.monotonic() - mono0, time.time() - epoch0)
+        return remaining0 - elapsed
+
+    def _sync_remaining(self):
+        """Freeze the countdown at the current deadline-derived value (on pause)."""
+        self.timer_state.time_remaining_seconds = max(0, math.ceil(self._remaining()))
+        self._anchor = None
+
+    def _record_jitter(self, late_seconds: float):
+        late_ms = max(0.0, late_seconds * 1000)
+        self.tick_jitter["ticks"] += 1
+        self.tick_jitter["late_ms_total"] += late_ms
+        self.tick_jitter["late_ms_max"] = max(self.tick_jitter["late_ms_max"], late_ms)
+
+    def jitter_summary(self) -> str:
+        """One-line report of how late ticks fired."""
+        j = self.tick_jitter
+        avg = j["late_ms_total"] / j["ticks"] if j["ticks"] else 0.0
+        return f"{j['ticks']} ticks, avg {avg:.1f}ms late, max {j['late_ms_max']:.0f}ms late"
 
     def _save_state(self):
-        """Save timer state to persistence."""
+        """Save timer state to persistence.
+
+        Only called on start, pause, skip, reset, end of day and phase
+        transitions — not every tick.
+        """
         self.data_manager.save_timer_state(self.timer_state)
 
     def _cancel_tick(self):
@@ -236,11 +376,17 @@ class TimerManager:
         if self.after_id is not None:
             self.root_window.after_cancel(self.after_id)
             self.after_id = None
+        self._next_tick_due = None
+
+    def shutdown(self):
+        """Stop the tick loop and announcement workers (window close / dataset switch)."""
+        self._cancel_tick()
+        self.voice_monkey.shutdown()
 
     def set_announcement_mode(self, mode: str):
         """Switch between 'voice_monkey' and 'local' announcement modes and persist."""
         self.announcement_mode = mode
-        self.voice_monkey = self._local_client if mode == "local" else self._vm_client
+        self.voice_monkey.client = self._local_client if mode == "local" else self._vm_client
 
         # Persist to config
         config = self.data_manager.load_config()
@@ -0,0 +1,210 @@
+"""Headless timer service: runs TimerManager without Tk and serves it over a local socket.
+
+Usage:
+    python -m src.timer_service [--data-dir data]
+
+Protocol: newline-delimited JSON over TCP on 127.0.0.1. The port is written to
+<data dir>/timer_service.json so clients (TimerClient) can find the service.
+
+    → {"cmd": "state"}             ← {"ok": true, "epoch": "…", "seq": 12, "state": {...TimerState...}}
+    → {"cmd": "start" | "pause" | "skip" | "reset" | "end_day"}   (same reply)
+    → {"cmd": "set_announcement_mode", "mode": "local"}
+    → {"cmd": "jitter"}            ← {"ok": true, "summary": "..."}
+    → {"cmd": "subscribe"}         ← one {"seq": n, "state": {...}} line per state change
+    → {"cmd": "quit"}              stops the service
+"""
+import argparse
+import json
+import os
+import socketserver
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Dict
+
+from src.data_manager import DataManager
+from src.instance_lock import InstanceLock
+from src.integrations.http_session import close_session
+from src.service_loop import Broadcaster, ServiceLoop
+from src.timer_client import PORT_FILE, _read_port
+from src.timer_manager import TimerManager
+
+# Held by the running service; a second one for the same data folder exits
+LOCK_FILE = "timer_service.lock"
+
+
+class ServiceRunning(Exception):
+    """Another timer service already owns the data directory."""
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+
+class TimerService:
+    """Owns the TimerManager for one data directory and serves it to local clients."""
+
+    # Pending pushes per subscriber; a client that stops reading loses the
+    # oldest states rather than stalling the timer
+    SUBSCRIBER_BACKLOG = 100
+
+    def __init__(self, data_dir: str = "data", port: int = 0):
+        """
+        Initialize timer service.
+
+        Args:
+            data_dir: Dataset directory (timer_state.json, config.json)
+            port: TCP port on 127.0.0.1; 0 picks a free one
+
+        Raises:
+            ServiceRunning: if a service for data_dir is already up
+        """
+        self.data_dir = Path(data_dir)
+        # Two services would both tick, announce and write timer_state.json
+        self.lock = InstanceLock(self.data_dir / LOCK_FILE)
+        if _read_port(self.data_dir.resolve()) is not None or not self.lock.acquire():
+            raise ServiceRunning(f"a timer service is already running for {self.data_dir}")
+
+        self._seq = 0
+        self._epoch = uuid.uuid4().hex[:8]  # lets clients tell a restarted service apart
+        self.broadcaster = Broadcaster(self.SUBSCRIBER_BACKLOG)
+
+        self.loop = ServiceLoop()
+        self.data_manager = DataManager(data_dir=str(self.data_dir))
+        self.timer_manager = TimerManager(
+            data_manager=self.data_manager,
+            root_window=self.loop,
+            on_state_change_callback=self._on_state_change
+        )
+
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                service._handle(self)
+
+        self.server = _Server(("127.0.0.1", port), Handler)
+        self.port = self.server.server_address[1]
+        self.port_file = self.data_dir / PORT_FILE
+
+    # ── State pushes (loop thread) ──────────────────────────────────────
+
+    def _message(self) -> Dict:
+        """Current state, numbered so clients can drop out-of-order copies."""
+        self._seq += 1
+        return {"epoch": self._epoch, "seq": self._seq, "state": self.timer_manager.timer_state.to_dict()}
+
+    def _on_state_change(self, timer_state):
+        self.broadcaster.publish((json.dumps(self._message()) + "\n").encode("utf-8"))
+
+    # ── Requests (connection threads) ───────────────────────────────────
+
+    COMMANDS = {
+        "start": "start",
+        "pause": "pause",
+        "skip": "skip_to_next",
+        "reset": "reset",
+        "end_day": "end_day",
+    }
+
+    def _handle(self, conn: socketserver.StreamRequestHandler):
+        for raw in conn.rfile:
+            try:
+                request = json.loads(raw)
+                cmd = request.get("cmd")
+                if cmd == "subscribe":
+                    self._stream(conn)
+                    return
+                reply = self._dispatch(cmd, request)
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+            try:
+                conn.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+            except OSError:
+                return
+            if reply.get("quit"):
+                threading.Thread(target=self.stop, daemon=True).start()
+                return
+
+    def _dispatch(self, cmd: str, request: Dict) -> Dict:
+        tm = self.timer_manager
+        if cmd in self.COMMANDS:
+            return dict(ok=True, **self.loop.call(self._run, getattr(tm, self.COMMANDS[cmd])))
+        if cmd == "state":
+            return dict(ok=True, **self.loop.call(self._message))
+        if cmd == "set_announcement_mode":
+            self.loop.call(tm.set_announcement_mode, request["mode"])
+            return {"ok": True}
+        if cmd == "jitter":
+            return {"ok": True, "summary": self.loop.call(tm.jitter_summary)}
+        if cmd == "quit":
+            return {"ok": True, "quit": True}
+        return {"ok": False, "error": f"unknown command {cmd!r}"}
+
+    def _run(self, method: Callable) -> Dict:
+        """Loop thread: run a TimerManager command and report the resulting state."""
+        method()
+        return self._message()
+
+    def _stream(self, conn: socketserver.StreamRequestHandler):
+        """Push every state change to this connection until it goes away."""
+        q = self.broadcaster.subscribe((json.dumps(self.loop.call(self._message)) + "\n").encode("utf-8"))
+        try:
+            while True:
+                line = q.get()
+                if line is None:
+                    return
+                conn.wfile.write(line)
+        except OSError:
+            pass
+        finally:
+            self.broadcaster.unsubscribe(q)
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def serve_forever(self):
+        """Run until a quit command (or Ctrl+C). Blocks."""
+        threading.Thread(target=self.server.serve_forever, name="timer-ipc", daemon=True).start()
+        self.port_file.write_text(json.dumps({"port": self.port, "pid": os.getpid()}))
+        print(f"[TimerService] Serving {self.data_dir} on 127.0.0.1:{self.port}")
+        try:
+            self.loop.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._cleanup()
+
+    def stop(self):
+        """Stop serving; serve_forever() returns once the loop exits."""
+        self.loop.stop()
+
+    def _cleanup(self):
+        self.timer_manager.shutdown()
+        self.server.shutdown()
+        self.server.server_close()
+        self.broadcaster.close()
+        try:
+            if json.loads(self.port_file.read_text()).get("pid") == os.getpid():
+                self.port_file.unlink()
+        except (OSError, ValueError):
+            pass
+        self.lock.release()
+        close_session()
+        print(f"[TimerService] {self.timer_manager.jitter_summary()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless timer service for the Daily Scheduler")
+    parser.add_argument("--data-dir", default="data", help="Dataset directory (default: data)")
+    parser.add_argument("--port", type=int, default=0, help="TCP port on 127.0.0.1 (default: any free port)")
+    args = parser.parse_args()
+    try:
+        service = TimerService(args.data_dir, args.port)
+    except ServiceRunning as e:
+        print(f"[TimerService] Not starting: {e}")
+        return
+    service.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,101 @@ URGENCY_COLORS = {
 }
 
 
+class BillRow(tk.Frame):
+    """One bill row; show() updates it in place for a bill's current state."""
+
+    PACK_OPTIONS = {"fill": "x", "pady": 1, "padx": 2}
+
+    def __init__(self, block):
+        super().__init__(block.scrollable_frame, relief="flat", borderwidth=0)
+        self.bill = None
+        self._shown = None
+
+        # Urgency indicator (colored bar on left)
+        self.indicator = tk.Frame(self, width=4)
+        self.indicator.pack(side="left", fill="y", padx=(0, 6))
+        self.indicator.pack_propagate(False)
+
+        # Bill name
+        self.name_label = tk.Label(self, anchor="w", width=22)
+        self.name_label.pack(side="left", padx=(2, 8), pady=4)
+
+        # Amount
+        self.amount_label = tk.Label(self, font=("Arial", 10), anchor="e", width=8)
+        self.amount_label.pack(side="left", padx=(0, 8), pady=4)
+
+        # Due status
+        self.status_label = tk.Label(self, anchor="w", width=16)
+        self.status_label.pack(side="left", padx=(0, 8), pady=4)
+
+        # Notes indicator (small "i" if bill has notes) — packed only when needed
+        self.notes_label = tk.Label(self, text="i", font=("Arial", 8, "italic"), fg="#5A8A8A", width=2)
+
+        # Paid checkbox — acts on whichever bill the row shows
+        self.paid_var = tk.IntVar(value=0)
+        self.paid_cb = tk.Checkbutton(
+            self,
+            variable=self.paid_var,
+            command=lambda: block._on_paid_toggled(self.bill, self.paid_var),
+            selectcolor="#2C2C2C",
+        )
+        self.paid_cb.pack(side="right", padx=(0, 6), pady=4)
+
+        self._widgets = (self, self.name_label, self.amount_label, self.status_label,
+                         self.notes_label, self.paid_cb)
+        self.block = block
+
+    def show(self, bill, status, in_cluster=False):
+        """Point the row at a bill and redraw whatever changed since last time."""
+        self.bill = bill
+        is_paid = bill.paid_this_month
+        shown = (bill.name, bill.amount, bill.amount_variable, bill.urgency, bool(bill.notes),
+                 is_paid, status.overdue, status.status_text, in_cluster)
+        if shown == self._shown:
+            return
+        self._shown = shown
+
+        # Row background
+        if is_paid:
+            row_bg = "#2A2A2A"  # Dimmed
+        elif status.overdue:
+            row_bg = "#4A1A1A"  # Red-tinted
+        elif in_cluster:
+            row_bg = "#3A2A1A"  # Warm tinted for cluster
+        else:
+            row_bg = "#2A3A3A"  # Default teal-dark
+        for widget in self._widgets:
+            widget.config(bg=row_bg)
+        self.paid_cb.config(activebackground=row_bg)
+
+        self.indicator.config(bg=URGENCY_COLORS.get(bill.urgency, URGENCY_COLORS["gray"]))
+
+        self.name_label.config(
+            text=bill.name,
+            font=("Arial", 10, "overstrike") if is_paid else ("Arial", 10),
+            fg="#777777" if is_paid else "white"
+        )
+        self.amount_label.config(
+            text=self.block.bill_manager.format_amount(bill),
+            fg="#777777" if is_paid else "#CCCCCC"
+        )
+
+        if status.overdue:
+            status_fg, status_font = "#FF4444", ("Arial", 9, "bold")
+        elif is_paid:
+            status_fg, status_font = "#4CAF50", ("Arial", 9, "bold")
+        else:
+            status_fg, status_font = "#AAAAAA", ("Arial", 9)
+        self.status_label.config(text=status.status_text, fg=status_fg, font=status_font)
+
+        if bill.notes:
+            self.notes_label.pack(side="left", padx=(0, 4), pady=4, after=self.status_label)
+        else:
+            self.notes_label.pack_forget()
+
+        self.paid_var.set(1 if is_paid else 0)
+
+
 class BillBlock(tk.LabelFrame):
     """Panel showing bills that are due, overdue, or recently paid."""
 
@@ -30,7 +125,7 @@ class BillBlock(tk.LabelFrame):
         self.bill_manager = bill_manager
         self.on_change_callback = on_change_callback
         self.open_dialog_callback = open_dialog_callback
-        self._bill_rows = []
+        self._rows = {}  # bill id -> BillRow currently shown
 
         self.create_widgets()
         self.refresh()
@@ -91,6 +186,33 @@ class BillBlock(tk.LabelFrame):
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        # Cluster header and empty-state label are built once and packed as needed
+        self.cluster_header = tk.Frame(self.scrollable_frame, bg="#4A1A1A")
+        self.cluster_label = tk.Label(
+            self.cluster_header,
+            text="",
+            font=("Arial", 10, "bold"),
+            bg="#4A1A1A",
+            fg="#FF6B6B",
+            anchor="w",
+            padx=8,
+            pady=4
+        )
+        self.cluster_label.pack(fill="x")
+
+        self.empty_label = tk.Label(
+            self.scrollable_frame,
+            text="No bills due right now.",
+            font=("Arial", 10, "italic"),
+            fg="#AAAAAA",
+            bg="#1A3A3A",
+            pady=15
+        )
+        self._pack_options = {
+            self.cluster_header: {"fill": "x", "pady": (0, 3)},
+            self.empty_label: {},
+        }
+
         # Bottom button
         btn_frame = tk.Frame(self, bg="#1A3A3A")
         btn_frame.pack(fill="x", pady=(5, 0))
@@ -112,174 +234,86 @@ class BillBlock(tk.LabelFrame):
             self.open_dialog_callback()
 
     def refresh(self):
-        """Rebuild the bill list from current bill_manager state."""
+        """Bring the bill list in line with current bill_manager state.
+
+        Classifies every bill once (BillManager.snapshot), then updates only
+        the rows whose displayed state changed, builds rows for bills that
+        became visible and destroys rows for bills that dropped off.
+        """
         if self.bill_manager is None:
             return
 
-        today = date.today()
+        snap = self.bill_manager.snapshot(date.today())
 
         # Update header counts
-        overdue, upcoming = self.bill_manager.get_bill_counts(today)
-        paid_count = sum(1 for b in self.bill_manager.bills if b.paid_this_month)
         parts = []
-        if overdue > 0:
-            parts.append(f"{overdue} overdue")
-        if upcoming > 0:
-            parts.append(f"{upcoming} upcoming")
-        if paid_count > 0:
-            parts.append(f"{paid_count} paid")
-        self.counts_label.config(text=" | ".join(parts) if parts else "")
-
-        # Clear existing rows
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self._bill_rows = []
+        if snap.overdue_count > 0:
+            parts.append(f"{snap.overdue_count} overdue")
+        if snap.upcoming_count > 0:
+            parts.append(f"{snap.upcoming_count} upcoming")
+        if snap.paid_count > 0:
+            parts.append(f"{snap.paid_count} paid")
+        counts_text = " | ".join(parts) if parts else ""
+        if self.counts_label.cget("text") != counts_text:
+            self.counts_label.config(text=counts_text)
 
         # Week 1 cluster
-        cluster_bills, cluster_total, cluster_variable = \
-            self.bill_manager.get_week1_cluster(today)
-        cluster_ids = {b.id for b in cluster_bills}
-
-        if cluster_bills:
-            prefix = "~" if cluster_variable else ""
-            total_str = f"{prefix}${cluster_total:,.0f}" if cluster_total == int(cluster_total) \
-                else f"{prefix}${cluster_total:,.2f}"
-            cluster_header = tk.Frame(self.scrollable_frame, bg="#4A1A1A")
-            cluster_header.pack(fill="x", pady=(0, 3))
-            tk.Label(
-                cluster_header,
-                text=f"WEEK 1 CLUSTER \u2014 {total_str} total",
-                font=("Arial", 10, "bold"),
-                bg="#4A1A1A",
-                fg="#FF6B6B",
-                anchor="w",
-                padx=8,
-                pady=4
-            ).pack(fill="x")
-
-        # Visible bills
-        visible = self.bill_manager.get_visible_bills(today)
-
-        if not visible:
-            tk.Label(
-                self.scrollable_frame,
-                text="No bills due right now.",
-                font=("Arial", 10, "italic"),
-                fg="#AAAAAA",
-                bg="#1A3A3A",
-                pady=15
-            ).pack()
+        order = []
+        if snap.cluster_bills:
+            prefix = "~" if snap.cluster_variable else ""
+            total = snap.cluster_total
+            total_str = f"{prefix}${total:,.0f}" if total == int(total) else f"{prefix}${total:,.2f}"
+            cluster_text = f"WEEK 1 CLUSTER \u2014 {total_str} total"
+            if self.cluster_label.cget("text") != cluster_text:
+                self.cluster_label.config(text=cluster_text)
+            order.append(self.cluster_header)
+        cluster_ids = {b.id for b in snap.cluster_bills}
+
+        # Visible bills — reuse rows by bill id
+        rows = {}
+        for bill in snap.visible:
+            row = self._rows.pop(bill.id, None) or BillRow(self)
+            row.show(bill, snap.statuses[bill.id], bill.id in cluster_ids)
+            rows[bill.id] = row
+            order.append(row)
+        for row in self._rows.values():
+            row.destroy()
+        self._rows = rows
+
+        if not snap.visible:
+            order.append(self.empty_label)
+
+        self._pack_in_order(order)
+
+    def _pack_in_order(self, widgets):
+        """Make widgets the scrollable frame's packed children, in this order."""
+        for widget in self.scrollable_frame.pack_slaves():
+            if widget not in widgets:
+                widget.pack_forget()
+        if self.scrollable_frame.pack_slaves() == widgets:
             return
-
-        for bill in visible:
-            in_cluster = bill.id in cluster_ids
-            self._add_bill_row(bill, today, in_cluster)
-
-    def _add_bill_row(self, bill, today, in_cluster=False):
-        """Add a single bill row to the scrollable area."""
-        is_overdue = self.bill_manager.is_overdue(bill, today)
-        is_paid = bill.paid_this_month
-
-        # Row background
-        if is_paid:
-            row_bg = "#2A2A2A"  # Dimmed
-        elif is_overdue:
-            row_bg = "#4A1A1A"  # Red-tinted
-        elif in_cluster:
-            row_bg = "#3A2A1A"  # Warm tinted for cluster
-        else:
-            row_bg = "#2A3A3A"  # Default teal-dark
-
-        row = tk.Frame(self.scrollable_frame, bg=row_bg, relief="flat", borderwidth=0)
-        row.pack(fill="x", pady=1, padx=2)
-
-        # Urgency indicator (colored bar on left)
-        urgency_color = URGENCY_COLORS.get(bill.urgency, URGENCY_COLORS["gray"])
-        indicator = tk.Frame(row, bg=urgency_color, width=4)
-        indicator.pack(side="left", fill="y", padx=(0, 6))
-        indicator.pack_propagate(False)
-
-        # Bill name
-        name_fg = "#777777" if is_paid else "white"
-        name_font = ("Arial", 10, "overstrike") if is_paid else ("Arial", 10)
-        tk.Label(
-            row,
-            text=bill.name,
-            font=name_font,
-            bg=row_bg,
-            fg=name_fg,
-            anchor="w",
-            width=22
-        ).pack(side="left", padx=(2, 8), pady=4)
-
-        # Amount
-        amount_str = self.bill_manager.format_amount(bill)
-        amount_fg = "#777777" if is_paid else "#CCCCCC"
-        tk.Label(
-            row,
-            text=amount_str,
-            font=("Arial", 10),
-            bg=row_bg,
-            fg=amount_fg,
-            anchor="e",
-            width=8
-        ).pack(side="left", padx=(0, 8), pady=4)
-
-        # Due status
-        status_str = self.bill_manager.format_due_status(bill, today)
-        if status_str == "OVERDUE":
-            status_fg = "#FF4444"
-            status_font = ("Arial", 9, "bold")
-        elif status_str == "PAID":
-            status_fg = "#4CAF50"
-            status_font = ("Arial", 9, "bold")
-        else:
-            status_fg = "#AAAAAA"
-            status_font = ("Arial", 9)
-
-        tk.Label(
-            row,
-            text=status_str,
-            font=status_font,
-            bg=row_bg,
-            fg=status_fg,
-            anchor="w",
-            width=16
-        ).pack(side="left", padx=(0, 8), pady=4)
-
-        # Notes indicator (small "i" if bill has notes)
-        if bill.notes:
-            tk.Label(
-                row,
-                text="i",
-                font=("Arial", 8, "italic"),
-                bg=row_bg,
-                fg="#5A8A8A",
-                width=2
-            ).pack(side="left", padx=(0, 4), pady=4)
-
-        # Paid checkbox
-        paid_var = tk.IntVar(value=1 if is_paid else 0)
-        cb = tk.Checkbutton(
-            row,
-            variable=paid_var,
-            command=lambda b=bill, v=paid_var: self._on_paid_toggled(b, v),
-            bg=row_bg,
-            selectcolor="#2C2C2C",
-            activebackground=row_bg,
-        )
-        cb.pack(side="right", padx=(0, 6), pady=4)
-
-        self._bill_rows.append(row)
+        prev = None
+        for widget in widgets:
+            opts = dict(self._pack_options.get(widget, BillRow.PACK_OPTIONS))
+            if prev is not None:
+                opts["after"] = prev
+            else:
+                slaves = self.scrollable_frame.pack_slaves()
+                if slaves and slaves[0] is not widget:
+                    opts["before"] = slaves[0]
+            widget.pack(**opts)
+            prev = widget
 
     def _on_paid_toggled(self, bill, paid_var):
         """Handle paid checkbox toggle."""
+        if bill is None:
+            return
         if paid_var.get():
             self.bill_manager.mark_paid(bill.id)
         else:
             self.bill_manager.mark_unpaid(bill.id)
 
-        # Refresh to re-sort and update visuals
+        # Refresh to re-sort and update the rows that changed
         self.refresh()
 
         if self.on_change_callback:
@@ -6,10 +6,19 @@ from .task_queue import TaskQueue
 from .timer_bar import TimerBar
 from .bill_block import BillBlock
 from ..data_manager import DataManager
-from ..timer_manager import TimerManager
+from ..timer_client import TimerClient, make_timer
 from ..bill_manager import BillManager
+from ..save_coalescer import SaveCoalescer
+from ..instance_lock import InstanceLock
+from ..task_index import TaskIndex
+from ..workspace import WORKSPACE_LOCK_FILE, roll_over_day
+from ..integrations.background_sync import BackgroundSync
+from ..integrations.http_session import close_session
 
 class MainWindow(tk.Tk):
+    # Stores written by save_data; changes are marked per store and flushed together
+    SAVE_STORES = ("tasks", "recurring", "bills")
+
     def __init__(self):
         super().__init__()
 
@@ -33,11 +42,7 @@ class MainWindow(tk.Tk):
         self.load_data()
 
         # Initialize timer manager (before create_widgets so UI can reference it)
-        self.timer_manager = TimerManager(
-            data_manager=self.data_manager,
-            root_window=self,
-            on_state_change_callback=self.on_timer_state_changed
-        )
+        self.timer_manager = make_timer(self.data_manager, self, self.on_timer_state_changed)
 
         # Initialize bill manager (home dataset only)
         if self.active_dataset != "work":
@@ -48,9 +53,24 @@ class MainWindow(tk.Tk):
         self._highlighted_phase = None
         self._prev_timer_phase = None
 
+        # Write-behind saving: bursts of edits collapse into one flush
+        self._saver = SaveCoalescer(
+            self,
+            self._write_stores,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to save: {str(e)}"),
+            on_dirty=lambda: self.status_label.config(text="Unsaved changes", fg="#FF9800")
+        )
+
+        # Cloud sync runs on a worker thread; results are applied on the Tk thread
+        self._sync_runner = BackgroundSync(self, self.data_manager.cloudflare_sync)
+        self._sync_progress = 0
+
         self.create_widgets()
         self.bind_events()
 
+        # id → (location, position) over the live task lists, for O(1) moves
+        self.task_index = TaskIndex(self._task_lists)
+
         # Validate timer configuration on startup
         if not self.timer_manager.validate_config():
             messagebox.showwarning(
@@ -62,11 +82,27 @@ class MainWindow(tk.Tk):
                 "Timer will work without announcements."
             )
 
+        self._dataset_lock = None
+        self._lock_dataset()
+
         # Auto-download from cloud on startup (home dataset only)
         if self.active_dataset == "home" and self.data_manager.cloudflare_sync.worker_url:
             print("[Startup] Downloading latest data from cloud...")
             self.after(1000, self.startup_sync)  # Delay 1 second to let UI load
 
+    def _lock_dataset(self):
+        """Hold the dataset's workspace lock so the control API won't start on it."""
+        if self._dataset_lock is not None:
+            self._dataset_lock.release()
+        self._dataset_lock = InstanceLock(self.data_manager.data_dir / WORKSPACE_LOCK_FILE)
+        if not self._dataset_lock.acquire():
+            messagebox.showwarning(
+                "Dataset In Use",
+                "The control API (or another window) already has this dataset open.\n\n"
+                "Both keep their own copy of the tasks, so edits made here and there "
+                "can overwrite each other. Stop the other one before editing."
+            )
+
     def load_data(self):
         """Load tasks from JSON"""
         data = self.data_manager.load_tasks()
@@ -379,55 +415,65 @@ class MainWindow(tk.Tk):
             self.main_frame.grid_rowconfigure(i + 2, weight=1)
 
     def auto_save(self):
-        """Background auto-save"""
-        self.save_data(silent=True)
+        """Background auto-save.
+
+        Flushes anything still pending and picks up task text typed into an
+        entry that hasn't lost focus yet (those edits don't fire on_data_changed).
+        """
+        self._saver.flush(["tasks"])
         self.after(30000, self.auto_save)
 
-    def on_data_changed(self):
-        """Called when any data changes in the UI - auto-save immediately"""
-        self.save_data(silent=True)
+    def on_data_changed(self, *stores):
+        """Called when any data changes in the UI - schedule a coalesced save.
+
+        Args:
+            stores: Which stores changed ('tasks', 'recurring', 'bills');
+                defaults to tasks and bills, the two that UI callbacks touch
+        """
+        self._saver.mark_dirty(*(stores or ("tasks", "bills")))
 
     def save_data(self, silent=False):
-        """Save all tasks to JSON"""
-        try:
+        """Save all tasks to JSON immediately (bypasses the write-behind delay)"""
+        if self._saver.flush(self.SAVE_STORES) and not silent:
+            messagebox.showinfo("Saved", "Tasks saved successfully!")
+
+    def _write_stores(self, stores):
+        """Flush callback for the save coalescer — write the named stores to disk."""
+        if "tasks" in stores:
             # Collect data from widgets
             planning = self.planning_block.get_data()
             blocks = [b.get_data() for b in self.block_widgets]
             queue = self.task_queue.get_data()
-
             self.data_manager.save_tasks(planning, blocks, queue, self.current_day_date)
+        if "recurring" in stores:
             self.data_manager.save_recurring(self.recurring_data)
-            if self.bill_manager is not None:
-                self.bill_manager.save()
-
-            self.status_label.config(text="Saved", fg="green")
+        if "bills" in stores and self.bill_manager is not None:
+            self.bill_manager.save()
 
-            if not silent:
-                messagebox.showinfo("Saved", "Tasks saved successfully!")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save: {str(e)}")
+        self.status_label.config(text="Saved", fg="green")
 
     def _on_close(self):
         """Save all data silently before closing, then destroy the window."""
+        self._sync_runner.shutdown()
         self.save_data(silent=True)
+        print(f"[Save] {self._saver.summary()}")
+        print(f"[Timer] {self.timer_manager.jitter_summary()}")
+        self.timer_manager.shutdown()
+        self._dataset_lock.release()
+        close_session()
         self.destroy()
 
     def on_timer_state_changed(self, timer_state):
         """Called when timer state changes - update UI"""
-        current_phase = timer_state.current_phase
+        phase = self.timer_manager.schedule.get(timer_state.phase_index)
         # Detect block transitions and escalate high-priority tasks
         prev = self._prev_timer_phase
-        if prev and prev.startswith("Block") and current_phase != prev:
-            try:
-                block_idx = int(prev.split()[1]) - 1  # 0-indexed
-                self.escalate_high_priority_tasks(block_idx)
-            except (IndexError, ValueError):
-                pass
-        self._prev_timer_phase = current_phase
+        if prev is not None and prev.block_index is not None and phase != prev:
+            self.escalate_high_priority_tasks(prev.block_index)
+        self._prev_timer_phase = phase
 
         self.timer_bar.update_display(timer_state)
-        self.highlight_active_block(current_phase)
+        self.highlight_active_block(phase)
 
     def escalate_high_priority_tasks(self, block_idx):
         """Move incomplete high-priority tasks from block_idx to next block or queue."""
@@ -444,52 +490,45 @@ class MainWindow(tk.Tk):
 
         for task in to_escalate:
             # Remove from current block
-            block_data.tasks.remove(task)
+            self.task_index.remove(task)
             task.blocks_escalated += 1
 
-            if block_idx < 7:
+            if block_idx + 1 < self.timer_manager.schedule.block_count:
                 # Move to next block
                 self.block_widgets[block_idx + 1].add_task(task)
             else:
-                # Block 8 expired — drop to queue
+                # Last block of the day expired — drop to queue
                 self.queue_data.append(task)
 
         # Refresh widgets
         block_widget.reload(block_data)
         self.task_queue.refresh(self.queue_data)
-        self.save_data(silent=True)
+        self.on_data_changed("tasks")
 
-    def highlight_active_block(self, current_phase):
-        """Highlight the currently active block with colored border"""
-        # Skip all work if the phase hasn't changed
-        if current_phase == self._highlighted_phase:
+    def highlight_active_block(self, phase):
+        """Highlight the widget the active phase works in (planning or a block)"""
+        location = (phase.location if phase else None) or ""  # "" for breaks
+        # Skip all work if the highlighted location hasn't changed
+        if location == self._highlighted_phase:
             return
 
+        widgets = {"planning": self.planning_block}
+        widgets.update((f"block:{i}", w) for i, w in enumerate(self.block_widgets))
+
         # Remove highlight from the previously active widget only
         prev = self._highlighted_phase
-        if prev == "Planning":
-            self.planning_block.set_highlight(False)
-        elif prev and prev.startswith("Block"):
-            try:
-                self.block_widgets[int(prev.split()[1]) - 1].set_highlight(False)
-            except (IndexError, ValueError):
-                pass
-        else:
+        if prev is None:
             # First call or unknown previous state — clear everything once
-            self.planning_block.set_highlight(False)
-            for block_widget in self.block_widgets:
-                block_widget.set_highlight(False)
+            for widget in widgets.values():
+                widget.set_highlight(False)
+        elif prev in widgets:
+            widgets[prev].set_highlight(False)
 
-        self._highlighted_phase = current_phase
+        self._highlighted_phase = location
 
         # Highlight the new active block
-        if current_phase == "Planning":
-            self.planning_block.set_highlight(True)
-        elif current_phase.startswith("Block"):
-            try:
-                self.block_widgets[int(current_phase.split()[1]) - 1].set_highlight(True)
-            except (IndexError, ValueError):
-                pass
+        if location in widgets:
+            widgets[location].set_highlight(True)
 
     def start_new_day(self):
         """Move incomplete tasks to queue and reset timer"""
@@ -500,57 +539,30 @@ class MainWindow(tk.Tk):
         from datetime import date as _date
         self.current_day_date = _date.today().isoformat()
 
-        # Count stats before clearing
-        total_tasks = 0
-        completed_tasks = 0
-
-        # Process all blocks (including planning)
-        all_block_widgets = [self.planning_block] + self.block_widgets
-
-        for block_widget in all_block_widgets:
-            block_data = block_widget.get_data()
-            block_name = block_data.name
-
-            for task in block_data.tasks:
-                if task.text.strip():  # Only count non-empty tasks
-                    total_tasks += 1
-                    if task.completed:
-                        completed_tasks += 1
-                        # Log completed task
-                        self.data_manager.log_completed_task(task, block_name)
-                    elif task.is_recurring:
-                        # Recurring incomplete tasks are silently discarded
-                        pass
-                    else:
-                        # Move to queue
-                        self.data_manager.log_incomplete_task(task, block_name)
-                        self.queue_data.append(task)
-
-            # Clear block
-            block_widget.clear_tasks()
-
-        # Update stats
-        if total_tasks > 0:
-            self.data_manager.update_daily_stats(completed_tasks, total_tasks)
-
-        # Apply recurring tasks to blocks before refreshing UI
+        # Log, clear and queue on the block data, then apply recurring tasks
+        planning = self.planning_block.get_data()
+        blocks = [bw.get_data() for bw in self.block_widgets]
+        completed_tasks, total_tasks = roll_over_day(
+            self.data_manager, planning, blocks, self.queue_data,
+            self.recurring_data, self.current_day_date
+        )
         if self.recurring_data:
-            self.data_manager.apply_recurring_tasks(
-                [bw.block_data for bw in self.block_widgets],
-                self.recurring_data,
-                day_date=self.current_day_date
-            )
             # Persist updated last_applied_date on each template
             self.data_manager.save_recurring(self.recurring_data)
-            for bw in self.block_widgets:
-                bw.reload(bw.block_data)
+
+        # Bring the block widgets in line with the cleared/refilled data
+        self.planning_block.reload(planning)
+        for bw in self.block_widgets:
+            bw.reload(bw.block_data)
 
         # Refresh queue display
         self.task_queue.refresh(self.queue_data)
 
         # Reset timer
         self.timer_manager.reset()
-        self.data_manager.clear_timer_state()
+        if not isinstance(self.timer_manager, TimerClient):
+            # The timer service owns timer_state.json and has just rewritten it
+            self.data_manager.clear_timer_state()
 
         # Check if bills need month reset
         if self.bill_manager is not None:
@@ -569,42 +581,43 @@ class MainWindow(tk.Tk):
         """Move a task from a block back to the queue"""
         self.queue_data.append(task)
         self.task_queue.refresh(self.queue_data)
-        self.save_data(silent=True)
+        self.on_data_changed("tasks")
 
     def move_from_queue(self, task, target_block_index):
         """Move task from queue to specified block"""
         # Remove from queue data
-        if task in self.queue_data:
-            self.queue_data.remove(task)
+        self.task_index.remove(task)
 
-        # Add to target block
+        # Add to target block (add_task fires on_data_changed)
         self.block_widgets[target_block_index].add_task(task)
 
-        # Save
-        self.save_data(silent=True)
-
     def move_from_queue_to_planning(self, task):
         """Move task from queue to planning block"""
-        if task in self.queue_data:
-            self.queue_data.remove(task)
+        self.task_index.remove(task)
 
         # Add to planning block
         self.planning_block.block_data.tasks.append(task)
         self.planning_block.add_task_item(task)
 
         # Save
-        self.save_data(silent=True)
+        self.on_data_changed("tasks")
 
     def move_from_planning(self, task, target_block_index):
         """Move task from planning block to specified block"""
         # Remove from planning (widget handles its own list + block_data)
         self.planning_block.remove_task(task)
 
-        # Add to target block
+        # Add to target block (add_task fires on_data_changed)
         self.block_widgets[target_block_index].add_task(task)
 
-        # Save
-        self.save_data(silent=True)
+    def _task_lists(self):
+        """Live task lists by location, for the task index."""
+        lists = {"planning": self.planning_block.block_data.tasks}
+        lists.update(
+            (f"block:{i}", bw.block_data.tasks) for i, bw in enumerate(self.block_widgets)
+        )
+        lists["queue"] = self.queue_data
+        return lists
 
     def open_recurring_dialog(self):
         """Open the recurring tasks management dialog"""
@@ -614,7 +627,7 @@ class MainWindow(tk.Tk):
     def update_recurring_data(self, recurring_data):
         """Callback from recurring dialog — update and save"""
         self.recurring_data = recurring_data
-        self.data_manager.save_recurring(self.recurring_data)
+        self.on_data_changed("recurring")
 
     def open_bill_dialog(self):
         """Open the bill management dialog."""
@@ -626,7 +639,7 @@ class MainWindow(tk.Tk):
     def update_bills_data(self, bills_list):
         """Callback from bill dialog — update bill_manager and refresh UI."""
         self.bill_manager.bills = bills_list
-        self.bill_manager.save()
+        self.on_data_changed("bills")
         self.bill_block.refresh()
 
     def quit_app(self):
@@ -641,7 +654,12 @@ class MainWindow(tk.Tk):
         self.quit()
 
     def sync_now(self):
-        """Manually trigger cloud sync"""
+        """Manually trigger cloud sync (runs in the background; click again to cancel)"""
+        if self._sync_runner.running:
+            self._sync_runner.cancel()
+            self.sync_btn.config(state="disabled", text="Cancelling...")
+            return
+
         # Show confirmation before syncing
         confirm = messagebox.askyesno(
             "Sync to Cloud",
@@ -652,52 +670,93 @@ class MainWindow(tk.Tk):
         if not confirm:
             return
 
-        # Disable button during sync
-        self.sync_btn.config(state="disabled", text="Syncing...")
-        self.update()
+        # Save current UI state to disk before uploading so the
+        # cloud gets what the user is actually looking at right now.
+        self.save_data(silent=True)
+        self._start_sync(self.data_manager.sync_to_cloud, self._on_sync_done)
+
+    def _start_sync(self, job, on_done) -> bool:
+        """Run a sync job in the background with progress shown in the status label."""
+        self._sync_progress = 0
+        started = self._sync_runner.start(
+            job,
+            on_done=on_done,
+            on_progress=self._on_sync_progress,
+            # Unsaved edits go to disk first so the commit can see (and keep) them
+            before_commit=self._saver.flush
+        )
+        if started:
+            self.status_label.config(text="Syncing...", fg="#2196F3")
+            self.sync_btn.config(text="✕ Cancel Sync", bg="#F44336", state="normal")
+        return started
+
+    def _on_sync_progress(self, filename, ok):
+        """Per-file status while a background sync runs."""
+        self._sync_progress += 1
+        mark = "✓" if ok else "✗"
+        self.status_label.config(
+            text=f"Syncing... {filename} {mark} ({self._sync_progress})",
+            fg="#2196F3" if ok else "#FF9800"
+        )
 
-        try:
-            # Save current UI state to disk before uploading so the
-            # cloud gets what the user is actually looking at right now.
-            self.save_data(silent=True)
+    def _reset_sync_button(self):
+        if self.active_dataset != "work":
+            sync_configured = bool(self.data_manager.cloudflare_sync.worker_url)
+            self.sync_btn.config(
+                state="normal" if sync_configured else "disabled",
+                bg="#2196F3" if sync_configured else "#555555",
+                text="☁ Sync Now"
+            )
 
-            success = self.data_manager.sync_to_cloud()
+    def _on_sync_done(self, outcome):
+        """Tk thread: staged files are on disk; refresh the UI once and report."""
+        self._reset_sync_button()
+        if outcome.cancelled:
+            self.status_label.config(text="Sync cancelled", fg="#AAAAAA")
+            return
+        if outcome.error is not None:
+            self.status_label.config(text="Sync failed", fg="#F44336")
+            messagebox.showerror("Sync Failed", f"Error during sync: {outcome.error}")
+            return
 
-            if success:
-                self.reload_from_disk()
-                messagebox.showinfo("Sync Complete",
-                    "Data synced to cloud and display updated!")
-            else:
-                messagebox.showwarning(
-                    "Sync Issues",
-                    "Sync completed with some errors. Check console for details."
-                )
-        except Exception as e:
-            messagebox.showerror("Sync Failed", f"Error during sync: {e}")
-        finally:
-            if self.active_dataset != "work":
-                sync_configured = bool(self.data_manager.cloudflare_sync.worker_url)
-                self.sync_btn.config(
-                    state="normal" if sync_configured else "disabled",
-                    bg="#2196F3" if sync_configured else "#555555",
-                    text="☁ Sync Now"
-                )
+        if outcome.written:
+            self.reload_from_disk()
+        if outcome.result:
+            self.status_label.config(text="Synced", fg="green")
+            messagebox.showinfo("Sync Complete",
+                "Data synced to cloud and display updated!")
+        else:
+            self.status_label.config(text="Sync issues", fg="#FF9800")
+            messagebox.showwarning(
+                "Sync Issues",
+                "Sync completed with some errors. Check console for details."
+            )
 
     def startup_sync(self):
-        """Download latest cloud data, hot-reload UI, then apply any recurring
-        tasks that haven't fired yet today (e.g. templates added after the last
-        Start New Day click)."""
-        try:
-            self.data_manager.download_from_cloud()
-            print("[Startup] Cloud data downloaded - reloading UI...")
+        """Download latest cloud data in the background, hot-reload UI, then
+        apply any recurring tasks that haven't fired yet today (e.g. templates
+        added after the last Start New Day click)."""
+        if not self._start_sync(self.data_manager.download_from_cloud, self._on_startup_sync_done):
+            self._apply_missing_recurring()
+
+    def _on_startup_sync_done(self, outcome):
+        """Tk thread: startup download finished (or failed / was cancelled)."""
+        self._reset_sync_button()
+        if outcome.error is not None:
+            print(f"[Startup] Failed to download cloud data: {outcome.error}")
+            # Continue with local data as-is
+        elif outcome.cancelled:
+            print("[Startup] Cloud download cancelled - using local data")
+        elif outcome.written:
+            print(f"[Startup] Cloud data downloaded ({', '.join(outcome.written)}) - reloading UI...")
             self.reload_from_disk()
             # Reload recurring templates from disk — may have been updated by sync
             self.recurring_data = self.data_manager.load_recurring()
             print("[Startup] UI reloaded with cloud data")
-        except Exception as e:
-            print(f"[Startup] Failed to download cloud data: {e}")
-            # Continue with local data as-is
+        self.status_label.config(text="Ready", fg="#AAAAAA")
+        self._apply_missing_recurring()
 
+    def _apply_missing_recurring(self):
         # Apply any recurring tasks not yet physically present in their target blocks.
         # fill_missing=True checks block content rather than last_applied_date, so
         # tasks added after today's Start New Day (or lost to a sync) get filled in
@@ -730,6 +789,7 @@ class MainWindow(tk.Tk):
             block_widget.reload(self.blocks_data[i])
 
         self.task_queue.refresh(self.queue_data)
+        self.task_index.rebuild()
 
         # Reload bills from disk (may have been updated by cloud sync)
         if self.bill_manager is not None:
@@ -744,8 +804,10 @@ class MainWindow(tk.Tk):
         # Save current data first
         self.save_data(silent=True)
 
-        # Stop timer tick
-        self.timer_manager._cancel_tick()
+        # Stop timer tick, announcement workers and any running sync
+        self.timer_manager.shutdown()
+        self._sync_runner.shutdown()
+        self._reset_sync_button()
 
         # Rebuild DataManager and TimerManager for new dataset
         data_dir = "data-work" if mode == "work" else "data"
@@ -754,11 +816,9 @@ class MainWindow(tk.Tk):
         # Work is always local-only — disable sync regardless of config
         if mode == "work":
             self.data_manager.cloudflare_sync.enabled = False
-        self.timer_manager = TimerManager(
-            data_manager=self.data_manager,
-            root_window=self,
-            on_state_change_callback=self.on_timer_state_changed
-        )
+        self._sync_runner = BackgroundSync(self, self.data_manager.cloudflare_sync)
+        self.timer_manager = make_timer(self.data_manager, self, self.on_timer_state_changed)
+        self._lock_dataset()
 
         # Reset highlight and timer bar cache for fresh state
         self._highlighted_phase = None
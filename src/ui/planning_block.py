@@ -1,5 +1,5 @@
 import tkinter as tk
-from .task_item import TaskItem
+from .task_item import TaskItem, reconcile_task_items
 from ..models.task import Task
 
 class PlanningBlock(tk.LabelFrame):
@@ -54,9 +54,9 @@ class PlanningBlock(tk.LabelFrame):
         for task in self.block_data.tasks:
             self.add_task_item(task)
 
-    def add_task_item(self, task):
-        """Add a task item widget to the list"""
-        task_item = TaskItem(
+    def _make_task_item(self, task):
+        """Build (but don't pack) the row widget for a task"""
+        return TaskItem(
             self.scrollable_frame,
             task,
             on_change_callback=self.on_task_changed,
@@ -65,6 +65,10 @@ class PlanningBlock(tk.LabelFrame):
             show_move_buttons=self.move_callback is not None,
             move_callback=self.move_callback
         )
+
+    def add_task_item(self, task):
+        """Add a task item widget to the list"""
+        task_item = self._make_task_item(task)
         task_item.pack(fill="x", pady=2)
         self.task_items.append(task_item)
 
@@ -95,9 +99,9 @@ class PlanningBlock(tk.LabelFrame):
 
     def remove_task(self, task):
         """Remove a task by object reference (used by move_from_planning callback)"""
-        # Find the task_item whose task matches by text
+        # Find the task_item whose task matches by id
         for task_item in list(self.task_items):
-            if task_item.get_task().text == task.text:
+            if task_item.get_task().id == task.id:
                 self.delete_task_item(task_item)
                 return
 
@@ -125,12 +129,15 @@ class PlanningBlock(tk.LabelFrame):
         return self.block_data
 
     def reload(self, block_data):
-        """Replace block data and re-draw tasks (used after cloud sync)."""
-        for item in self.task_items[:]:
-            item.destroy()
-        self.task_items.clear()
+        """Replace block data and update the task rows to match (used after cloud sync).
+
+        Rows are matched to tasks by id, so only added or removed tasks cost
+        a widget; the rest are updated in place.
+        """
         self.block_data = block_data
-        self.populate_tasks()
+        self.task_items = reconcile_task_items(
+            self.scrollable_frame, self.task_items, block_data.tasks, self._make_task_item
+        )
 
     def clear_tasks(self):
         """Clear all tasks from the planning block"""
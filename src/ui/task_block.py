@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from .task_item import TaskItem
+from .task_item import TaskItem, reconcile_task_items
 from ..models.task import Task
 
 class TaskBlock(tk.LabelFrame):
@@ -56,9 +56,9 @@ class TaskBlock(tk.LabelFrame):
         for task in self.block_data.tasks:
             self.add_task_item(task)
 
-    def add_task_item(self, task):
-        """Add a task item widget to the list"""
-        task_item = TaskItem(
+    def _make_task_item(self, task):
+        """Build (but don't pack) the row widget for a task"""
+        return TaskItem(
             self.scrollable_frame,
             task,
             on_change_callback=self.on_task_changed,
@@ -66,6 +66,10 @@ class TaskBlock(tk.LabelFrame):
             on_enter_callback=self.on_enter_in_task,
             on_return_to_queue_callback=self._handle_return_to_queue if self._external_return_to_queue else None
         )
+
+    def add_task_item(self, task):
+        """Add a task item widget to the list"""
+        task_item = self._make_task_item(task)
         task_item.pack(fill="x", pady=2)
         self.task_items.append(task_item)
 
@@ -138,12 +142,15 @@ class TaskBlock(tk.LabelFrame):
             self.on_change_callback()
 
     def reload(self, block_data):
-        """Replace block data and re-draw tasks (used after cloud sync)."""
-        for item in self.task_items[:]:
-            item.destroy()
-        self.task_items.clear()
+        """Replace block data and update the task rows to match (used after cloud sync).
+
+        Rows are matched to tasks by id, so only added or removed tasks cost
+        a widget; the rest are updated in place.
+        """
         self.block_data = block_data
-        self.populate_tasks()
+        self.task_items = reconcile_task_items(
+            self.scrollable_frame, self.task_items, block_data.tasks, self._make_task_item
+        )
 
     def clear_tasks(self):
         """Clear all tasks from the block"""
@@ -65,7 +65,7 @@ class TaskItem(tk.Frame):
                 btn = tk.Button(
                     move_frame,
                     text=f"→{i+1}",
-                    command=lambda t=task, idx=i: move_callback(t, idx),
+                    command=lambda idx=i: move_callback(self.task, idx),
                     width=3,
                     font=("Arial", 7),
                     bg="#4A5A4A",
@@ -154,8 +154,60 @@ class TaskItem(tk.Frame):
             if hasattr(self, 'priority_btn'):
                 self.priority_btn.config(bg="#3A3A3A", text="!")
 
+    def set_task(self, task):
+        """Point this row at a (possibly different) task object and redraw it"""
+        self.task = task
+        if self.text_entry.get() != task.text:
+            self.text_entry.delete(0, tk.END)
+            self.text_entry.insert(0, task.text)
+        self.completed_var.set(1 if task.completed else 0)
+        self.update_appearance()
+
     def get_task(self):
         """Return the task object with current values"""
         self.task.text = self.text_entry.get().strip()
         self.task.completed = bool(self.completed_var.get())
         return self.task
+
+
+def reconcile_task_items(parent, task_items, tasks, make_item):
+    """Bring a list of TaskItem rows in line with tasks, reusing rows by task id.
+
+    Rows whose task is still present are updated in place, rows for new tasks
+    are built with make_item(task) (which must not pack them), rows whose task
+    is gone are destroyed, and rows are only repacked if the order changed.
+
+    Returns:
+        The TaskItem list in task order
+    """
+    by_id = {}
+    for item in task_items:
+        by_id.setdefault(item.task.id, item)
+
+    items = []
+    for task in tasks:
+        item = by_id.pop(task.id, None)
+        if item is None:
+            item = make_item(task)
+        else:
+            item.set_task(task)
+        items.append(item)
+
+    kept = set(map(id, items))
+    for item in task_items:
+        if id(item) not in kept:
+            item.destroy()
+
+    if parent.pack_slaves() != items:
+        prev = None
+        for item in items:
+            if prev is not None:
+                item.pack(fill="x", pady=2, after=prev)
+            else:
+                slaves = parent.pack_slaves()
+                if slaves and slaves[0] is not item:
+                    item.pack(fill="x", pady=2, before=slaves[0])
+                else:
+                    item.pack(fill="x", pady=2)
+            prev = item
+    return items
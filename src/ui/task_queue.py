@@ -1,120 +1,47 @@
 import tkinter as tk
 from tkinter import messagebox
 
-class TaskQueue(tk.Frame):
-    """Scrollable queue widget for incomplete tasks"""
-
-    def __init__(self, parent, queue_data, move_callback, move_to_planning_callback=None):
-        super().__init__(parent)
-        self.queue_data = queue_data
-        self.move_callback = move_callback
-        self.move_to_planning_callback = move_to_planning_callback
-
-        self.create_widgets()
-        self.populate_queue()
-
-    def create_widgets(self):
-        """Create the scrollable queue UI"""
-        # Create canvas and scrollbar
-        canvas_frame = tk.Frame(self, bg="#7B1A1A")
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-
-        self.canvas = tk.Canvas(canvas_frame, height=200, bg="#7B1A1A")
-        scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
-
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#7B1A1A")
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+ROW_BG = "#3A3A3A"
+PRIORITY_BG = "#5C2020"
+ROW_SPACING = 4  # 2px gap above and below each row
 
-        self._canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Keep scrollable frame width in sync with canvas width
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-    def _on_canvas_configure(self, event):
-        """Update scrollable frame width to match canvas"""
-        self.canvas.itemconfig(self._canvas_window, width=event.width)
-
-    def populate_queue(self):
-        """Display all queued tasks"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        if not self.queue_data:
-            empty_label = tk.Label(
-                self.scrollable_frame,
-                text="Queue is empty",
-                font=("Arial", 10, "italic"),
-                fg="#AAAAAA",
-                bg="#7B1A1A"
-            )
-            empty_label.pack(pady=20)
-            return
+class QueueRow(tk.Frame):
+    """One queue row (text, badges, move buttons) that can be re-pointed at any task"""
 
-        for task in sorted(self.queue_data, key=lambda t: t.text.lower()):
-            self.add_queue_item(task)
-
-    def add_queue_item(self, task):
-        """Add a single queue item with move buttons"""
-        item_frame = tk.Frame(self.scrollable_frame, bg="#3A3A3A", relief="ridge", borderwidth=1)
-        item_frame.pack(fill="x", padx=5, pady=2)
+    def __init__(self, queue):
+        super().__init__(queue.canvas, bg=ROW_BG, relief="ridge", borderwidth=1)
+        self.task = None
+        self._shown = None
 
         # Task text — fixed width (2x the block entry width of 24)
-        task_label = tk.Label(
-            item_frame,
-            text=task.text,
+        self.task_label = tk.Label(
+            self,
             font=("Arial", 9),
             anchor="w",
-            bg="#3A3A3A",
+            bg=ROW_BG,
             fg="white",
             width=48
         )
-        task_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.task_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
 
         # High-priority badge
-        col = 1
-        if task.is_high_priority:
-            badge_text = f"[!+{task.blocks_escalated}]" if task.blocks_escalated else "[!]"
-            prio_badge = tk.Label(
-                item_frame,
-                text=badge_text,
-                font=("Arial", 8, "bold"),
-                fg="#FF4500",
-                bg="#3A3A3A"
-            )
-            prio_badge.grid(row=0, column=col, padx=2)
-            col += 1
-            item_frame.config(bg="#5C2020")
-            task_label.config(bg="#5C2020")
+        self.prio_badge = tk.Label(self, font=("Arial", 8, "bold"), fg="#FF4500", bg=ROW_BG)
+        self.prio_badge.grid(row=0, column=1, padx=2)
 
         # Times queued indicator
-        if task.times_queued > 0:
-            queue_count = tk.Label(
-                item_frame,
-                text=f"({task.times_queued}×)",
-                font=("Arial", 8, "italic"),
-                fg="#AAAAAA",
-                bg=item_frame.cget("bg")
-            )
-            queue_count.grid(row=0, column=col, padx=2)
-        col += 1
+        self.queue_count = tk.Label(self, font=("Arial", 8, "italic"), fg="#AAAAAA", bg=ROW_BG)
+        self.queue_count.grid(row=0, column=2, padx=2)
 
         # Move to block buttons (fixed position)
-        buttons_frame = tk.Frame(item_frame, bg=item_frame.cget("bg"))
-        buttons_frame.grid(row=0, column=col, padx=5, sticky="e")
+        self.buttons_frame = tk.Frame(self, bg=ROW_BG)
+        self.buttons_frame.grid(row=0, column=3, padx=5, sticky="e")
 
-        # Move to Planning button
+        # Buttons act on whichever task the row shows at click time
         plan_btn = tk.Button(
-            buttons_frame,
+            self.buttons_frame,
             text="→P",
-            command=lambda t=task: self.move_to_planning(t),
+            command=lambda: queue.move_to_planning(self.task),
             width=3,
             font=("Arial", 8, "bold"),
             bg="#5C4A00",
@@ -124,32 +51,166 @@ class TaskQueue(tk.Frame):
 
         for i in range(8):
             btn = tk.Button(
-                buttons_frame,
+                self.buttons_frame,
                 text=f"→{i+1}",
-                command=lambda t=task, idx=i: self.move_to_block(t, idx),
+                command=lambda idx=i: queue.move_to_block(self.task, idx),
                 width=3,
                 font=("Arial", 8),
                 bg="#1A3A5C"
             )
             btn.pack(side="left", padx=1)
-        col += 1
 
         # Delete button
         delete_btn = tk.Button(
-            item_frame,
+            self,
             text="×",
-            command=lambda t=task: self.delete_from_queue(t),
+            command=lambda: queue.delete_from_queue(self.task),
             width=2,
             fg="#FF6B6B",
-            bg="#3A3A3A"
+            bg=ROW_BG
         )
-        delete_btn.grid(row=0, column=col, padx=5)
+        delete_btn.grid(row=0, column=4, padx=5)
 
         # Label column expands, buttons stay fixed
-        item_frame.grid_columnconfigure(0, weight=1)
-        item_frame.grid_columnconfigure(1, weight=0)
-        item_frame.grid_columnconfigure(2, weight=0)
-        item_frame.grid_columnconfigure(3, weight=0)
+        self.grid_columnconfigure(0, weight=1)
+
+    def show(self, task):
+        """Point the row at a task, reconfiguring only if what it displays changed"""
+        shown = (task.text, task.is_high_priority, task.blocks_escalated, task.times_queued)
+        if task is self.task and shown == self._shown:
+            return
+        self.task = task
+        self._shown = shown
+
+        bg = PRIORITY_BG if task.is_high_priority else ROW_BG
+        self.config(bg=bg)
+        self.task_label.config(text=task.text, bg=bg)
+        self.buttons_frame.config(bg=bg)
+
+        if task.is_high_priority:
+            badge_text = f"[!+{task.blocks_escalated}]" if task.blocks_escalated else "[!]"
+            self.prio_badge.config(text=badge_text, bg=bg)
+            self.prio_badge.grid()
+        else:
+            self.prio_badge.grid_remove()
+
+        if task.times_queued > 0:
+            self.queue_count.config(text=f"({task.times_queued}×)", bg=bg)
+            self.queue_count.grid()
+        else:
+            self.queue_count.grid_remove()
+
+
+class TaskQueue(tk.Frame):
+    """Scrollable queue widget for incomplete tasks.
+
+    Virtualized: rows are fixed-height canvas windows, and only enough
+    QueueRow widgets for the visible part of the canvas exist. Scrolling
+    re-points those rows at other tasks instead of creating widgets, so a
+    refresh costs a sort plus one update per visible row, however long the
+    queue is.
+    """
+
+    def __init__(self, parent, queue_data, move_callback, move_to_planning_callback=None):
+        super().__init__(parent)
+        self.queue_data = queue_data
+        self.move_callback = move_callback
+        self.move_to_planning_callback = move_to_planning_callback
+
+        self._sorted = []      # queue_data in display order
+        self._rows = []        # pool of (QueueRow, canvas item id)
+        self._row_height = 0   # measured from the first row built
+
+        self.create_widgets()
+        self.populate_queue()
+
+    def create_widgets(self):
+        """Create the scrollable queue UI"""
+        # Create canvas and scrollbar
+        canvas_frame = tk.Frame(self, bg="#7B1A1A")
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas = tk.Canvas(canvas_frame, height=200, bg="#7B1A1A")
+        self.scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+
+        # Every view change (scrollbar, resize, new scrollregion) re-lays out the rows
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        self.empty_label = tk.Label(
+            self.canvas,
+            text="Queue is empty",
+            font=("Arial", 10, "italic"),
+            fg="#AAAAAA",
+            bg="#7B1A1A"
+        )
+        self._empty_item = self.canvas.create_window(0, 20, window=self.empty_label, anchor="n", state="hidden")
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+    def _on_canvas_configure(self, event):
+        """Keep rows as wide as the canvas and fill any newly exposed space"""
+        self.canvas.coords(self._empty_item, event.width // 2, 20)
+        self._layout()
+
+    def _on_yview(self, first, last):
+        """Canvas view moved: update the scrollbar, then re-point visible rows"""
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _new_row(self):
+        """Add a row widget to the pool"""
+        row = QueueRow(self)
+        item = self.canvas.create_window(5, 0, window=row, anchor="nw", state="hidden")
+        self._rows.append((row, item))
+        if not self._row_height:
+            row.update_idletasks()
+            self._row_height = row.winfo_reqheight() + ROW_SPACING
+            # Arrow clicks on the scrollbar move one row
+            self.canvas.configure(yscrollincrement=self._row_height)
+
+    def populate_queue(self):
+        """Display all queued tasks"""
+        self._sorted = sorted(self.queue_data, key=lambda t: t.text.lower())
+
+        if not self._sorted:
+            self.canvas.itemconfigure(self._empty_item, state="normal")
+            self.canvas.configure(scrollregion=(0, 0, 0, 0))
+            self._layout()
+            return
+        self.canvas.itemconfigure(self._empty_item, state="hidden")
+
+        if not self._rows:
+            self._new_row()
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self._sorted) * self._row_height))
+        self._layout()
+
+    def _layout(self):
+        """Show the rows that intersect the visible part of the canvas"""
+        count = len(self._sorted)
+        first = last = 0
+        if count and self._row_height:
+            top = int(self.canvas.canvasy(0))
+            height = max(self.canvas.winfo_height(), 1)
+            first = min(max(top // self._row_height, 0), count)
+            last = min((top + height) // self._row_height + 1, count)
+            while len(self._rows) < last - first:
+                self._new_row()
+
+        # Row i always lands in pool slot i % pool size, so scrolling by a
+        # row only re-points the one row that scrolled into view
+        pool = len(self._rows)
+        visible = {i % pool: i for i in range(first, last)} if pool else {}
+        width = max(self.canvas.winfo_width() - 10, 1)
+        for slot, (row, item) in enumerate(self._rows):
+            i = visible.get(slot)
+            if i is None:
+                self.canvas.itemconfigure(item, state="hidden")
+                continue
+            row.show(self._sorted[i])
+            self.canvas.coords(item, 5, i * self._row_height + ROW_SPACING // 2)
+            self.canvas.itemconfigure(item, width=width, state="normal")
 
     def move_to_planning(self, task):
         """Move task from queue to planning block"""
@@ -1,7 +1,6 @@
 """Timer bar UI widget with countdown display and controls."""
 import tkinter as tk
 from tkinter import ttk
-from src.models.timer_state import SCHEDULE
 
 
 class TimerBar(tk.Frame):
@@ -280,9 +279,9 @@ class TimerBar(tk.Frame):
 
     def _update_progress_bar(self, timer_state):
         """Update progress bar based on elapsed time."""
-        phase_index = timer_state.phase_index
-        if phase_index < len(SCHEDULE):
-            total_duration = SCHEDULE[phase_index]["duration"]
+        phase = self.timer_manager.schedule.get(timer_state.phase_index)
+        if phase is not None:
+            total_duration = phase.duration
             elapsed = total_duration - timer_state.time_remaining_seconds
             progress_percent = (elapsed / total_duration) * 100
             self.progress["value"] = progress_percent
@@ -0,0 +1,331 @@
+"""Headless, in-memory view of one dataset: tasks, recurring templates and bills."""
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .bill_manager import BillManager
+from .models.block import Block
+from .models.bill import Bill
+from .models.recurring_task import RecurringTask
+from .models.task import Task
+from .task_index import TaskIndex
+
+# Task fields a client may change directly; the rest are managed by the app
+EDITABLE_TASK_FIELDS = ("text", "completed", "is_high_priority")
+
+# Held by whichever long-running editor (window or control API) has the dataset open
+WORKSPACE_LOCK_FILE = "workspace.lock"
+
+
+def roll_over_day(data_manager, planning: Block, blocks: List[Block], queue: List[Task],
+                  recurring: List[RecurringTask], day_date: str) -> Tuple[int, int]:
+    """Start New Day on plain data: log and clear every block, queue what's unfinished,
+    then apply recurring templates for day_date.
+
+    Completed tasks are logged, incomplete recurring tasks are dropped, other
+    incomplete tasks move to the queue. The block lists are cleared in place.
+
+    Returns:
+        (completed_count, total_count) over non-empty tasks
+    """
+    total_tasks = 0
+    completed_tasks = 0
+    completed_entries = []
+    incomplete_entries = []
+
+    for block in [planning] + blocks:
+        for task in block.tasks:
+            if task.text.strip():  # Only count non-empty tasks
+                total_tasks += 1
+                if task.completed:
+                    completed_tasks += 1
+                    completed_entries.append((task, block.name))
+                elif task.is_recurring:
+                    # Recurring incomplete tasks are silently discarded
+                    pass
+                else:
+                    incomplete_entries.append((task, block.name))
+                    queue.append(task)
+        block.tasks.clear()
+
+    # Log completed/incomplete tasks and stats — one write per log file
+    data_manager.log_day_rollover(
+        completed_entries,
+        incomplete_entries,
+        (completed_tasks, total_tasks) if total_tasks > 0 else None
+    )
+
+    if recurring:
+        data_manager.apply_recurring_tasks(blocks, recurring, day_date=day_date)
+
+    return completed_tasks, total_tasks
+
+
+class Workspace:
+    """Loads a dataset once and applies edits to the in-memory stores.
+
+    The headless counterpart of MainWindow's data handling, for the control
+    API and the command line. Every edit bumps `version` and reports the
+    stores it touched ('tasks', 'recurring', 'bills') to on_change; writing
+    tasks and recurring templates is left to the caller (save()), while
+    BillManager keeps saving bills itself.
+
+    Invalid requests (unknown ids or locations, bad field values) raise
+    ValueError with a message meant for the client.
+    """
+
+    def __init__(self, data_manager, include_bills: bool = True,
+                 on_change: Optional[Callable[[Tuple[str, ...]], None]] = None):
+        """
+        Initialize workspace.
+
+        Args:
+            data_manager: DataManager for the dataset
+            include_bills: Load bills (the work dataset has none)
+            on_change: Called with the tuple of changed store names after each edit
+        """
+        self.data_manager = data_manager
+        self.on_change = on_change
+        self.version = 0
+
+        self._load_tasks()
+        self.recurring: List[RecurringTask] = self.data_manager.load_recurring()
+        self.bill_manager = BillManager(self.data_manager) if include_bills else None
+
+    def _load_tasks(self):
+        data = self.data_manager.load_tasks()
+        self.planning: Block = data['planning']
+        self.blocks: List[Block] = data['blocks']
+        self.queue: List[Task] = data['queue']
+        self.current_day_date: str = data.get('current_day_date', '')
+        self.index = TaskIndex.for_data(self.planning, self.blocks, self.queue)
+
+    def _changed(self, *stores: str):
+        self.version += 1
+        if self.on_change:
+            self.on_change(stores)
+
+    def _store_files(self) -> Dict[str, Path]:
+        files = {
+            "tasks": self.data_manager.tasks_file,
+            "recurring": self.data_manager.recurring_file,
+        }
+        if self.bill_manager is not None:
+            files["bills"] = self.data_manager.bills_file
+        return files
+
+    def changed_on_disk(self) -> List[str]:
+        """Stores whose file another program (the window, a sync) rewrote since
+        this workspace last loaded or saved it."""
+        return [store for store, path in self._store_files().items()
+                if self.data_manager.changed_on_disk(path)]
+
+    def reload(self, stores):
+        """Re-read the named stores from disk, dropping any unsaved edits to them."""
+        if "tasks" in stores:
+            self._load_tasks()
+        if "recurring" in stores:
+            self.recurring = self.data_manager.load_recurring()
+        if "bills" in stores and self.bill_manager is not None:
+            self.bill_manager.load()
+        self._changed(*stores)
+
+    def save(self, stores=("tasks", "recurring", "bills")) -> List[str]:
+        """Write the named stores (unchanged files are skipped by DataManager).
+
+        A store whose file was rewritten by another program since it was
+        loaded isn't written over; it's reloaded instead, and the edits made
+        here since then are lost.
+
+        Returns:
+            The stores that were reloaded because of such a conflict
+        """
+        conflicts = [s for s in self.changed_on_disk() if s in stores]
+        if conflicts:
+            print(f"[Workspace] {', '.join(conflicts)} changed on disk, reloading instead of saving")
+            self.reload(conflicts)
+            stores = [s for s in stores if s not in conflicts]
+        if "tasks" in stores:
+            self.data_manager.save_tasks(self.planning, self.blocks, self.queue, self.current_day_date)
+        if "recurring" in stores:
+            self.data_manager.save_recurring(self.recurring)
+        if "bills" in stores and self.bill_manager is not None:
+            self.bill_manager.save()
+        return conflicts
+
+    # ── Tasks ───────────────────────────────────────────────────────────
+
+    def task_lists(self) -> Dict[str, List[Task]]:
+        """{location: tasks} for planning, block:0..block:7 and the queue."""
+        return self.index.provider()
+
+    def tasks_dict(self) -> Dict:
+        """Tasks in tasks.json shape."""
+        return {
+            'planning': self.planning.to_dict(),
+            'blocks': [b.to_dict() for b in self.blocks],
+            'queue': [t.to_dict() for t in self.queue],
+            'current_day_date': self.current_day_date,
+        }
+
+    def _tasks_at(self, location: str) -> List[Task]:
+        tasks = self.task_lists().get(location)
+        if tasks is None:
+            raise ValueError(f"unknown location {location!r} (use planning, block:0-{len(self.blocks) - 1} or queue)")
+        return tasks
+
+    @staticmethod
+    def _task_text(text) -> str:
+        """Validated task text; blank tasks can't be created in the window either."""
+        if not isinstance(text, str):
+            raise ValueError("text must be a string")
+        if not text.strip():
+            raise ValueError("text must not be blank")
+        return text.strip()
+
+    def get_task(self, task_id: str) -> Task:
+        task = self.index.get(task_id)
+        if task is None:
+            raise ValueError(f"no task with id {task_id!r}")
+        return task
+
+    def add_task(self, location: str, text: str, is_high_priority: bool = False) -> Task:
+        """Append a new task to a location."""
+        self._tasks_at(location)
+        task = Task(text=self._task_text(text), is_high_priority=bool(is_high_priority))
+        self.index.append(location, task)
+        self._changed("tasks")
+        return task
+
+    def update_task(self, task_id: str, **fields) -> Task:
+        """Change a task's text, completed flag or priority."""
+        unknown = set(fields) - set(EDITABLE_TASK_FIELDS)
+        if unknown:
+            raise ValueError(f"can't edit {', '.join(sorted(unknown))} (editable: {', '.join(EDITABLE_TASK_FIELDS)})")
+        task = self.get_task(task_id)
+        if "text" in fields:
+            task.text = self._task_text(fields["text"])
+        if "is_high_priority" in fields:
+            task.is_high_priority = bool(fields["is_high_priority"])
+        if "completed" in fields:
+            if fields["completed"] and not task.completed:
+                task.complete()
+            elif not fields["completed"]:
+                task.completed = False
+        self._changed("tasks")
+        return task
+
+    def move_task(self, task_id: str, location: str) -> Task:
+        """Move a task to the end of another location."""
+        self._tasks_at(location)
+        task = self.get_task(task_id)
+        self.index.move(task, location)
+        self._changed("tasks")
+        return task
+
+    def delete_task(self, task_id: str) -> Task:
+        task = self.get_task(task_id)
+        self.index.remove(task)
+        self._changed("tasks")
+        return task
+
+    def start_new_day(self, today: Optional[date] = None) -> Tuple[int, int]:
+        """Roll the day over (see roll_over_day) and reset bills for a new month.
+
+        The timer isn't touched; callers that own one reset it.
+
+        Returns:
+            (completed_count, total_count)
+        """
+        self.current_day_date = (today or date.today()).isoformat()
+        counts = roll_over_day(self.data_manager, self.planning, self.blocks, self.queue,
+                               self.recurring, self.current_day_date)
+        self.index.rebuild()
+        if self.bill_manager is not None:
+            self.bill_manager.reset_month_if_needed()
+        self._changed("tasks", "recurring", "bills")
+        return counts
+
+    # ── Recurring templates ─────────────────────────────────────────────
+
+    def set_recurring(self, templates: List[Dict]) -> List[RecurringTask]:
+        """Replace every recurring template (same as saving the recurring dialog)."""
+        try:
+            recurring = [RecurringTask.from_dict(t) for t in templates]
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"invalid recurring template: {e}")
+        self.recurring = recurring
+        self._changed("recurring")
+        return self.recurring
+
+    def add_recurring(self, template: Dict) -> RecurringTask:
+        try:
+            rt = RecurringTask.from_dict(template)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"invalid recurring template: {e}")
+        self.recurring.append(rt)
+        self._changed("recurring")
+        return rt
+
+    def remove_recurring(self, text: str) -> int:
+        """Remove templates by text. Returns how many were removed."""
+        before = len(self.recurring)
+        self.recurring = [rt for rt in self.recurring if rt.text != text]
+        removed = before - len(self.recurring)
+        if removed:
+            self._changed("recurring")
+        return removed
+
+    # ── Bills ───────────────────────────────────────────────────────────
+
+    def _bills(self) -> BillManager:
+        if self.bill_manager is None:
+            raise ValueError("this dataset has no bills")
+        return self.bill_manager
+
+    def bills_due(self, today: Optional[date] = None) -> List[Dict]:
+        """Bills the bill panel would show, most urgent first, with their status."""
+        manager = self._bills()
+        snap = manager.snapshot(today)
+        result = []
+        for bill in snap.visible:
+            status = snap.statuses[bill.id]
+            entry = bill.to_dict()
+            entry.update(
+                due_date=status.due_date.isoformat(),
+                overdue=status.overdue,
+                due_soon=status.due_soon,
+                status=status.status_text,
+                amount_text=manager.format_amount(bill),
+            )
+            result.append(entry)
+        return result
+
+    def set_bill_paid(self, bill_id: str, paid: bool = True) -> Bill:
+        manager = self._bills()
+        bill = manager.get_bill_by_id(bill_id)
+        if bill is None:
+            raise ValueError(f"no bill with id {bill_id!r}")
+        if paid:
+            manager.mark_paid(bill_id)
+        else:
+            manager.mark_unpaid(bill_id)
+        self._changed("bills")
+        return bill
+
+    def add_bill(self, fields: Dict) -> Bill:
+        manager = self._bills()
+        try:
+            bill = Bill.from_dict(dict(fields, id=fields.get("id", "")))
+        except TypeError as e:
+            raise ValueError(f"invalid bill: {e}")
+        manager.add_bill(bill)
+        self._changed("bills")
+        return bill
+
+    def remove_bill(self, bill_id: str):
+        manager = self._bills()
+        if manager.get_bill_by_id(bill_id) is None:
+            raise ValueError(f"no bill with id {bill_id!r}")
+        manager.remove_bill(bill_id)
+        self._changed("bills")
@@ -0,0 +1,108 @@
+"""Regression checks for incremental history-log sync (CloudflareSync.sync_log).
+
+Run with: python -m unittest discover tests
+"""
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.append_log import AppendLog
+from src.integrations.cloudflare_sync import CloudflareSync
+
+LOG = "completed_log.jsonl"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeWorker:
+    """Just enough of the sync Worker: /manifest and the /log routes; other files are absent."""
+
+    def __init__(self):
+        self.logs = {}
+
+    def get(self, url, params=None, timeout=None):
+        path = url.split("/", 3)[3]
+        if path == "manifest":
+            files = {name: {"size": len(data)} for name, data in self.logs.items()}
+            return FakeResponse(body=json.dumps({"features": ["log"], "files": files}).encode())
+        if path.startswith("log/"):
+            data = self.logs.get(path[4:], b"")
+            offset = params["offset"] if params["offset"] <= len(data) else 0
+            return FakeResponse(body=data[offset:], headers={"X-Log-Size": str(len(data)),
+                                                             "X-Log-Offset": str(offset)})
+        return FakeResponse(404)
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        path = url.split("/", 3)[3]
+        if not path.startswith("log/"):
+            return FakeResponse(200)
+        if (headers or {}).get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        payload = json.loads(data)
+        name = path[4:]
+        current = self.logs.get(name, b"")
+        if payload["expected_size"] != len(current):
+            return FakeResponse(409)
+        self.logs[name] = current + payload["lines"].encode("utf-8")
+        return FakeResponse(body=json.dumps({"size": len(self.logs[name])}).encode())
+
+    def records(self, name):
+        return [json.loads(line) for line in self.logs.get(name, b"").decode().splitlines()]
+
+
+class FakeSync(CloudflareSync):
+    session = None  # a plain attribute here, set to a FakeWorker per test
+
+
+class LogSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.worker = FakeWorker()
+        self.sync = FakeSync("https://worker.example", self.data_dir)
+        self.sync.session = self.worker
+        self.sync.sync_files = [LOG]
+        self.log = AppendLog(self.data_dir / LOG)
+
+    def test_record_appended_offline_survives_startup_download(self):
+        self.log.append({"task": "first"})
+        self.assertTrue(self.sync.sync())
+
+        self.log.append({"task": "offline"})
+        self.sync.download_all()  # startup: download only, nothing pushed
+        self.assertEqual(self.worker.records(LOG), [{"task": "first"}])
+
+        self.assertTrue(self.sync.sync())
+        self.assertEqual(self.worker.records(LOG), [{"task": "first"}, {"task": "offline"}])
+
+    def test_download_does_not_push_back_pulled_records(self):
+        self.log.append({"task": "first"})
+        self.assertTrue(self.sync.sync())
+
+        self.log.append({"task": "offline"})
+        self.worker.post("https://worker.example/log/" + LOG, json.dumps({
+            "expected_size": len(self.worker.logs[LOG]),
+            "lines": json.dumps({"task": "other machine"}) + "\n",
+        }).encode())
+        self.sync.download_all()
+        self.assertTrue(self.sync.sync())
+
+        self.assertEqual(
+            sorted(r["task"] for r in self.worker.records(LOG)),
+            ["first", "offline", "other machine"]
+        )
+        self.assertEqual(len(list(self.log)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()